@@ -0,0 +1,29 @@
+"""Add task result blob reference
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Large results live in the result blob store; the row keeps a reference
+    op.add_column("tasks", sa.Column("result_ref", sa.String(71), nullable=True))
+    op.add_column("tasks", sa.Column("result_size", sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("tasks", "result_size")
+    op.drop_column("tasks", "result_ref")
@@ -0,0 +1,65 @@
+"""Add task indexes matching the repository's access patterns
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the table writable while the indexes build, and
+    # cannot run inside the migration's transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_user_created",
+            "tasks",
+            ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_tasks_user_status_created",
+            "tasks",
+            ["user_id", "status", sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_tasks_active_user",
+            "tasks",
+            ["user_id", "created_at"],
+            postgresql_where=sa.text("status IN ('PENDING', 'RUNNING')"),
+            postgresql_concurrently=True,
+        )
+        # Its lookups are served by the leading column of ix_tasks_user_created
+        op.drop_index(
+            "ix_tasks_user_id", table_name="tasks", postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_user_id", "tasks", ["user_id"], postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_tasks_active_user", table_name="tasks", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_tasks_user_status_created",
+            table_name="tasks",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_tasks_user_created", table_name="tasks", postgresql_concurrently=True
+        )
@@ -0,0 +1,267 @@
+"""Admission control middleware."""
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+from urllib.parse import parse_qs
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.infrastructure.metrics import metrics
+
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Lanes sharing the process-wide limit, highest priority first: a freed slot
+# goes to the first of them with a waiter and room under its own limit
+SHARED_LANES = ("read", "write", "auth", "export")
+
+# Exports hold a database connection for the whole stream, so they count
+# against the shared limit, which is sized to the connection pool, in a small
+# lane of their own that keeps them from taking every slot
+EXPORT_LANE = "export"
+_EXPORT_PATHS = ("/api/v1/tasks/export",)
+
+# Long-lived requests that mostly sit idle without a database connection get
+# a lane of their own outside the shared limit instead of pinning its slots:
+# event streams, file uploads and long-polls (``wait`` on a task read)
+STREAM_LANE = "stream"
+_STREAM_PATHS = ("/api/v1/tasks/events",)
+_UPLOAD_PATHS = ("/api/v1/tasks/imports",)
+
+# Weight of the latest request in a lane's moving average service time
+_SERVICE_TIME_WEIGHT = 0.2
+
+
+class Overloaded(Exception):
+    """Request shed because it would wait in the queue past the deadline."""
+
+    def __init__(self, retry_after: float) -> None:
+        """Initialize exception with the expected wait in seconds."""
+        super().__init__(f"Expected queue wait of {retry_after:.3f}s")
+        self.retry_after = retry_after
+
+
+class _Lane:
+    """Concurrency limit, waiters and timings of one route class."""
+
+    def __init__(self, name: str, limit: int, shared: bool) -> None:
+        """Initialize lane."""
+        self.name = name
+        self.limit = limit
+        self.shared = shared
+        self.in_flight = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.service_time = 0.0
+        self.queue_seconds = metrics.histogram(
+            f"admission_{name}_queue_seconds",
+            f"Time {name} requests wait for admission",
+        )
+        self.shed_total = metrics.counter(
+            f"admission_{name}_shed_total",
+            f"{name.capitalize()} requests rejected with 503 under overload",
+        )
+        self._in_flight_gauge = metrics.gauge(
+            f"admission_{name}_in_flight", f"{name.capitalize()} requests running"
+        )
+        self._queued_gauge = metrics.gauge(
+            f"admission_{name}_queued", f"{name.capitalize()} requests queued"
+        )
+
+    def expected_wait(self) -> float:
+        """Estimate how long a request joining the queue now would wait."""
+        return (len(self.waiters) + 1) * self.service_time / self.limit
+
+    def observe_service_time(self, seconds: float) -> None:
+        """Fold a finished request into the moving average service time."""
+        if self.service_time == 0.0:
+            self.service_time = seconds
+        else:
+            self.service_time += _SERVICE_TIME_WEIGHT * (seconds - self.service_time)
+
+    def update_gauges(self) -> None:
+        """Publish current in-flight and queued counts."""
+        self._in_flight_gauge.set(self.in_flight)
+        self._queued_gauge.set(len(self.waiters))
+
+
+class AdmissionController:
+    """Bounded concurrency per lane with deadline-based load shedding.
+
+    A request runs at once when its lane and, for shared lanes, the process
+    are under their limits, and otherwise queues FIFO in its lane. It is
+    shed without queueing when the lane's queue length times its average
+    service time says it would wait longer than ``queue_deadline``, and
+    shed after waiting that long regardless.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        lane_limits: Optional[Dict[str, int]] = None,
+        queue_deadline: float = 1.0,
+    ) -> None:
+        """Initialize admission controller."""
+        lane_limits = lane_limits or {}
+        self.max_concurrency = max_concurrency
+        self.queue_deadline = queue_deadline
+        self.in_flight = 0
+        self.lanes = {
+            name: _Lane(name, lane_limits.get(name, max_concurrency), shared=True)
+            for name in SHARED_LANES
+        }
+        self.lanes[STREAM_LANE] = _Lane(
+            STREAM_LANE, lane_limits.get(STREAM_LANE, max_concurrency), shared=False
+        )
+
+    async def acquire(self, lane: _Lane) -> float:
+        """Wait for a slot in a lane and return the time spent queued.
+
+        Raises ``Overloaded`` when the request is shed.
+        """
+        if not lane.waiters and self._has_room(lane):
+            self._start(lane)
+            lane.queue_seconds.observe(0.0)
+            return 0.0
+
+        expected = lane.expected_wait()
+        if expected > self.queue_deadline:
+            lane.shed_total.inc()
+            raise Overloaded(expected)
+
+        waiter = asyncio.get_running_loop().create_future()
+        lane.waiters.append(waiter)
+        lane.update_gauges()
+        queued_at = time.perf_counter()
+        try:
+            done, _ = await asyncio.wait((waiter,), timeout=self.queue_deadline)
+        except asyncio.CancelledError:
+            self._withdraw(lane, waiter)
+            raise
+
+        queued = time.perf_counter() - queued_at
+        lane.queue_seconds.observe(queued)
+        if not done:
+            self._withdraw(lane, waiter)
+            lane.shed_total.inc()
+            raise Overloaded(max(lane.expected_wait(), queued))
+        return queued
+
+    def release(self, lane: _Lane, service_time: Optional[float] = None) -> None:
+        """Free a slot and hand it to the highest-priority waiter."""
+        lane.in_flight -= 1
+        if lane.shared:
+            self.in_flight -= 1
+        if service_time is not None:
+            lane.observe_service_time(service_time)
+        lane.update_gauges()
+
+        for candidate in self.lanes.values():
+            while candidate.waiters and self._has_room(candidate):
+                self._start(candidate)
+                candidate.waiters.popleft().set_result(None)
+            candidate.update_gauges()
+
+    def _has_room(self, lane: _Lane) -> bool:
+        """Check whether a lane may start another request."""
+        if lane.in_flight >= lane.limit:
+            return False
+        return not lane.shared or self.in_flight < self.max_concurrency
+
+    def _start(self, lane: _Lane) -> None:
+        """Count a request as running in a lane."""
+        lane.in_flight += 1
+        if lane.shared:
+            self.in_flight += 1
+        lane.update_gauges()
+
+    def _withdraw(self, lane: _Lane, waiter: asyncio.Future) -> None:
+        """Take a waiter out of the queue, giving back a slot granted meanwhile."""
+        if waiter.done():
+            self.release(lane)
+        else:
+            waiter.cancel()
+            lane.waiters.remove(waiter)
+            lane.update_gauges()
+
+
+class AdmissionMiddleware:
+    """Admission control middleware.
+
+    Caps how many requests run at once so that overload queues here, where
+    waits are bounded and shed with a fast 503, instead of in the database
+    connection pool. Requests are classed into lanes like the rate limiter
+    classes them (``auth``, ``read``, ``write``) plus ``export`` for exports,
+    which hold a connection throughout, and ``stream`` for event streams,
+    imports and long-polls; reads are served first when the shared limit
+    frees up, and health checks bypass admission entirely.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_concurrency: int = 30,
+        lane_limits: Optional[Dict[str, int]] = None,
+        queue_deadline: float = 1.0,
+        enabled: bool = True,
+    ) -> None:
+        """Initialize admission control."""
+        self.app = app
+        self.enabled = enabled
+        self.controller = AdmissionController(
+            max_concurrency, lane_limits, queue_deadline
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request under admission control."""
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path.startswith("/api/v1/health"):
+            await self.app(scope, receive, send)
+            return
+
+        lane_name = self._lane(scope["method"], path, scope["query_string"])
+        lane = self.controller.lanes[lane_name]
+        try:
+            await self.controller.acquire(lane)
+        except Overloaded as e:
+            response = JSONResponse(
+                {"detail": "Server is overloaded. Please try again later."},
+                status_code=503,
+                headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))},
+            )
+            await response(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            # Long-lived requests say nothing about how fast slots free up
+            elapsed = time.perf_counter() - started_at
+            self.controller.release(lane, elapsed if lane.shared else None)
+
+    @staticmethod
+    def _lane(method: str, path: str, query_string: bytes = b"") -> str:
+        """Classify a request into its admission lane."""
+        if path.startswith(_EXPORT_PATHS):
+            return EXPORT_LANE
+        if path.startswith(_STREAM_PATHS):
+            return STREAM_LANE
+        if method == "POST" and path.startswith(_UPLOAD_PATHS):
+            return STREAM_LANE
+        if method == "GET" and b"wait=" in query_string:
+            wait = parse_qs(query_string.decode("latin-1")).get("wait", ["0"])[-1]
+            try:
+                if float(wait) > 0:
+                    return STREAM_LANE
+            except ValueError:
+                pass
+        if path.startswith("/api/v1/auth"):
+            return "auth"
+        return "read" if method in _SAFE_METHODS else "write"
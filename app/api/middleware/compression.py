@@ -0,0 +1,349 @@
+"""Compression middleware."""
+
+import zlib
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Protocol, Tuple, Type
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli as _brotli
+
+    brotli: Optional[ModuleType] = _brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard as _zstandard
+
+    zstandard: Optional[ModuleType] = _zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Levels favour throughput: API payloads are compressed on every request
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+ZSTD_LEVEL = 3
+
+# Response types worth compressing, besides text/* and *json
+COMPRESSIBLE_TYPES = frozenset({"application/xml", "application/javascript"})
+
+_READ_SIZE = 64 * 1024
+
+
+class _BodyTooLarge(Exception):
+    """Decompressed request body exceeds the size limit."""
+
+
+class _Encoder(Protocol):
+    """Streaming compressor with the zlib ``compress``/``flush`` interface."""
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk."""
+
+    def flush(self) -> bytes:
+        """Finish the stream."""
+
+
+class _BrotliEncoder:
+    """Brotli compressor exposing the zlib ``compress``/``flush`` interface."""
+
+    def __init__(self, brotli: ModuleType) -> None:
+        """Initialize encoder."""
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk."""
+        compressed: bytes = self._compressor.process(data)
+        return compressed
+
+    def flush(self) -> bytes:
+        """Finish the stream."""
+        compressed: bytes = self._compressor.finish()
+        return compressed
+
+
+def _decode_zlib(data: bytes, limit: int, wbits: int) -> bytes:
+    """Inflate gzip or deflate data, reading at most ``limit`` bytes."""
+    decompressor = zlib.decompressobj(wbits)
+    body = decompressor.decompress(data, limit + 1)
+    if len(body) > limit:
+        raise _BodyTooLarge()
+    if not decompressor.eof:
+        raise zlib.error("truncated stream")
+    return body
+
+
+def _decode_brotli(brotli: ModuleType, data: bytes, limit: int) -> bytes:
+    """Decompress brotli data, reading at most ``limit`` bytes."""
+    decompressor = brotli.Decompressor()
+    body: bytes = decompressor.process(data, output_buffer_limit=limit + 1)
+    if len(body) > limit:
+        raise _BodyTooLarge()
+    if not decompressor.is_finished():
+        raise brotli.error("truncated stream")
+    return body
+
+
+def _decode_zstd(zstandard: ModuleType, data: bytes, limit: int) -> bytes:
+    """Decompress zstd data, reading at most ``limit`` bytes."""
+    body = bytearray()
+    with zstandard.ZstdDecompressor().stream_reader(data) as reader:
+        while chunk := reader.read(_READ_SIZE):
+            body += chunk
+            if len(body) > limit:
+                raise _BodyTooLarge()
+    return bytes(body)
+
+
+# Supported encodings, in order of preference when the client has none
+ENCODERS: Dict[str, Callable[[], _Encoder]] = {}
+DECODERS: Dict[str, Callable[[bytes, int], bytes]] = {
+    "gzip": lambda data, limit: _decode_zlib(data, limit, 16 + zlib.MAX_WBITS),
+    "deflate": lambda data, limit: _decode_zlib(data, limit, zlib.MAX_WBITS),
+}
+_DECODE_ERRORS: Tuple[Type[BaseException], ...] = (zlib.error,)
+if zstandard is not None:
+    _zstd = zstandard
+    ENCODERS["zstd"] = lambda: _zstd.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+    DECODERS["zstd"] = lambda data, limit: _decode_zstd(_zstd, data, limit)
+    _DECODE_ERRORS += (zstandard.ZstdError,)
+if brotli is not None:
+    _br = brotli
+    ENCODERS["br"] = lambda: _BrotliEncoder(_br)
+    DECODERS["br"] = lambda data, limit: _decode_brotli(_br, data, limit)
+    _DECODE_ERRORS += (brotli.error,)
+ENCODERS["gzip"] = lambda: zlib.compressobj(
+    GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+)
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the supported encoding with the highest q-value, or None."""
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, *params = (item.strip() for item in part.split(";"))
+        weight = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        if name:
+            weights[name.lower()] = weight
+
+    wildcard = weights.get("*", 0.0)
+    best, best_weight = None, 0.0
+    for encoding in ENCODERS:
+        weight = weights.get(encoding, wildcard)
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def _is_compressible(headers: Headers) -> bool:
+    """Check whether a response may be compressed."""
+    # Byte ranges address the identity encoding, so ranged bodies stay as-is
+    if "content-encoding" in headers or "accept-ranges" in headers:
+        return False
+    content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type == "text/event-stream":
+        return False
+    return (
+        content_type.startswith("text/")
+        or content_type.endswith("json")
+        or content_type in COMPRESSIBLE_TYPES
+    )
+
+
+class CompressionMiddleware:
+    """Negotiated response compression and compressed request bodies.
+
+    Responses are compressed with the best of zstd, brotli and gzip that the
+    client accepts (zstd and brotli only when installed). Complete bodies
+    below ``minimum_size`` are sent as-is; streamed bodies are compressed
+    chunk by chunk as they are produced. Server-sent events are never
+    compressed so that each event reaches the client immediately.
+
+    Request bodies with a ``Content-Encoding`` are decompressed before the
+    app sees them, up to ``max_request_size`` bytes after decompression.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        max_request_size: int = 10 * 1024 * 1024,
+    ) -> None:
+        """Initialize compression middleware."""
+        self.app = app
+        self.minimum_size = minimum_size
+        self.max_request_size = max_request_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Decompress the request and compress the response."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if "content-encoding" in headers:
+            decoded = await self._decode_request(scope, receive, send, headers)
+            if decoded is None:
+                return
+            scope, receive = decoded
+
+        encoding = select_encoding(headers.get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await self.app(scope, receive, _CompressingSender(send, encoding, self))
+
+    async def _decode_request(
+        self, scope: Scope, receive: Receive, send: Send, headers: Headers
+    ) -> Optional[Tuple[Scope, Receive]]:
+        """Read and decompress the request body, or send the error response."""
+        encoding = headers["content-encoding"].strip().lower()
+        decoder = DECODERS.get(encoding)
+        if decoder is None:
+            response = JSONResponse(
+                {"detail": f"Unsupported Content-Encoding: {encoding}"},
+                status_code=415,
+            )
+            await response(scope, receive, send)
+            return None
+
+        chunks: List[bytes] = []
+        received = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return None
+            chunk = message.get("body", b"")
+            received += len(chunk)
+            if received > self.max_request_size:
+                await self._reject_too_large(scope, receive, send)
+                return None
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+
+        try:
+            body = decoder(b"".join(chunks), self.max_request_size)
+        except _BodyTooLarge:
+            await self._reject_too_large(scope, receive, send)
+            return None
+        except _DECODE_ERRORS:
+            response = JSONResponse(
+                {"detail": "Malformed compressed request body"}, status_code=400
+            )
+            await response(scope, receive, send)
+            return None
+
+        request_headers = MutableHeaders(raw=list(scope["headers"]))
+        del request_headers["content-encoding"]
+        request_headers["content-length"] = str(len(body))
+        decoded_scope = {**scope, "headers": request_headers.raw}
+
+        sent = False
+
+        async def receive_decoded() -> Message:
+            nonlocal sent
+            if sent:
+                return await receive()
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        return decoded_scope, receive_decoded
+
+    async def _reject_too_large(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Send 413 for a request body over the limit."""
+        response = JSONResponse(
+            {"detail": f"Request body exceeds {self.max_request_size} bytes"},
+            status_code=413,
+        )
+        await response(scope, receive, send)
+
+
+class _CompressingSender:
+    """ASGI ``send`` wrapper compressing one response."""
+
+    def __init__(
+        self, send: Send, encoding: str, middleware: CompressionMiddleware
+    ) -> None:
+        """Initialize sender."""
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = middleware.minimum_size
+        self.start_message: Optional[Message] = None
+        self.encoder: Optional[_Encoder] = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        """Handle one response message."""
+        if self.passthrough:
+            await self.send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            if message["status"] in (204, 206, 304) or not _is_compressible(headers):
+                self.passthrough = True
+                await self.send(message)
+            return
+
+        if message["type"] != "http.response.body" or self.start_message is None:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.encoder is None:
+            if not more_body and len(body) < self.minimum_size:
+                # Complete and small: not worth the CPU or the framing
+                self.passthrough = True
+                MutableHeaders(raw=self.start_message["headers"]).add_vary_header(
+                    "Accept-Encoding"
+                )
+                await self.send(self.start_message)
+                await self.send(message)
+                return
+
+            self.encoder = ENCODERS[self.encoding]()
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            # The encoded bytes differ, so only a weak validator still holds
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+
+            if not more_body:
+                compressed = self.encoder.compress(body) + self.encoder.flush()
+                headers["Content-Length"] = str(len(compressed))
+                await self.send(self.start_message)
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+
+            del headers["Content-Length"]
+            await self.send(self.start_message)
+
+        compressed = self.encoder.compress(body)
+        if not more_body:
+            compressed += self.encoder.flush()
+        if compressed or not more_body:
+            await self.send(
+                {
+                    "type": "http.response.body",
+                    "body": compressed,
+                    "more_body": more_body,
+                }
+            )
@@ -1,46 +1,63 @@
 """Logging middleware."""
 
 import time
-from typing import Callable
 import structlog
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = structlog.get_logger()
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Request logging middleware."""
+class LoggingMiddleware:
+    """Request logging middleware.
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Log request and response."""
-        start_time = time.time()
+    Implemented as plain ASGI so responses, including streaming ones, pass
+    through untouched instead of being re-wrapped per request.
+    """
 
-        # Log request
-        logger.info(
-            "request_started",
-            method=request.method,
-            path=request.url.path,
-            client_ip=request.client.host if request.client else None,
-        )
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize logging middleware."""
+        self.app = app
 
-        # Process request
-        response = await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Log request and response."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Calculate duration
-        duration = time.time() - start_time
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
 
-        # Log response
+        # Log request
         logger.info(
-            "request_completed",
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
-            duration_ms=round(duration * 1000, 2),
+            "request_started",
+            method=method,
+            path=path,
+            client_ip=client[0] if client else None,
         )
 
-        return response
-
-
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            # Process request
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # Calculate duration
+            duration = time.perf_counter() - start_time
+
+            # Log response
+            logger.info(
+                "request_completed",
+                method=method,
+                path=path,
+                status_code=status_code,
+                duration_ms=round(duration * 1000, 2),
+            )
@@ -1,56 +1,141 @@
 """Rate limiting middleware."""
 
-import time
-from typing import Callable
+import hashlib
+from typing import Dict, Optional, Tuple
 
-from fastapi import Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from jose.exceptions import JWTError
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.infrastructure.cache.cache_service import CacheService
+from app.infrastructure.cache.rate_limit import (
+    HybridRateLimiter,
+    RateLimiter,
+    RateLimitResult,
+)
+from app.infrastructure.security.jwt_handler import JWTHandler
 
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limiting middleware."""
+
+class RateLimitMiddleware:
+    """Rate limiting middleware.
+
+    Each request is charged to one bucket per (route class, client). The
+    client is the JWT subject for authenticated requests, else the
+    ``X-API-Key`` header, else the peer address. Keys are not validated
+    here, only bucketed; authentication still happens in the routes.
+
+    In ``hybrid`` mode quota is leased from Redis in blocks and most
+    requests are decided in-process; see ``HybridRateLimiter``.
+    """
 
     def __init__(
         self,
-        app: Callable,
-        requests_per_minute: int = 100,
+        app: ASGIApp,
+        requests: int = 100,
+        window: int = 60,
+        user_requests: Optional[int] = None,
+        api_key_requests: Optional[int] = None,
+        route_limits: Optional[Dict[str, int]] = None,
+        mode: str = "redis",
+        lease_fraction: float = 0.1,
         enabled: bool = True,
     ) -> None:
         """Initialize rate limiter."""
-        super().__init__(app)
-        self.requests_per_minute = requests_per_minute
+        self.app = app
+        self.window = window
+        self.identity_limits = {
+            "ip": requests,
+            "user": user_requests or requests,
+            "api_key": api_key_requests or requests,
+        }
+        self.route_limits = route_limits or {}
         self.enabled = enabled
-        self.cache_service = CacheService()
+        self.limiter = (
+            HybridRateLimiter(lease_fraction=lease_fraction)
+            if mode == "hybrid"
+            else RateLimiter()
+        )
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with rate limiting."""
-        if not self.enabled:
-            return await call_next(request)
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Skip rate limiting for health checks
-        if request.url.path.startswith("/api/v1/health"):
-            return await call_next(request)
-
-        # Get client identifier
-        client_id = request.client.host if request.client else "unknown"
-
-        # Check rate limit
-        key = f"rate_limit:{client_id}"
-        current = await self.cache_service.get(key)
-
-        if current is None:
-            await self.cache_service.set(key, 1, expire=60)
-        elif int(current) >= self.requests_per_minute:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Rate limit exceeded. Please try again later.",
+        path = scope["path"]
+        if path.startswith("/api/v1/health"):
+            await self.app(scope, receive, send)
+            return
+
+        route_class = self._route_class(scope["method"], path)
+        identity_kind, identity = self._identify(scope)
+        limit = self.identity_limits[identity_kind]
+        if route_class in self.route_limits:
+            limit = min(limit, self.route_limits[route_class])
+
+        result = await self.limiter.hit(
+            f"{route_class}:{identity_kind}:{identity}", limit, self.window
+        )
+        if result is None:
+            # Fail open when the limiter store is unavailable
+            await self.app(scope, receive, send)
+            return
+
+        headers = self._headers(result)
+        if not result.allowed:
+            headers["Retry-After"] = str(result.retry_after_seconds)
+            response = JSONResponse(
+                {"detail": "Rate limit exceeded. Please try again later."},
+                status_code=429,
+                headers=headers,
             )
-        else:
-            await self.cache_service.increment(key)
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    def _headers(self, result: RateLimitResult) -> Dict[str, str]:
+        """Build RateLimit-* response headers."""
+        return {
+            "RateLimit-Limit": str(result.limit),
+            "RateLimit-Remaining": str(result.remaining),
+            "RateLimit-Reset": str(result.reset_seconds),
+            "RateLimit-Policy": f"{result.limit};w={self.window}",
+        }
+
+    @staticmethod
+    def _route_class(method: str, path: str) -> str:
+        """Classify a request as auth, read or write."""
+        if path.startswith("/api/v1/auth"):
+            return "auth"
+        return "read" if method in _SAFE_METHODS else "write"
+
+    @staticmethod
+    def _identify(scope: Scope) -> Tuple[str, str]:
+        """Return the (kind, id) of the client a request is charged to."""
+        headers = Headers(scope=scope)
 
-        return await call_next(request)
+        authorization = headers.get("authorization", "")
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() == "bearer" and token:
+            try:
+                user_id = JWTHandler.decode_token(token).get("sub")
+            except (JWTError, TypeError, ValueError):
+                user_id = None
+            if user_id:
+                return "user", str(user_id)
 
+        api_key = headers.get("x-api-key")
+        if api_key:
+            return "api_key", hashlib.sha256(api_key.encode()).hexdigest()[:32]
 
+        client = scope.get("client")
+        return "ip", client[0] if client else "unknown"
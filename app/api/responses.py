@@ -0,0 +1,122 @@
+"""Response helpers."""
+
+import hashlib
+from typing import Any, AsyncIterator, Callable, Dict, Mapping, Optional, Tuple, Union
+
+from fastapi import Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+
+def model_response(
+    model: Union[BaseModel, Dict[str, Any]],
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> ORJSONResponse:
+    """Render a response DTO, or a projection of one, with orjson.
+
+    Routes keep ``response_model`` for the OpenAPI schema, but returning a
+    response object stops FastAPI from validating and encoding the DTO a
+    second time.
+    """
+    content = model.model_dump() if isinstance(model, BaseModel) else model
+    return ORJSONResponse(
+        content,
+        status_code=status_code,
+        headers=dict(headers) if headers is not None else None,
+    )
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong ETag from the values that identify a representation."""
+    digest = hashlib.sha256("|".join(map(str, parts)).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def content_etag(body: bytes) -> str:
+    """Build a strong ETag from a rendered response body."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag, ignoring weak prefixes."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """Build a 304 response for a matching conditional request."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def parse_byte_range(
+    range_header: Optional[str], size: int
+) -> Optional[Tuple[int, int]]:
+    """Parse a single ``bytes=`` range into inclusive offsets.
+
+    Returns None when the whole body should be sent: no header, or one this
+    server ignores (another unit, several ranges or bad syntax). Raises
+    ValueError when the range lies beyond the end of the body.
+    """
+    if not range_header:
+        return None
+    unit, _, spec = range_header.partition("=")
+    first, dash, last = spec.strip().partition("-")
+    if unit.strip().lower() != "bytes" or "," in spec or not dash:
+        return None
+    if not (first.isdigit() or first == "") or not (last.isdigit() or last == ""):
+        return None
+
+    if first == "":
+        # Suffix range: the last N bytes
+        if last == "" or int(last) == 0:
+            raise ValueError("Empty suffix range")
+        return max(size - int(last), 0), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError("Range starts beyond the end")
+    return start, end
+
+
+def range_response(
+    read: Callable[[int, int], AsyncIterator[bytes]],
+    size: int,
+    range_header: Optional[str],
+    headers: Dict[str, str],
+    media_type: str,
+) -> Response:
+    """Stream a body of ``size`` bytes, or the part of it a Range asks for.
+
+    ``read(start, end)`` yields the bytes between the inclusive offsets.
+    """
+    headers = {**headers, "Accept-Ranges": "bytes"}
+    try:
+        byte_range = parse_byte_range(range_header, size)
+    except ValueError:
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={**headers, "Content-Range": f"bytes */{size}"},
+        )
+
+    status_code = status.HTTP_200_OK
+    start, end = 0, size - 1
+    if byte_range is not None:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        read(start, end),
+        status_code=status_code,
+        headers=headers,
+        media_type=media_type,
+    )
@@ -3,6 +3,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 
+from app.api.responses import model_response
 from app.application.dto.user_dto import (
     UserCreateDTO,
     UserLoginDTO,
@@ -10,11 +11,13 @@ from app.application.dto.user_dto import (
     TokenResponseDTO,
 )
 from app.application.services.auth_service import AuthService
-from app.dependencies import get_auth_service
-from app.domain.entities.user import User
+from app.application.services.user_service import UserService
+from app.dependencies import get_auth_service, get_user_service
+from app.domain.entities.user import Principal
 from app.domain.exceptions.domain_exceptions import (
     InvalidCredentialsError,
     UserAlreadyExistsError,
+    UserNotFoundError,
 )
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -24,8 +27,8 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     auth_service: AuthService = Depends(get_auth_service),
-) -> User:
-    """Get current authenticated user."""
+) -> Principal:
+    """Get current authenticated principal."""
     try:
         return await auth_service.get_current_user(token)
     except InvalidCredentialsError as e:
@@ -44,7 +47,9 @@ async def signup(
     """Sign up a new user."""
     try:
         user = await auth_service.signup(user_data)
-        return UserResponseDTO.model_validate(user)
+        return model_response(
+            UserResponseDTO.from_entity(user), status_code=status.HTTP_201_CREATED
+        )
     except UserAlreadyExistsError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -70,8 +75,17 @@ async def login(
 
 
 @router.get("/me", response_model=UserResponseDTO)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(
+    current_user: Principal = Depends(get_current_user),
+    user_service: UserService = Depends(get_user_service),
+):
     """Get current user information."""
-    return UserResponseDTO.model_validate(current_user)
+    try:
+        return model_response(await user_service.get_user_by_id(current_user.id))
+    except UserNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
 
 
@@ -1,8 +1,13 @@
 """Health check routes."""
 
-from fastapi import APIRouter, status
+from typing import Any, Dict
+
+from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
 
+from app.config import settings
+from app.infrastructure.metrics import metrics
+
 router = APIRouter(prefix="/health", tags=["Health"])
 
 
@@ -26,3 +31,9 @@ async def readiness_check():
     return {"status": "ready"}
 
 
+@router.get("/metrics")
+async def metrics_snapshot() -> Dict[str, Dict[str, Any]]:
+    """In-process metrics for this API process, when enabled in settings."""
+    if not settings.metrics_endpoint_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    return metrics.snapshot()
@@ -0,0 +1,89 @@
+"""Task event streaming routes."""
+
+import asyncio
+from typing import AsyncIterator
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, WebSocket, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.routes.auth import get_current_user
+from app.application.services.auth_service import AuthService
+from app.config import settings
+from app.dependencies import get_auth_service
+from app.domain.entities.user import Principal
+from app.domain.exceptions.domain_exceptions import (
+    InvalidCredentialsError,
+    UserNotFoundError,
+)
+from app.infrastructure.database.base import get_db
+from app.infrastructure.events.task_events import task_event_broker
+
+router = APIRouter(prefix="/tasks", tags=["Tasks"])
+
+
+@router.get("/events")
+async def stream_task_events(
+    current_user: Principal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """Stream the current user's task status changes as server-sent events."""
+    # Release the pooled connection used for authentication before parking
+    await session.close()
+    return StreamingResponse(
+        _event_stream(current_user.id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/events/ws")
+async def task_events_websocket(
+    websocket: WebSocket,
+    token: str = Query(...),
+    auth_service: AuthService = Depends(get_auth_service),
+    session: AsyncSession = Depends(get_db),
+) -> None:
+    """Stream the current user's task status changes over a WebSocket.
+
+    Browsers cannot set headers on WebSocket requests, so the access token
+    is passed as the ``token`` query parameter.
+    """
+    try:
+        current_user = await auth_service.get_current_user(token)
+    except (InvalidCredentialsError, UserNotFoundError):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    finally:
+        await session.close()
+
+    await websocket.accept()
+    async with task_event_broker.subscribe(current_user.id) as queue:
+
+        async def forward_events() -> None:
+            while True:
+                event = await queue.get()
+                await websocket.send_text(event.model_dump_json())
+
+        sender = asyncio.create_task(forward_events())
+        try:
+            # Incoming messages are ignored; reading only detects disconnects
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+        finally:
+            sender.cancel()
+
+
+async def _event_stream(user_id: UUID) -> AsyncIterator[str]:
+    """Yield server-sent events for a user, with periodic heartbeats."""
+    async with task_event_broker.subscribe(user_id) as queue:
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), timeout=settings.task_events_heartbeat_interval
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: task_status\ndata: {event.model_dump_json()}\n\n"
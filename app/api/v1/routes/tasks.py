@@ -1,63 +1,479 @@
 """Task routes."""
 
-from typing import Optional
+import asyncio
+import csv
+import io
+import os
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterator, BinaryIO, Dict, FrozenSet, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import orjson
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
 
+from app.api.responses import (
+    content_etag,
+    etag_matches,
+    make_etag,
+    model_response,
+    not_modified,
+    range_response,
+)
 from app.application.dto.task_dto import (
     TaskCreateDTO,
     TaskUpdateDTO,
     TaskResponseDTO,
     TaskListResponseDTO,
+    TaskBatchCreateDTO,
+    TaskBatchResponseDTO,
+    TaskBulkResponseDTO,
+    TaskBulkSelectionDTO,
+    TaskLookupDTO,
+    TaskLookupResponseDTO,
+    TotalMode,
+    TaskFileFormat,
+    TaskImportJobDTO,
 )
 from app.application.services.task_service import TaskService
-from app.dependencies import get_task_service
+from app.config import settings
+from app.dependencies import get_result_blob_store, get_task_service
 from app.api.v1.routes.auth import get_current_user
-from app.domain.entities.user import User
+from app.domain.entities.user import Principal
 from app.domain.exceptions.domain_exceptions import (
     TaskNotFoundError,
     TaskCannotBeCancelledError,
     InsufficientPermissionsError,
+    TaskBatchTooLargeError,
+    TaskResultNotAvailableError,
+    InvalidCursorError,
+    InvalidFieldsError,
+    IdempotencyKeyConflictError,
+    IdempotencyKeyInProgressError,
+    TaskImportJobNotFoundError,
 )
 from app.domain.value_objects.task_status import TaskStatus
+from app.infrastructure.storage.result_store import ResultBlobStore
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
+FIELDS_DESCRIPTION = (
+    "Comma-separated task fields to return, e.g. name,status. "
+    "The id is always included."
+)
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[FrozenSet[str]]:
+    """Parse a sparse fieldset, rejecting unknown fields with 400."""
+    try:
+        return TaskResponseDTO.parse_fields(fields)
+    except InvalidFieldsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+def _fields_key(fields: Optional[FrozenSet[str]]) -> Optional[str]:
+    """Canonical form of a sparse fieldset, for ETags."""
+    return ",".join(sorted(fields)) if fields else None
+
+
+# Export rows are buffered into chunks of about this size before sending
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+def _csv_value(value: Any) -> Any:
+    """Render a task field as a CSV cell."""
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value).decode()
+    return value
+
+
+async def _ndjson_chunks(rows: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Encode rows as newline-delimited JSON, in chunks."""
+    buffer = bytearray()
+    async for row in rows:
+        buffer += orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE)
+        if len(buffer) >= EXPORT_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _csv_chunks(
+    rows: AsyncIterator[Dict[str, Any]], columns: List[str]
+) -> AsyncIterator[bytes]:
+    """Encode rows as CSV with a header line, in chunks."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    async for row in rows:
+        writer.writerow([_csv_value(row[column]) for column in columns])
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+# Uploads are copied to the import spool file in blocks of this size
+IMPORT_BLOCK_SIZE = 1024 * 1024
+
+
+def _spool_upload(source: BinaryIO, path: str) -> None:
+    """Copy an upload to its import job's spool file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        with open(path, "wb") as f:
+            size = 0
+            while block := source.read(IMPORT_BLOCK_SIZE):
+                size += len(block)
+                if size > settings.task_import_max_bytes:
+                    raise TaskBatchTooLargeError(
+                        f"Import file exceeds the limit of "
+                        f"{settings.task_import_max_bytes} bytes"
+                    )
+                f.write(block)
+    except BaseException:
+        os.unlink(path)
+        raise
+
 
 @router.post("", response_model=TaskResponseDTO, status_code=status.HTTP_201_CREATED)
 async def create_task(
     task_data: TaskCreateDTO,
-    current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None, min_length=1, max_length=255),
+    current_user: Principal = Depends(get_current_user),
     task_service: TaskService = Depends(get_task_service),
 ):
-    """Create a new task."""
-    return await task_service.create_task(current_user.id, task_data)
+    """Create a new task.
+
+    With an ``Idempotency-Key`` header, retries of the same request return
+    the first response (marked ``Idempotent-Replayed``) instead of creating
+    another task.
+    """
+    if idempotency_key is None:
+        task = await task_service.create_task(current_user.id, task_data)
+        return model_response(task, status_code=status.HTTP_201_CREATED)
+
+    try:
+        task, replayed = await task_service.create_task_idempotent(
+            current_user.id, task_data, idempotency_key
+        )
+    except IdempotencyKeyConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        )
+    except IdempotencyKeyInProgressError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
+    return model_response(
+        task,
+        status_code=status.HTTP_201_CREATED,
+        headers={"Idempotent-Replayed": "true"} if replayed else None,
+    )
+
+
+@router.post("/batch", response_model=TaskBatchResponseDTO)
+async def create_tasks(
+    batch_data: TaskBatchCreateDTO,
+    current_user: Principal = Depends(get_current_user),
+    task_service: TaskService = Depends(get_task_service),
+) -> Response:
+    """Create a batch of tasks with per-item results."""
+    try:
+        return model_response(
+            await task_service.create_tasks(current_user.id, batch_data.tasks)
+        )
+    except TaskBatchTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        )
+
+
+@router.post("/lookup", response_model=TaskLookupResponseDTO)
+async def lookup_tasks(
+    lookup_data: TaskLookupDTO,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    current_user: Principal = Depends(get_current_user),
+    task_service: TaskService = Depends(get_task_service),
+) -> Response:
+    """Get many tasks by ID with per-item results."""
+    selected_fields = _parse_fields(fields)
+    try:
+        return model_response(
+            await task_service.lookup_tasks(
+                current_user.id, lookup_data.ids, fields=selected_fields
+            )
+        )
+    except TaskBatchTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        )
+
+
+@router.post("/bulk/cancel", response_model=TaskBulkResponseDTO)
+async def cancel_tasks(
+    selection: TaskBulkSelectionDTO,
+    current_user: Principal = Depends(get_current_user),
+    task_service: TaskService = Depends(get_task_service),
+) -> Response:
+    """Cancel the selected unfinished tasks."""
+    try:
+        return model_response(
+            await task_service.cancel_tasks(current_user.id, selection)
+        )
+    except TaskBatchTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        )
+
+
+@router.post("/bulk/delete", response_model=TaskBulkResponseDTO)
+async def delete_tasks(
+    selection: TaskBulkSelectionDTO,
+    current_user: Principal = Depends(get_current_user),
+    task_service: TaskService = Depends(get_task_service),
+) -> Response:
+    """Delete the selected tasks."""
+    try:
+        return model_response(
+            await task_service.delete_tasks(current_user.id, selection)
+        )
+    except TaskBatchTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        )
+
+
+@router.post(
+    "/imports",
+    response_model=TaskImportJobDTO,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def import_tasks(
+    file: UploadFile = File(...),
+    import_format: Optional[TaskFileFormat] = Query(None, alias="format"),
+    current_user: Principal = Depends(get_current_user),
+    task_service: TaskService = Depends(get_task_service),
+) -> Response:
+    """Import tasks from an NDJSON or CSV file.
+
+    The format defaults to the file's extension. The file is imported by a
+    worker; poll the returned job for progress and rejected rows.
+    """
+    if import_format is None:
+        filename = (file.filename or "").lower()
+        import_format = (
+            TaskFileFormat.CSV if filename.endswith(".csv") else TaskFileFormat.NDJSON
+        )
+
+    job = TaskImportJobDTO(user_id=current_user.id, format=import_format)
+    try:
+        await asyncio.to_thread(
+            _spool_upload, file.file, task_service.import_spool_path(job.id)
+        )
+    except TaskBatchTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        )
+
+    job = await task_service.start_import(job)
+    return model_response(job, status_code=status.HTTP_202_ACCEPTED)
+
+
+@router.get("/imports/{job_id}", response_model=TaskImportJobDTO)
+async def get_import_job(
+    job_id: str,
+    current_user: Principal = Depends(get_current_user),
+    task_service: TaskService = Depends(get_task_service),
+) -> Response:
+    """Get the progress of a task import job."""
+    try:
+        from uuid import UUID
+        return model_response(
+            await task_service.get_import_job(UUID(job_id), current_user.id)
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid job ID format",
+        )
+    except TaskImportJobNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
 
 
 @router.get("", response_model=TaskListResponseDTO)
 async def get_tasks(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    status: Optional[TaskStatus] = None,
-    current_user: User = Depends(get_current_user),
+    task_status: Optional[TaskStatus] = Query(None, alias="status"),
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    total_mode: TotalMode = TotalMode.EXACT,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user),
     task_service: TaskService = Depends(get_task_service),
 ):
-    """Get user's tasks with pagination."""
-    return await task_service.get_user_tasks(
-        current_user.id, page=page, page_size=page_size, status=status
+    """Get user's tasks with page or cursor pagination.
+
+    With the count cache, the ETag is built from the user's list version,
+    which every write bumps, so it is checked before the page is fetched.
+    Without it, the ETag is a hash of the rendered page.
+    """
+    if not include_total:
+        total_mode = TotalMode.NONE
+    selected_fields = _parse_fields(fields)
+    version = await task_service.get_user_tasks_version(current_user.id)
+    etag = None
+    if version is not None:
+        etag = make_etag(
+            current_user.id,
+            version,
+            page,
+            page_size,
+            task_status,
+            cursor,
+            total_mode,
+            _fields_key(selected_fields),
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    try:
+        tasks = await task_service.get_user_tasks(
+            current_user.id,
+            page=page,
+            page_size=page_size,
+            status=task_status,
+            cursor=cursor,
+            total_mode=total_mode,
+            fields=selected_fields,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    response = model_response(tasks)
+    if etag is None:
+        etag = content_etag(response.body)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+    response.headers["ETag"] = etag
+    return response
+
+
+@router.get("/export")
+async def export_tasks(
+    export_format: TaskFileFormat = Query(TaskFileFormat.NDJSON, alias="format"),
+    task_status: Optional[TaskStatus] = Query(None, alias="status"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    current_user: Principal = Depends(get_current_user),
+    task_service: TaskService = Depends(get_task_service),
+) -> Response:
+    """Stream the current user's whole task history as NDJSON or CSV.
+
+    Rows are read from a server-side cursor while the response is sent, so
+    the export runs in constant memory whatever the number of tasks.
+    """
+    selected_fields = _parse_fields(fields)
+    rows = task_service.export_user_tasks(
+        current_user.id, status=task_status, fields=selected_fields
+    )
+    if export_format == TaskFileFormat.CSV:
+        columns = [
+            field
+            for field in TaskResponseDTO.model_fields
+            if selected_fields is None or field in selected_fields
+        ]
+        body, media_type = _csv_chunks(rows, columns), "text/csv"
+    else:
+        body, media_type = _ndjson_chunks(rows), "application/x-ndjson"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="tasks.{export_format.value}"'
+        },
     )
 
 
 @router.get("/{task_id}", response_model=TaskResponseDTO)
 async def get_task(
     task_id: str,
-    current_user: User = Depends(get_current_user),
+    wait: float = Query(0, ge=0, le=settings.task_wait_max_seconds),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user),
     task_service: TaskService = Depends(get_task_service),
 ):
-    """Get task by ID."""
+    """Get task by ID, optionally waiting up to ``wait`` seconds for it to finish.
+
+    Without ``wait``, a matching ``If-None-Match`` is answered with 304 after
+    reading only the task's version. With it, 304 means the task did not
+    change while the request waited.
+    """
+    selected_fields = _parse_fields(fields)
     try:
         from uuid import UUID
-        return await task_service.get_task_by_id(UUID(task_id), current_user.id)
+        if wait:
+            task = await task_service.wait_for_task(
+                UUID(task_id), current_user.id, timeout=wait
+            )
+        else:
+            if if_none_match:
+                updated_at = await task_service.get_task_version(
+                    UUID(task_id), current_user.id
+                )
+                etag = make_etag(
+                    UUID(task_id), updated_at, _fields_key(selected_fields)
+                )
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag)
+            task = await task_service.get_task_by_id(
+                UUID(task_id), current_user.id, fields=selected_fields
+            )
+        etag = make_etag(task.id, task.updated_at, _fields_key(selected_fields))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        return model_response(
+            TaskResponseDTO.project(task, selected_fields) if selected_fields else task,
+            headers={"ETag": etag},
+        )
     except (TaskNotFoundError, InsufficientPermissionsError) as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND if isinstance(e, TaskNotFoundError) else status.HTTP_403_FORBIDDEN,
@@ -70,17 +486,85 @@ async def get_task(
         )
 
 
+@router.get("/{task_id}/result")
+async def get_task_result(
+    task_id: str,
+    range_header: Optional[str] = Header(None, alias="Range"),
+    if_range: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user),
+    task_service: TaskService = Depends(get_task_service),
+    result_store: ResultBlobStore = Depends(get_result_blob_store),
+) -> Response:
+    """Download a task's result document, with support for byte ranges.
+
+    Results offloaded to the blob store are streamed from it; their ETag is
+    the content hash.
+    """
+    try:
+        from uuid import UUID
+
+        task = await task_service.get_task_result(UUID(task_id), current_user.id)
+    except (TaskNotFoundError, TaskResultNotAvailableError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except InsufficientPermissionsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e),
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid task ID format",
+        )
+
+    result_ref, result_size = task.result_ref, task.result_size
+    if result_ref is not None:
+        if result_size is None or not await result_store.exists(result_ref):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Task result is missing from storage",
+            )
+        etag = f'"{result_ref}"'
+        size = result_size
+
+        def read(start: int, end: int) -> AsyncIterator[bytes]:
+            return result_store.iter_range(result_ref, start, end)
+
+    else:
+        content = orjson.dumps(task.result)
+        etag = make_etag(task.id, task.updated_at, "result")
+        size = len(content)
+
+        async def read(start: int, end: int) -> AsyncIterator[bytes]:
+            yield content[start : end + 1]
+
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    # A range is only honoured against the representation it was taken from
+    if if_range is not None and if_range != etag:
+        range_header = None
+    return range_response(
+        read, size, range_header, {"ETag": etag}, media_type="application/json"
+    )
+
+
 @router.put("/{task_id}", response_model=TaskResponseDTO)
 async def update_task(
     task_id: str,
     task_data: TaskUpdateDTO,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     task_service: TaskService = Depends(get_task_service),
 ):
     """Update task."""
     try:
         from uuid import UUID
-        return await task_service.update_task(UUID(task_id), task_data, current_user.id)
+        return model_response(
+            await task_service.update_task(UUID(task_id), task_data, current_user.id)
+        )
     except (TaskNotFoundError, TaskCannotBeCancelledError, InsufficientPermissionsError) as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND if isinstance(e, TaskNotFoundError) else status.HTTP_400_BAD_REQUEST,
@@ -96,13 +580,15 @@ async def update_task(
 @router.post("/{task_id}/cancel", response_model=TaskResponseDTO)
 async def cancel_task(
     task_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     task_service: TaskService = Depends(get_task_service),
 ):
     """Cancel a task."""
     try:
         from uuid import UUID
-        return await task_service.cancel_task(UUID(task_id), current_user.id)
+        return model_response(
+            await task_service.cancel_task(UUID(task_id), current_user.id)
+        )
     except (TaskNotFoundError, TaskCannotBeCancelledError, InsufficientPermissionsError) as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND if isinstance(e, TaskNotFoundError) else status.HTTP_400_BAD_REQUEST,
@@ -118,7 +604,7 @@ async def cancel_task(
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task(
     task_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     task_service: TaskService = Depends(get_task_service),
 ):
     """Delete task."""
@@ -1,11 +1,14 @@
 """Task DTOs."""
 
-from datetime import datetime
-from typing import Any, Dict, Optional
-from uuid import UUID
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Dict, FrozenSet, List, Optional, Union
+from uuid import UUID, uuid4
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator, model_validator
 
+from app.domain.entities.task import Task
+from app.domain.exceptions.domain_exceptions import InvalidFieldsError
 from app.domain.value_objects.task_status import TaskPriority, TaskStatus, TaskType
 
 
@@ -40,6 +43,8 @@ class TaskResponseDTO(BaseModel):
     user_id: UUID
     parameters: Dict[str, Any]
     result: Optional[Dict[str, Any]]
+    result_ref: Optional[str] = None
+    result_size: Optional[int] = None
     error_message: Optional[str]
     retry_count: int
     max_retries: int
@@ -53,14 +58,210 @@ class TaskResponseDTO(BaseModel):
 
         from_attributes = True
 
+    @classmethod
+    def from_entity(cls, task: Task) -> "TaskResponseDTO":
+        """Build from an already validated task entity without re-validating."""
+        return cls.model_construct(
+            **{field: getattr(task, field) for field in cls.model_fields}
+        )
+
+    @classmethod
+    def parse_fields(cls, fields: Optional[str]) -> Optional[FrozenSet[str]]:
+        """Parse a comma-separated sparse fieldset; ``id`` is always included."""
+        if not fields:
+            return None
+
+        selected = {field.strip() for field in fields.split(",") if field.strip()}
+        unknown = selected.difference(cls.model_fields)
+        if unknown:
+            raise InvalidFieldsError(
+                f"Unknown task fields: {', '.join(sorted(unknown))}. "
+                f"Valid fields: {', '.join(cls.model_fields)}"
+            )
+        return frozenset(selected | {"id"})
+
+    @classmethod
+    def project(
+        cls, task: Union[Task, "TaskResponseDTO"], fields: FrozenSet[str]
+    ) -> Dict[str, Any]:
+        """Build a response holding only ``fields``, in schema order.
+
+        ``task`` is an entity or an already-built response; both carry every
+        response field as an attribute.
+        """
+        return {
+            field: getattr(task, field) for field in cls.model_fields if field in fields
+        }
+
+
+class TaskEventDTO(BaseModel):
+    """DTO for a task status change event."""
+
+    task_id: UUID
+    user_id: UUID
+    status: TaskStatus
+    error_message: Optional[str] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    updated_at: datetime
+
+
+class TotalMode(str, Enum):
+    """How the total of a task listing is computed."""
+
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
+class TaskFileFormat(str, Enum):
+    """Serialization of a task export or import file."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
 
 class TaskListResponseDTO(BaseModel):
     """DTO for paginated task list response."""
 
-    items: list[TaskResponseDTO]
-    total: int
+    items: list[Union[TaskResponseDTO, Dict[str, Any]]]
+    total: Optional[int]
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int]
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
+
+
+class TaskBatchCreateDTO(BaseModel):
+    """DTO for submitting a batch of tasks.
+
+    Items are validated one by one against ``TaskCreateDTO`` so that a single
+    malformed entry is reported in its result instead of rejecting the batch.
+    """
+
+    tasks: List[Dict[str, Any]] = Field(..., min_length=1)
+
+
+class TaskBatchItemResultDTO(BaseModel):
+    """DTO for the outcome of one item in a task batch."""
+
+    index: int
+    task: Optional[TaskResponseDTO] = None
+    error: Optional[str] = None
+
+
+class TaskBatchResponseDTO(BaseModel):
+    """DTO for task batch submission response."""
+
+    items: list[TaskBatchItemResultDTO]
+    created: int
+    failed: int
+
+
+class TaskLookupDTO(BaseModel):
+    """DTO for looking up many tasks by ID.
 
+    IDs are kept as strings so that a malformed one is reported in its result
+    instead of rejecting the lookup.
+    """
 
+    ids: List[str] = Field(..., min_length=1)
+
+
+class TaskLookupError(str, Enum):
+    """Why a task could not be returned by a lookup."""
+
+    NOT_FOUND = "not_found"
+    INVALID_ID = "invalid_id"
+
+
+class TaskLookupItemResultDTO(BaseModel):
+    """DTO for the outcome of one ID in a task lookup."""
+
+    id: str
+    task: Optional[Union[TaskResponseDTO, Dict[str, Any]]] = None
+    error: Optional[TaskLookupError] = None
+
+
+class TaskLookupResponseDTO(BaseModel):
+    """DTO for task lookup response."""
+
+    items: list[TaskLookupItemResultDTO]
+    found: int
+    missing: int
+
+
+class TaskBulkSelectionDTO(BaseModel):
+    """DTO selecting a user's tasks for a bulk operation.
+
+    Tasks are selected by ``ids``, by filters, or both; all given criteria
+    must match. At least one is required so that an empty body cannot select
+    every task.
+    """
+
+    ids: Optional[List[UUID]] = None
+    status: Optional[TaskStatus] = None
+    task_type: Optional[TaskType] = None
+    created_before: Optional[datetime] = None
+
+    @field_validator("created_before")
+    @classmethod
+    def to_naive_utc(cls, v: Optional[datetime]) -> Optional[datetime]:
+        """Normalize to naive UTC, like the stored timestamps."""
+        if v is not None and v.tzinfo is not None:
+            return v.astimezone(timezone.utc).replace(tzinfo=None)
+        return v
+
+    @model_validator(mode="after")
+    def check_selected(self) -> "TaskBulkSelectionDTO":
+        """Require IDs or at least one filter."""
+        if self.ids is None and not (
+            self.status or self.task_type or self.created_before
+        ):
+            raise ValueError("Select tasks by ids or by at least one filter")
+        return self
+
+
+class TaskBulkResponseDTO(BaseModel):
+    """DTO for the outcome of a bulk cancel or delete."""
+
+    affected: int
+    by_status: Dict[TaskStatus, int]
+
+
+class TaskImportStatus(str, Enum):
+    """Status of a task import job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class TaskImportErrorDTO(BaseModel):
+    """DTO for a rejected row of an import file."""
+
+    line: int
+    error: str
+
+
+class TaskImportJobDTO(BaseModel):
+    """DTO for a task import job and its progress.
+
+    ``failed`` counts every rejected row, while ``errors`` keeps only the
+    first ``task_import_max_errors`` of them.
+    """
+
+    id: UUID = Field(default_factory=uuid4)
+    user_id: UUID
+    format: TaskFileFormat
+    status: TaskImportStatus = TaskImportStatus.PENDING
+    processed: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[TaskImportErrorDTO] = Field(default_factory=list)
+    error_message: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    completed_at: Optional[datetime] = None
@@ -6,6 +6,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, EmailStr
 
+from app.domain.entities.user import User
+
 
 class UserCreateDTO(BaseModel):
     """DTO for creating a user."""
@@ -40,6 +42,13 @@ class UserResponseDTO(BaseModel):
 
         from_attributes = True
 
+    @classmethod
+    def from_entity(cls, user: User) -> "UserResponseDTO":
+        """Build from an already validated user entity without re-validating."""
+        return cls.model_construct(
+            **{field: getattr(user, field) for field in cls.model_fields}
+        )
+
 
 class UserLoginDTO(BaseModel):
     """DTO for user login."""
@@ -1,9 +1,11 @@
 """Task repository interface."""
 
-from typing import List, Optional
+from datetime import datetime
+from typing import AbstractSet, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from app.domain.entities.task import Task
+from app.domain.value_objects.cursor import TaskCursor
 from app.domain.value_objects.task_status import TaskStatus, TaskPriority, TaskType
 
 
@@ -14,8 +16,34 @@ class ITaskRepository:
         """Create a new task."""
         raise NotImplementedError
 
-    async def get_by_id(self, task_id: UUID) -> Optional[Task]:
-        """Get task by ID."""
+    async def create_many(self, tasks: List[Task]) -> List[Task]:
+        """Create several tasks in a single transaction."""
+        raise NotImplementedError
+
+    async def copy_many(self, tasks: List[Task]) -> int:
+        """Bulk-load tasks and return how many were loaded."""
+        raise NotImplementedError
+
+    async def get_by_id(
+        self,
+        task_id: UUID,
+        fields: Optional[AbstractSet[str]] = None,
+        for_update: bool = False,
+    ) -> Optional[Task]:
+        """Get task by ID, loading only ``fields`` when given.
+
+        With ``for_update`` the row is read and locked in the caller's own
+        transaction, for a read-modify-write.
+        """
+        raise NotImplementedError
+
+    async def get_many(
+        self,
+        task_ids: Sequence[UUID],
+        user_id: Optional[UUID] = None,
+        fields: Optional[AbstractSet[str]] = None,
+    ) -> List[Task]:
+        """Get the tasks among ``task_ids``, of one user if given, in one query."""
         raise NotImplementedError
 
     async def get_by_user_id(
@@ -24,8 +52,24 @@ class ITaskRepository:
         skip: int = 0,
         limit: int = 100,
         status: Optional[TaskStatus] = None,
+        cursor: Optional[TaskCursor] = None,
+        fields: Optional[AbstractSet[str]] = None,
     ) -> List[Task]:
-        """Get tasks by user ID with pagination."""
+        """Get tasks by user ID with offset or keyset pagination.
+
+        With ``fields``, only those columns (plus the ones pagination and
+        permission checks need) are loaded; other entity fields are None.
+        """
+        raise NotImplementedError
+
+    def stream_by_user_id(
+        self,
+        user_id: UUID,
+        status: Optional[TaskStatus] = None,
+        fields: Optional[AbstractSet[str]] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Task]:
+        """Stream all of a user's tasks, oldest first, in constant memory."""
         raise NotImplementedError
 
     async def update(self, task: Task) -> Task:
@@ -36,10 +80,56 @@ class ITaskRepository:
         """Delete task."""
         raise NotImplementedError
 
+    async def cancel_many(
+        self,
+        user_id: UUID,
+        task_ids: Optional[Sequence[UUID]] = None,
+        status: Optional[TaskStatus] = None,
+        task_type: Optional[TaskType] = None,
+        created_before: Optional[datetime] = None,
+        limit: int = 1000,
+    ) -> List[Tuple[Task, TaskStatus]]:
+        """Cancel up to ``limit`` matching unfinished tasks of a user.
+
+        Returns the cancelled tasks with the status each had before.
+        """
+        raise NotImplementedError
+
+    async def delete_many(
+        self,
+        user_id: UUID,
+        task_ids: Optional[Sequence[UUID]] = None,
+        status: Optional[TaskStatus] = None,
+        task_type: Optional[TaskType] = None,
+        created_before: Optional[datetime] = None,
+        limit: int = 1000,
+    ) -> List[Tuple[UUID, TaskStatus]]:
+        """Delete up to ``limit`` matching tasks of a user.
+
+        Returns the ID and status of each deleted task.
+        """
+        raise NotImplementedError
+
     async def count_by_user_id(
         self, user_id: UUID, status: Optional[TaskStatus] = None
     ) -> int:
         """Count tasks by user ID."""
         raise NotImplementedError
 
+    async def count_by_status(self, user_id: UUID) -> Dict[TaskStatus, int]:
+        """Count tasks by user ID, grouped by status."""
+        raise NotImplementedError
 
+    async def estimate_count_by_user_id(
+        self, user_id: UUID, status: Optional[TaskStatus] = None
+    ) -> int:
+        """Estimate task count by user ID without scanning the rows."""
+        raise NotImplementedError
+
+    async def get_version(self, task_id: UUID) -> Optional[Tuple[UUID, datetime]]:
+        """Get a task's owner and last update time without loading the row."""
+        raise NotImplementedError
+
+    async def release_connection(self) -> None:
+        """Release the database connection held by the repository."""
+        raise NotImplementedError
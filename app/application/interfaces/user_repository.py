@@ -1,6 +1,6 @@
 """User repository interface."""
 
-from typing import Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
 from app.domain.entities.user import User
@@ -13,8 +13,14 @@ class IUserRepository:
         """Create a new user."""
         raise NotImplementedError
 
-    async def get_by_id(self, user_id: UUID) -> Optional[User]:
-        """Get user by ID."""
+    async def get_by_id(
+        self, user_id: UUID, for_update: bool = False
+    ) -> Optional[User]:
+        """Get user by ID, locking the row for a read-modify-write if asked."""
+        raise NotImplementedError
+
+    async def get_many(self, user_ids: Sequence[UUID]) -> List[User]:
+        """Get the users among ``user_ids`` in one query."""
         raise NotImplementedError
 
     async def get_by_email(self, email: str) -> Optional[User]:
@@ -1,13 +1,11 @@
 """Authentication service."""
 
-from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
-from jose import JWTError, jwt
+from jose import JWTError
 
-from app.config import settings
-from app.domain.entities.user import User
+from app.domain.entities.user import Principal, User
 from app.domain.exceptions.domain_exceptions import (
     InvalidCredentialsError,
     UserAlreadyExistsError,
@@ -19,6 +17,8 @@ from app.application.dto.user_dto import (
     TokenResponseDTO,
 )
 from app.application.interfaces.user_repository import IUserRepository
+from app.infrastructure.cache.principal_cache import PrincipalCache
+from app.infrastructure.security.jwt_handler import JWTHandler
 from app.infrastructure.security.password_handler import PasswordHandler
 
 
@@ -29,10 +29,12 @@ class AuthService:
         self,
         user_repository: IUserRepository,
         password_handler: PasswordHandler,
+        principal_cache: Optional[PrincipalCache] = None,
     ) -> None:
         """Initialize auth service."""
         self.user_repository = user_repository
         self.password_handler = password_handler
+        self.principal_cache = principal_cache
 
     async def signup(self, user_data: UserCreateDTO) -> User:
         """Sign up a new user."""
@@ -48,7 +50,9 @@ class AuthService:
             )
 
         # Hash password
-        hashed_password = self.password_handler.hash_password(user_data.password)
+        hashed_password = await self.password_handler.hash_password_async(
+            user_data.password
+        )
 
         # Create user
         user = User(
@@ -68,66 +72,63 @@ class AuthService:
             raise InvalidCredentialsError("Invalid email or password")
 
         # Verify password
-        if not self.password_handler.verify_password(
+        is_valid, new_hash = await self.password_handler.verify_and_update_async(
             login_data.password, user.hashed_password
-        ):
+        )
+        if not is_valid:
             raise InvalidCredentialsError("Invalid email or password")
 
         # Check if user is active
         if not user.is_active:
             raise InvalidCredentialsError("User account is inactive")
 
+        # Upgrade hashes made with an outdated cost factor
+        if new_hash:
+            user.hashed_password = new_hash
+            await self.user_repository.update(user)
+
         # Generate tokens
-        access_token = self._create_access_token(user.id, user.email)
-        refresh_token = self._create_refresh_token(user.id, user.email)
+        access_token = JWTHandler.create_access_token(user.id, user.email)
+        refresh_token = JWTHandler.create_refresh_token(user.id, user.email)
 
         return TokenResponseDTO(
             access_token=access_token,
             refresh_token=refresh_token,
         )
 
-    async def get_current_user(self, token: str) -> User:
-        """Get current user from token."""
+    async def get_current_user(self, token: str) -> Principal:
+        """Get the authenticated principal for a token."""
         try:
-            payload = jwt.decode(
-                token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
-            )
+            payload = JWTHandler.decode_token(token)
             user_id: UUID = UUID(payload.get("sub"))
             if user_id is None:
                 raise InvalidCredentialsError("Invalid token")
-        except (JWTError, ValueError) as e:
+        except (JWTError, TypeError, ValueError) as e:
             raise InvalidCredentialsError(f"Invalid token: {str(e)}")
 
-        user = await self.user_repository.get_by_id(user_id)
-        if user is None:
+        principal = await self._get_principal(user_id)
+        if principal is None:
             raise UserNotFoundError("User not found")
 
-        return user
-
-    def _create_access_token(self, user_id: UUID, email: str) -> str:
-        """Create access token."""
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.jwt_access_token_expire_minutes
-        )
-        payload = {
-            "sub": str(user_id),
-            "email": email,
-            "exp": expire,
-            "type": "access",
-        }
-        return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
-
-    def _create_refresh_token(self, user_id: UUID, email: str) -> str:
-        """Create refresh token."""
-        expire = datetime.utcnow() + timedelta(
-            days=settings.jwt_refresh_token_expire_days
-        )
-        payload = {
-            "sub": str(user_id),
-            "email": email,
-            "exp": expire,
-            "type": "refresh",
-        }
-        return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
-
+        if not principal.is_active:
+            raise InvalidCredentialsError("User account is inactive")
 
+        return principal
+
+    async def _get_principal(self, user_id: UUID) -> Optional[Principal]:
+        """Get the principal of an authenticated request, through the cache."""
+        if self.principal_cache is None:
+            user = await self.user_repository.get_by_id(user_id)
+            return Principal.from_user(user) if user else None
+
+        principal = await self.principal_cache.get(user_id)
+        if principal is None:
+            # Read before loading, so an invalidation racing the load wins
+            generation = await self.principal_cache.get_generation(user_id)
+            user = await self.user_repository.get_by_id(user_id)
+            if user is None:
+                return None
+            principal = Principal.from_user(user)
+            if generation is not None:
+                await self.principal_cache.set(principal, generation)
+        return principal
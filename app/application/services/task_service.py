@@ -1,58 +1,411 @@
 """Task service."""
 
-from typing import List, Optional
-from uuid import UUID
+import asyncio
+import csv
+import hashlib
+import itertools
+import os
+from collections import Counter
+from contextlib import suppress
+from datetime import datetime, timedelta
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from uuid import UUID, uuid5
+
+import orjson
+from pydantic import ValidationError
 
+from app.config import settings
 from app.domain.entities.task import Task
 from app.domain.exceptions.domain_exceptions import (
     TaskNotFoundError,
     TaskCannotBeCancelledError,
     InsufficientPermissionsError,
+    TaskBatchTooLargeError,
+    TaskResultNotAvailableError,
+    TaskImportJobNotFoundError,
 )
-from app.domain.value_objects.task_status import TaskStatus
+from app.domain.value_objects.cursor import TaskCursor
+from app.domain.value_objects.task_status import TERMINAL_TASK_STATUSES, TaskStatus
 from app.application.dto.task_dto import (
     TaskCreateDTO,
     TaskUpdateDTO,
     TaskResponseDTO,
     TaskListResponseDTO,
+    TaskBatchItemResultDTO,
+    TaskBatchResponseDTO,
+    TaskBulkResponseDTO,
+    TaskBulkSelectionDTO,
+    TaskFileFormat,
+    TaskImportErrorDTO,
+    TaskImportJobDTO,
+    TaskImportStatus,
+    TaskLookupError,
+    TaskLookupItemResultDTO,
+    TaskLookupResponseDTO,
+    TotalMode,
 )
 from app.application.interfaces.task_repository import ITaskRepository
+from app.infrastructure.cache.idempotency_store import (
+    IdempotencyState,
+    IdempotencyStore,
+)
+from app.infrastructure.cache.task_count_cache import TaskCountCache
+from app.infrastructure.cache.task_import_store import TaskImportJobStore
+from app.infrastructure.cache.task_status_store import TaskStatusStore
+from app.infrastructure.events.task_events import TaskEventBroker, TaskEventPublisher
 from app.infrastructure.queue.celery_app import celery_app
 
 
+# Fields needed to serve a task's result
+_RESULT_FIELDS = frozenset({"id", "result", "result_ref", "result_size"})
+
+# Worker task that runs import jobs
+IMPORT_WORKER_TASK = "app.workers.task_import.run_import"
+
+# A row of an import file: its line number and its fields, or why it could
+# not be parsed
+ImportRow = Tuple[int, Union[Dict[str, Any], str]]
+
+
+def _parse_ndjson_line(line: str) -> Union[Dict[str, Any], str]:
+    """Parse one NDJSON line into task fields."""
+    try:
+        row = orjson.loads(line)
+    except orjson.JSONDecodeError as e:
+        return f"invalid JSON: {e}"
+    if not isinstance(row, dict):
+        return "expected a JSON object"
+    return row
+
+
+def _parse_csv_row(row: Dict[str, Optional[str]]) -> Union[Dict[str, Any], str]:
+    """Parse one CSV record into task fields.
+
+    Empty cells are left out so that defaults apply, and ``parameters`` holds
+    a JSON object, as in exports.
+    """
+    fields: Dict[str, Any] = {
+        name: value for name, value in row.items() if name and value
+    }
+    if "parameters" in fields:
+        try:
+            fields["parameters"] = orjson.loads(fields["parameters"])
+        except orjson.JSONDecodeError as e:
+            return f"parameters: invalid JSON: {e}"
+    return fields
+
+
+def _read_import_rows(
+    path: str, file_format: TaskFileFormat, chunk_size: int, skip: int = 0
+) -> Generator[List[ImportRow], None, None]:
+    """Read an import file in chunks of parsed rows, holding one chunk at a time.
+
+    The first ``skip`` rows are passed over, to resume an interrupted import.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        rows: Iterator[ImportRow]
+        if file_format == TaskFileFormat.CSV:
+            reader = csv.DictReader(f)
+            rows = ((reader.line_num, _parse_csv_row(row)) for row in reader)
+        else:
+            rows = (
+                (line_number, _parse_ndjson_line(line))
+                for line_number, line in enumerate(f, 1)
+                if line.strip()
+            )
+
+        chunk: List[ImportRow] = []
+        for row in itertools.islice(rows, skip, None):
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def _remove_spool_file(path: str) -> None:
+    """Remove an import's spooled upload if it is still there."""
+    with suppress(FileNotFoundError):
+        os.unlink(path)
+
+
 class TaskService:
     """Task service."""
 
-    def __init__(self, task_repository: ITaskRepository) -> None:
+    def __init__(
+        self,
+        task_repository: ITaskRepository,
+        task_count_cache: Optional[TaskCountCache] = None,
+        task_event_publisher: Optional[TaskEventPublisher] = None,
+        task_event_broker: Optional[TaskEventBroker] = None,
+        task_status_store: Optional[TaskStatusStore] = None,
+        idempotency_store: Optional[IdempotencyStore] = None,
+        task_import_store: Optional[TaskImportJobStore] = None,
+    ) -> None:
         """Initialize task service."""
         self.task_repository = task_repository
+        self.task_count_cache = task_count_cache
+        self.task_event_publisher = task_event_publisher
+        self.task_event_broker = task_event_broker
+        self.task_status_store = task_status_store
+        self.idempotency_store = idempotency_store
+        self.task_import_store = task_import_store
 
     async def create_task(
         self, user_id: UUID, task_data: TaskCreateDTO
     ) -> TaskResponseDTO:
         """Create a new task."""
-        task = Task(
-            name=task_data.name,
-            description=task_data.description,
-            task_type=task_data.task_type,
-            priority=task_data.priority,
-            user_id=user_id,
-            parameters=task_data.parameters,
-            max_retries=task_data.max_retries,
-        )
+        task = self._build_task(user_id, task_data)
 
         created_task = await self.task_repository.create(task)
+        await self._adjust_counts(user_id, {TaskStatus.PENDING: 1})
+        await self._store_status(created_task)
 
         # Queue task for execution
         self._queue_task(created_task.id, created_task.task_type.value)
 
-        return TaskResponseDTO.model_validate(created_task)
+        return TaskResponseDTO.from_entity(created_task)
+
+    async def create_task_idempotent(
+        self, user_id: UUID, task_data: TaskCreateDTO, idempotency_key: str
+    ) -> Tuple[TaskResponseDTO, bool]:
+        """Create a task at most once per idempotency key.
+
+        Returns the task and whether it is a replay of an earlier response,
+        in which case neither the repository nor the broker was touched.
+        """
+        if self.idempotency_store is None:
+            return await self.create_task(user_id, task_data), False
+
+        scope = f"tasks.create:{user_id}"
+        fingerprint = hashlib.sha256(task_data.model_dump_json().encode()).hexdigest()
+        record = await self.idempotency_store.begin(scope, idempotency_key, fingerprint)
+        if (
+            record is not None
+            and record.state == IdempotencyState.COMPLETED
+            and record.response is not None
+        ):
+            return TaskResponseDTO.model_validate_json(record.response), True
+
+        try:
+            task = await self.create_task(user_id, task_data)
+        except BaseException:
+            if record is not None:
+                await self.idempotency_store.release(scope, idempotency_key, record)
+            raise
+
+        if record is not None:
+            await self.idempotency_store.complete(
+                scope, idempotency_key, record, task.model_dump_json()
+            )
+        return task, False
+
+    async def create_tasks(
+        self, user_id: UUID, tasks_data: List[Dict[str, Any]]
+    ) -> TaskBatchResponseDTO:
+        """Create a batch of tasks in one transaction and queue them together."""
+        if len(tasks_data) > settings.task_batch_max_size:
+            raise TaskBatchTooLargeError(
+                f"Batch of {len(tasks_data)} tasks exceeds the limit of "
+                f"{settings.task_batch_max_size}"
+            )
+
+        results: List[TaskBatchItemResultDTO] = []
+        accepted: List[TaskBatchItemResultDTO] = []
+        tasks: List[Task] = []
+        for index, raw_task in enumerate(tasks_data):
+            try:
+                task_data = TaskCreateDTO.model_validate(raw_task)
+            except ValidationError as e:
+                results.append(
+                    TaskBatchItemResultDTO(index=index, error=self._format_errors(e))
+                )
+                continue
+            item = TaskBatchItemResultDTO(index=index)
+            results.append(item)
+            accepted.append(item)
+            tasks.append(self._build_task(user_id, task_data))
+
+        created_tasks = await self.task_repository.create_many(tasks)
+        await self._adjust_counts(user_id, {TaskStatus.PENDING: len(created_tasks)})
+        await self._store_status(*created_tasks)
+
+        # Queue all tasks over one broker connection, off the event loop
+        await asyncio.to_thread(self._queue_tasks, created_tasks)
+
+        for item, created_task in zip(accepted, created_tasks, strict=True):
+            item.task = TaskResponseDTO.from_entity(created_task)
+
+        return TaskBatchResponseDTO(
+            items=results,
+            created=len(created_tasks),
+            failed=len(results) - len(created_tasks),
+        )
+
+    @staticmethod
+    def import_spool_path(job_id: UUID) -> str:
+        """Path where an import job's upload is spooled for the workers."""
+        return os.path.join(settings.task_import_spool_path, str(job_id))
+
+    async def start_import(self, job: TaskImportJobDTO) -> TaskImportJobDTO:
+        """Queue a pending import job whose upload has been spooled."""
+        await self._save_import_job(job)
+        try:
+            await asyncio.to_thread(self._queue_import, job.id)
+        except Exception as e:
+            job.status = TaskImportStatus.FAILED
+            job.error_message = str(e)
+            job.updated_at = job.completed_at = datetime.utcnow()
+            await self._save_import_job(job)
+            await asyncio.to_thread(_remove_spool_file, self.import_spool_path(job.id))
+            raise
+        return job
+
+    async def run_import_job(self, job_id: UUID) -> None:
+        """Run a queued import job, then remove its spooled upload.
+
+        A job redelivered after its worker died resumes after its last
+        saved chunk; one that has finished meanwhile, for example failed as
+        stale, is not run again.
+        """
+        path = self.import_spool_path(job_id)
+        job = None
+        if self.task_import_store is not None:
+            job = await self.task_import_store.get(job_id)
+        try:
+            if job is not None and job.status not in (
+                TaskImportStatus.COMPLETED,
+                TaskImportStatus.FAILED,
+            ):
+                await self.run_import(job, path)
+        finally:
+            await asyncio.to_thread(_remove_spool_file, path)
+
+    async def fail_stale_imports(self) -> int:
+        """Fail running import jobs not saved for ``task_import_stale_after``.
+
+        Their worker has died; called when a worker starts. Returns how many
+        jobs were failed.
+        """
+        if self.task_import_store is None:
+            return 0
+
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.task_import_stale_after)
+        failed = 0
+        for job in await self.task_import_store.list_active():
+            if job.status != TaskImportStatus.RUNNING or job.updated_at > cutoff:
+                continue
+            job.status = TaskImportStatus.FAILED
+            job.error_message = "Import was interrupted"
+            job.updated_at = job.completed_at = datetime.utcnow()
+            await self._save_import_job(job)
+            await asyncio.to_thread(_remove_spool_file, self.import_spool_path(job.id))
+            failed += 1
+        return failed
+
+    async def get_import_job(self, job_id: UUID, user_id: UUID) -> TaskImportJobDTO:
+        """Get one of the user's import jobs."""
+        job = None
+        if self.task_import_store is not None:
+            job = await self.task_import_store.get(job_id)
+        if job is None or job.user_id != user_id:
+            raise TaskImportJobNotFoundError(f"Import job {job_id} not found")
+        return job
+
+    async def run_import(self, job: TaskImportJobDTO, path: str) -> TaskImportJobDTO:
+        """Validate, load and queue the tasks of an import file, chunk by chunk.
+
+        Each chunk of valid rows is loaded with one COPY and its tasks are
+        queued over one broker connection, paced to
+        ``task_import_enqueue_rate`` messages per second so a large file
+        does not flood the workers. Rows failing validation are recorded on
+        the job and skipped; the job is saved after every chunk.
+
+        A job with rows already processed resumes after them. Task IDs are
+        derived from the job and line, so a chunk copied just before the
+        job was last interrupted is recognised and not copied twice.
+        """
+        job.status = TaskImportStatus.RUNNING
+        await self._save_import_job(job)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        resuming = job.processed > 0
+        chunks = _read_import_rows(
+            path, job.format, settings.task_import_chunk_size, skip=job.processed
+        )
+        try:
+            while chunk := await asyncio.to_thread(next, chunks, None):
+                tasks: List[Task] = []
+                for line, row in chunk:
+                    if isinstance(row, str):
+                        self._record_import_error(job, line, row)
+                        continue
+                    try:
+                        task_data = TaskCreateDTO.model_validate(row)
+                    except ValidationError as e:
+                        self._record_import_error(job, line, self._format_errors(e))
+                        continue
+                    task = self._build_task(job.user_id, task_data)
+                    task.id = uuid5(job.id, str(line))
+                    tasks.append(task)
+
+                to_copy = to_queue = tasks
+                if resuming and tasks:
+                    to_copy, to_queue = await self._skip_imported(job, tasks)
+                    resuming = False
+                if to_copy:
+                    await self.task_repository.copy_many(to_copy)
+                    await self._adjust_counts(
+                        job.user_id, {TaskStatus.PENDING: len(to_copy)}
+                    )
+                await asyncio.to_thread(self._queue_tasks, to_queue)
+                job.processed += len(chunk)
+                job.imported += len(tasks)
+                job.updated_at = datetime.utcnow()
+                await self._save_import_job(job)
+
+                ahead = job.imported / settings.task_import_enqueue_rate - (
+                    loop.time() - started
+                )
+                if ahead > 0:
+                    await asyncio.sleep(ahead)
+        except Exception as e:
+            job.status = TaskImportStatus.FAILED
+            job.error_message = str(e)
+            raise
+        else:
+            job.status = TaskImportStatus.COMPLETED
+        finally:
+            chunks.close()
+            job.updated_at = job.completed_at = datetime.utcnow()
+            await self._save_import_job(job)
+        return job
 
     async def get_task_by_id(
-        self, task_id: UUID, user_id: Optional[UUID] = None
+        self,
+        task_id: UUID,
+        user_id: Optional[UUID] = None,
+        fields: Optional[FrozenSet[str]] = None,
     ) -> TaskResponseDTO:
-        """Get task by ID."""
-        task = await self.task_repository.get_by_id(task_id)
+        """Get task by ID, from the live status store when it has the task.
+
+        ``fields`` limits the columns read from Postgres; fields outside it
+        may be None in the result.
+        """
+        task = await self._get_live_task(task_id, fields=fields)
         if not task:
             raise TaskNotFoundError(f"Task with ID {task_id} not found")
 
@@ -62,7 +415,135 @@ class TaskService:
                 "You don't have permission to access this task"
             )
 
-        return TaskResponseDTO.model_validate(task)
+        return TaskResponseDTO.from_entity(task)
+
+    async def lookup_tasks(
+        self,
+        user_id: UUID,
+        task_ids: List[str],
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> TaskLookupResponseDTO:
+        """Get many of a user's tasks in one query, with a result per ID.
+
+        Tasks that do not exist and tasks owned by other users are both
+        reported as not found, so a lookup does not reveal which IDs exist.
+        """
+        if len(task_ids) > settings.task_lookup_max_size:
+            raise TaskBatchTooLargeError(
+                f"Lookup of {len(task_ids)} tasks exceeds the limit of "
+                f"{settings.task_lookup_max_size}"
+            )
+
+        parsed: List[Optional[UUID]] = []
+        for raw_id in task_ids:
+            try:
+                parsed.append(UUID(raw_id))
+            except ValueError:
+                parsed.append(None)
+
+        unique_ids = list(dict.fromkeys(task_id for task_id in parsed if task_id))
+        tasks = {
+            task.id: task
+            for task in await self.task_repository.get_many(
+                unique_ids, user_id, fields=fields
+            )
+        }
+
+        items: List[TaskLookupItemResultDTO] = []
+        for raw_id, task_id in zip(task_ids, parsed, strict=True):
+            task = tasks.get(task_id) if task_id else None
+            if task is None:
+                error = (
+                    TaskLookupError.NOT_FOUND if task_id else TaskLookupError.INVALID_ID
+                )
+                items.append(TaskLookupItemResultDTO(id=raw_id, error=error))
+                continue
+            items.append(
+                TaskLookupItemResultDTO(
+                    id=raw_id,
+                    task=(
+                        TaskResponseDTO.project(task, fields)
+                        if fields
+                        else TaskResponseDTO.from_entity(task)
+                    ),
+                )
+            )
+
+        found = sum(1 for item in items if item.task is not None)
+        return TaskLookupResponseDTO(
+            items=items, found=found, missing=len(items) - found
+        )
+
+    async def get_task_result(self, task_id: UUID, user_id: UUID) -> TaskResponseDTO:
+        """Get the result fields of a task that has a result, inline or stored."""
+        task = await self.get_task_by_id(task_id, user_id, fields=_RESULT_FIELDS)
+        if task.result is None and task.result_ref is None:
+            raise TaskResultNotAvailableError(f"Task with ID {task_id} has no result")
+        return task
+
+    async def get_task_version(self, task_id: UUID, user_id: UUID) -> datetime:
+        """Get a task's last update time, checking access like a full read."""
+        task = await self._get_live_task(task_id, load=False)
+        version = (
+            (task.user_id, task.updated_at)
+            if task
+            else await self.task_repository.get_version(task_id)
+        )
+        if not version:
+            raise TaskNotFoundError(f"Task with ID {task_id} not found")
+
+        owner_id, updated_at = version
+        if owner_id != user_id:
+            raise InsufficientPermissionsError(
+                "You don't have permission to access this task"
+            )
+        return updated_at
+
+    async def get_user_tasks_version(self, user_id: UUID) -> Optional[int]:
+        """Get the version of a user's task list, bumped on every write.
+
+        Returns None when there is no count cache to keep it in.
+        """
+        if self.task_count_cache is None:
+            return None
+        return await self.task_count_cache.get_version(user_id)
+
+    async def wait_for_task(
+        self, task_id: UUID, user_id: UUID, timeout: float
+    ) -> TaskResponseDTO:
+        """Get a task, waiting up to ``timeout`` seconds for it to finish.
+
+        The wait is driven by task events rather than polling: the task is
+        read once, and once more after a terminal event arrives. If the
+        deadline passes first, the latest known state is returned.
+        """
+        if self.task_event_broker is None or timeout <= 0:
+            return await self.get_task_by_id(task_id, user_id)
+
+        # Subscribe before reading so a transition in between is not missed
+        async with self.task_event_broker.subscribe_task(task_id) as queue:
+            task = await self.get_task_by_id(task_id, user_id)
+            if task.status in TERMINAL_TASK_STATUSES:
+                return task
+
+            await self.task_repository.release_connection()
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            while (remaining := deadline - loop.time()) > 0:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if event.status in TERMINAL_TASK_STATUSES:
+                    return await self.get_task_by_id(task_id, user_id)
+                task = task.model_copy(
+                    update=event.model_dump(
+                        include={"status", "started_at", "updated_at"}
+                    )
+                )
+
+        return task
 
     async def get_user_tasks(
         self,
@@ -70,29 +551,86 @@ class TaskService:
         page: int = 1,
         page_size: int = 20,
         status: Optional[TaskStatus] = None,
+        cursor: Optional[str] = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        fields: Optional[FrozenSet[str]] = None,
     ) -> TaskListResponseDTO:
-        """Get tasks for a user with pagination."""
-        skip = (page - 1) * page_size
+        """Get tasks for a user with pagination.
+
+        A ``cursor`` taken from a previous page's ``next_cursor`` switches to
+        keyset pagination and takes precedence over ``page``. ``total_mode``
+        selects an exact (cached) total, a planner estimate, or no total.
+        With ``fields``, items only hold those keys.
+        """
+        task_cursor = TaskCursor.decode(cursor) if cursor else None
+        skip = 0 if task_cursor else (page - 1) * page_size
+
+        # Fetch one extra row to learn whether another page follows
         tasks = await self.task_repository.get_by_user_id(
-            user_id, skip=skip, limit=page_size, status=status
+            user_id,
+            skip=skip,
+            limit=page_size + 1,
+            status=status,
+            cursor=task_cursor,
+            fields=fields,
         )
-        total = await self.task_repository.count_by_user_id(user_id, status=status)
+        has_more = len(tasks) > page_size
+        tasks = tasks[:page_size]
 
-        total_pages = (total + page_size - 1) // page_size
+        total: Optional[int] = None
+        total_pages: Optional[int] = None
+        if total_mode == TotalMode.EXACT:
+            total = await self._count_user_tasks(user_id, status)
+        elif total_mode == TotalMode.ESTIMATE:
+            total = await self.task_repository.estimate_count_by_user_id(
+                user_id, status=status
+            )
+        if total is not None:
+            total_pages = (total + page_size - 1) // page_size
+
+        next_cursor = None
+        if has_more:
+            last_task = tasks[-1]
+            next_cursor = TaskCursor(
+                created_at=last_task.created_at, id=last_task.id
+            ).encode()
 
         return TaskListResponseDTO(
-            items=[TaskResponseDTO.model_validate(task) for task in tasks],
+            items=[
+                TaskResponseDTO.project(task, fields)
+                if fields
+                else TaskResponseDTO.from_entity(task)
+                for task in tasks
+            ],
             total=total,
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            total_is_estimate=total_mode == TotalMode.ESTIMATE,
+            next_cursor=next_cursor,
         )
 
+    async def export_user_tasks(
+        self,
+        user_id: UUID,
+        status: Optional[TaskStatus] = None,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every task of a user, oldest first, as response rows."""
+        columns = fields or frozenset(TaskResponseDTO.model_fields)
+        async for task in self.task_repository.stream_by_user_id(
+            user_id,
+            status=status,
+            fields=fields,
+            batch_size=settings.task_export_batch_size,
+        ):
+            yield TaskResponseDTO.project(task, columns)
+
     async def update_task(
         self, task_id: UUID, task_data: TaskUpdateDTO, user_id: UUID
     ) -> TaskResponseDTO:
         """Update task."""
-        task = await self.task_repository.get_by_id(task_id)
+        task = await self.task_repository.get_by_id(task_id, for_update=True)
         if not task:
             raise TaskNotFoundError(f"Task with ID {task_id} not found")
 
@@ -116,12 +654,16 @@ class TaskService:
         if task_data.priority is not None:
             task.priority = task_data.priority
 
+        task.updated_at = datetime.utcnow()
+
         updated_task = await self.task_repository.update(task)
-        return TaskResponseDTO.model_validate(updated_task)
+        await self._adjust_counts(user_id, {})
+        await self._store_status(updated_task)
+        return TaskResponseDTO.from_entity(updated_task)
 
     async def cancel_task(self, task_id: UUID, user_id: UUID) -> TaskResponseDTO:
         """Cancel a task."""
-        task = await self.task_repository.get_by_id(task_id)
+        task = await self.task_repository.get_by_id(task_id, for_update=True)
         if not task:
             raise TaskNotFoundError(f"Task with ID {task_id} not found")
 
@@ -137,14 +679,21 @@ class TaskService:
                 f"Cannot cancel task with status {task.status.value}"
             )
 
-        task.status = TaskStatus.CANCELLED
+        previous_status = task.status
+        task.cancel()
         updated_task = await self.task_repository.update(task)
+        await self._adjust_counts(
+            user_id, {previous_status: -1, TaskStatus.CANCELLED: 1}
+        )
+        await self._store_status(updated_task)
+        if self.task_event_publisher is not None:
+            await self.task_event_publisher.publish(updated_task)
 
-        return TaskResponseDTO.model_validate(updated_task)
+        return TaskResponseDTO.from_entity(updated_task)
 
     async def delete_task(self, task_id: UUID, user_id: UUID) -> bool:
         """Delete task."""
-        task = await self.task_repository.get_by_id(task_id)
+        task = await self.task_repository.get_by_id(task_id, for_update=True)
         if not task:
             raise TaskNotFoundError(f"Task with ID {task_id} not found")
 
@@ -154,22 +703,256 @@ class TaskService:
                 "You don't have permission to delete this task"
             )
 
-        return await self.task_repository.delete(task_id)
+        deleted = await self.task_repository.delete(task_id)
+        if deleted:
+            await self._adjust_counts(user_id, {task.status: -1})
+            if self.task_status_store is not None:
+                await self.task_status_store.invalidate(task_id)
+        return deleted
+
+    async def cancel_tasks(
+        self, user_id: UUID, selection: TaskBulkSelectionDTO
+    ) -> TaskBulkResponseDTO:
+        """Cancel the selected unfinished tasks of a user, batch by batch.
+
+        Each batch is one ``UPDATE ... RETURNING`` followed by one revoke
+        broadcast, one count cache adjustment, one status store pipeline and
+        one event pipeline, whatever the number of tasks in it.
+        """
+        self._check_bulk_selection(selection)
+
+        cancelled: Counter = Counter()
+        while True:
+            batch = await self.task_repository.cancel_many(
+                user_id,
+                task_ids=selection.ids,
+                status=selection.status,
+                task_type=selection.task_type,
+                created_before=selection.created_before,
+                limit=settings.task_bulk_batch_size,
+            )
+            if not batch:
+                break
+
+            tasks = [task for task, _ in batch]
+            previous = Counter(previous_status for _, previous_status in batch)
+            self._revoke_tasks([task.id for task in tasks])
+            await self._adjust_counts(
+                user_id,
+                {
+                    **{task_status: -count for task_status, count in previous.items()},
+                    TaskStatus.CANCELLED: len(batch),
+                },
+            )
+            await self._store_status(*tasks)
+            if self.task_event_publisher is not None:
+                await self.task_event_publisher.publish_many(tasks)
+
+            cancelled.update(previous)
+            if len(batch) < settings.task_bulk_batch_size:
+                break
+
+        return TaskBulkResponseDTO(
+            affected=sum(cancelled.values()), by_status=dict(cancelled)
+        )
+
+    async def delete_tasks(
+        self, user_id: UUID, selection: TaskBulkSelectionDTO
+    ) -> TaskBulkResponseDTO:
+        """Delete the selected tasks of a user, batch by batch."""
+        self._check_bulk_selection(selection)
+
+        deleted: Counter = Counter()
+        while True:
+            batch = await self.task_repository.delete_many(
+                user_id,
+                task_ids=selection.ids,
+                status=selection.status,
+                task_type=selection.task_type,
+                created_before=selection.created_before,
+                limit=settings.task_bulk_batch_size,
+            )
+            if not batch:
+                break
+
+            removed = Counter(task_status for _, task_status in batch)
+            self._revoke_tasks(
+                [
+                    task_id
+                    for task_id, task_status in batch
+                    if task_status not in TERMINAL_TASK_STATUSES
+                ]
+            )
+            await self._adjust_counts(
+                user_id,
+                {task_status: -count for task_status, count in removed.items()},
+            )
+            if self.task_status_store is not None:
+                await self.task_status_store.invalidate_many(
+                    [task_id for task_id, _ in batch]
+                )
+
+            deleted.update(removed)
+            if len(batch) < settings.task_bulk_batch_size:
+                break
+
+        return TaskBulkResponseDTO(
+            affected=sum(deleted.values()), by_status=dict(deleted)
+        )
+
+    async def _count_user_tasks(
+        self, user_id: UUID, status: Optional[TaskStatus] = None
+    ) -> int:
+        """Count a user's tasks, served from the count cache when possible."""
+        if self.task_count_cache is None:
+            return await self.task_repository.count_by_user_id(user_id, status=status)
+
+        counts = await self.task_count_cache.get_counts(user_id)
+        if counts is None:
+            # Read before counting, so a write racing the count stops the seed
+            version = await self.task_count_cache.get_version(user_id)
+            counts = await self.task_repository.count_by_status(user_id)
+            if version is not None:
+                await self.task_count_cache.set_counts(user_id, counts, version)
+
+        if status:
+            return counts.get(status, 0)
+        return sum(counts.values())
+
+    async def _save_import_job(self, job: TaskImportJobDTO) -> None:
+        """Save an import job to the job store."""
+        if self.task_import_store is not None:
+            await self.task_import_store.save(job)
+
+    async def _skip_imported(
+        self, job: TaskImportJobDTO, tasks: List[Task]
+    ) -> Tuple[List[Task], List[Task]]:
+        """Split a resumed chunk into tasks to copy and tasks to queue.
+
+        Tasks copied before the interruption are not copied again, but the
+        ones still pending are queued again, as they may not have been.
+        """
+        copied = await self.task_repository.get_many(
+            [task.id for task in tasks], user_id=job.user_id
+        )
+        copied_ids = {task.id for task in copied}
+        to_copy = [task for task in tasks if task.id not in copied_ids]
+        pending = [task for task in copied if task.status == TaskStatus.PENDING]
+        return to_copy, to_copy + pending
+
+    @staticmethod
+    def _record_import_error(job: TaskImportJobDTO, line: int, error: str) -> None:
+        """Count a rejected import row, keeping its error while there is room."""
+        job.failed += 1
+        if len(job.errors) < settings.task_import_max_errors:
+            job.errors.append(TaskImportErrorDTO(line=line, error=error))
+
+    async def _adjust_counts(
+        self, user_id: UUID, deltas: Dict[TaskStatus, int]
+    ) -> None:
+        """Apply task count deltas and bump the user's list version."""
+        if self.task_count_cache is not None:
+            await self.task_count_cache.adjust(user_id, deltas)
+
+    async def _get_live_task(
+        self,
+        task_id: UUID,
+        load: bool = True,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> Optional[Task]:
+        """Get a task from the live status store, else (if ``load``) Postgres."""
+        task = None
+        if self.task_status_store is not None:
+            task = await self.task_status_store.get(task_id)
+        if task is None and load:
+            task = await self.task_repository.get_by_id(task_id, fields=fields)
+        return task
+
+    async def _store_status(self, *tasks: Task) -> None:
+        """Write task snapshots through to the live status store."""
+        if self.task_status_store is not None:
+            await self.task_status_store.set_many(list(tasks))
+
+    @staticmethod
+    def _check_bulk_selection(selection: TaskBulkSelectionDTO) -> None:
+        """Reject bulk selections listing too many IDs."""
+        if selection.ids is not None and (
+            len(selection.ids) > settings.task_bulk_max_ids
+        ):
+            raise TaskBatchTooLargeError(
+                f"Selection of {len(selection.ids)} task IDs exceeds the limit of "
+                f"{settings.task_bulk_max_ids}"
+            )
+
+    def _build_task(self, user_id: UUID, task_data: TaskCreateDTO) -> Task:
+        """Build a task entity from creation data."""
+        return Task(
+            name=task_data.name,
+            description=task_data.description,
+            task_type=task_data.task_type,
+            priority=task_data.priority,
+            user_id=user_id,
+            parameters=task_data.parameters,
+            max_retries=task_data.max_retries,
+        )
+
+    @staticmethod
+    def _format_errors(error: ValidationError) -> str:
+        """Flatten validation errors into a single message."""
+        return "; ".join(
+            f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+            for err in error.errors()
+        )
 
     def _queue_task(self, task_id: UUID, task_type: str) -> None:
         """Queue task for execution."""
-        # Map task types to worker task names
+        celery_app.send_task(
+            self._worker_task_name(task_type),
+            args=[str(task_id)],
+            task_id=str(task_id),
+        )
+
+    @staticmethod
+    def _queue_import(job_id: UUID) -> None:
+        """Queue an import job for a worker."""
+        celery_app.send_task(IMPORT_WORKER_TASK, args=[str(job_id)])
+
+    def _queue_tasks(self, tasks: List[Task]) -> None:
+        """Queue several tasks for execution.
+
+        All messages are published through one pooled producer, so the batch
+        pays for a single broker connection instead of one per task.
+        """
+        if not tasks:
+            return
+
+        with celery_app.producer_or_acquire() as producer:
+            for task in tasks:
+                celery_app.send_task(
+                    self._worker_task_name(task.task_type.value),
+                    args=[str(task.id)],
+                    task_id=str(task.id),
+                    producer=producer,
+                )
+
+    @staticmethod
+    def _revoke_tasks(task_ids: List[UUID]) -> None:
+        """Revoke queued task messages so workers discard them unrun.
+
+        A single broadcast carries every ID.
+        """
+        if task_ids:
+            celery_app.control.revoke([str(task_id) for task_id in task_ids])
+
+    @staticmethod
+    def _worker_task_name(task_type: str) -> str:
+        """Map a task type to its worker task name."""
         worker_map = {
             "email": "app.workers.email_worker.process_task",
             "data_processing": "app.workers.data_processing.process_task",
             "api_integration": "app.workers.api_integration.process_task",
             "report_generation": "app.workers.report_generation.process_task",
         }
-        
-        task_name = worker_map.get(task_type, "app.workers.data_processing.process_task")
-        celery_app.send_task(
-            task_name,
-            args=[str(task_id)],
-            task_id=str(task_id),
-        )
+
+        return worker_map.get(task_type, "app.workers.data_processing.process_task")
 
@@ -7,14 +7,20 @@ from app.domain.entities.user import User
 from app.domain.exceptions.domain_exceptions import UserNotFoundError
 from app.application.dto.user_dto import UserUpdateDTO, UserResponseDTO
 from app.application.interfaces.user_repository import IUserRepository
+from app.infrastructure.cache.principal_cache import PrincipalCache
 
 
 class UserService:
     """User service."""
 
-    def __init__(self, user_repository: IUserRepository) -> None:
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        principal_cache: Optional[PrincipalCache] = None,
+    ) -> None:
         """Initialize user service."""
         self.user_repository = user_repository
+        self.principal_cache = principal_cache
 
     async def get_user_by_id(self, user_id: UUID) -> UserResponseDTO:
         """Get user by ID."""
@@ -22,13 +28,13 @@ class UserService:
         if not user:
             raise UserNotFoundError(f"User with ID {user_id} not found")
 
-        return UserResponseDTO.model_validate(user)
+        return UserResponseDTO.from_entity(user)
 
     async def update_user(
         self, user_id: UUID, user_data: UserUpdateDTO
     ) -> UserResponseDTO:
         """Update user."""
-        user = await self.user_repository.get_by_id(user_id)
+        user = await self.user_repository.get_by_id(user_id, for_update=True)
         if not user:
             raise UserNotFoundError(f"User with ID {user_id} not found")
 
@@ -39,10 +45,18 @@ class UserService:
             user.is_active = user_data.is_active
 
         updated_user = await self.user_repository.update(user)
-        return UserResponseDTO.model_validate(updated_user)
+        await self._invalidate_principal(user_id)
+        return UserResponseDTO.from_entity(updated_user)
 
     async def delete_user(self, user_id: UUID) -> bool:
         """Delete user."""
-        return await self.user_repository.delete(user_id)
+        deleted = await self.user_repository.delete(user_id)
+        await self._invalidate_principal(user_id)
+        return deleted
+
+    async def _invalidate_principal(self, user_id: UUID) -> None:
+        """Drop user from the principal cache."""
+        if self.principal_cache is not None:
+            await self.principal_cache.invalidate(user_id)
 
 
@@ -1,6 +1,6 @@
 """Application configuration using Pydantic settings."""
 
-from typing import List, Union
+from typing import Dict, List, Optional, Union
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -36,6 +36,11 @@ class Settings(BaseSettings):
         alias="SYNC_DATABASE_URL",
     )
 
+    # Coalesce concurrent lookups by ID into one query per tick
+    batch_load_enabled: bool = Field(default=True, alias="BATCH_LOAD_ENABLED")
+    batch_load_delay: float = Field(default=0.001, alias="BATCH_LOAD_DELAY")
+    batch_load_max_size: int = Field(default=500, alias="BATCH_LOAD_MAX_SIZE")
+
     # Redis
     redis_url: str = Field(default="redis://localhost:6379/0", alias="REDIS_URL")
     redis_cache_url: str = Field(
@@ -54,6 +59,12 @@ class Settings(BaseSettings):
     jwt_refresh_token_expire_days: int = Field(
         default=7, alias="JWT_REFRESH_TOKEN_EXPIRE_DAYS"
     )
+    jwt_backend: str = Field(default="hmac", alias="JWT_BACKEND")  # hmac, jose
+    jwt_claims_cache_size: int = Field(default=10000, alias="JWT_CLAIMS_CACHE_SIZE")
+
+    # Password hashing
+    password_bcrypt_rounds: int = Field(default=12, alias="PASSWORD_BCRYPT_ROUNDS")
+    password_hash_workers: int = Field(default=4, alias="PASSWORD_HASH_WORKERS")
 
     # Celery
     celery_broker_url: str = Field(
@@ -63,6 +74,17 @@ class Settings(BaseSettings):
         default="redis://localhost:6379/3", alias="CELERY_RESULT_BACKEND"
     )
 
+    # Principal cache
+    principal_cache_local_ttl: float = Field(
+        default=5.0, alias="PRINCIPAL_CACHE_LOCAL_TTL"
+    )
+    principal_cache_redis_ttl: int = Field(
+        default=300, alias="PRINCIPAL_CACHE_REDIS_TTL"
+    )
+    principal_cache_max_size: int = Field(
+        default=10000, alias="PRINCIPAL_CACHE_MAX_SIZE"
+    )
+
     # CORS
     cors_origins: Union[List[str], str] = Field(
         default=["http://localhost:3000", "http://localhost:8000"],
@@ -77,10 +99,112 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(",") if origin.strip()]
         return v if isinstance(v, list) else []
 
+    # Tasks
+    task_batch_max_size: int = Field(default=1000, alias="TASK_BATCH_MAX_SIZE")
+    task_lookup_max_size: int = Field(default=1000, alias="TASK_LOOKUP_MAX_SIZE")
+    task_bulk_max_ids: int = Field(default=10000, alias="TASK_BULK_MAX_IDS")
+    task_bulk_batch_size: int = Field(default=1000, alias="TASK_BULK_BATCH_SIZE")
+    task_export_batch_size: int = Field(default=1000, alias="TASK_EXPORT_BATCH_SIZE")
+    task_count_cache_ttl: int = Field(default=3600, alias="TASK_COUNT_CACHE_TTL")
+    task_events_queue_size: int = Field(default=100, alias="TASK_EVENTS_QUEUE_SIZE")
+    task_events_heartbeat_interval: int = Field(
+        default=15, alias="TASK_EVENTS_HEARTBEAT_INTERVAL"
+    )
+    task_wait_max_seconds: int = Field(default=60, alias="TASK_WAIT_MAX_SECONDS")
+    task_status_ttl: int = Field(default=3600, alias="TASK_STATUS_TTL")
+    task_status_terminal_ttl: int = Field(
+        default=300, alias="TASK_STATUS_TERMINAL_TTL"
+    )
+
+    # Task results
+    result_store_path: str = Field(default="data/results", alias="RESULT_STORE_PATH")
+    result_offload_threshold: int = Field(
+        default=64 * 1024, alias="RESULT_OFFLOAD_THRESHOLD"
+    )
+
+    # Task imports
+    task_import_max_bytes: int = Field(
+        default=1024 * 1024 * 1024, alias="TASK_IMPORT_MAX_BYTES"
+    )
+    task_import_chunk_size: int = Field(default=1000, alias="TASK_IMPORT_CHUNK_SIZE")
+    task_import_enqueue_rate: int = Field(
+        default=1000, alias="TASK_IMPORT_ENQUEUE_RATE"
+    )
+    task_import_max_errors: int = Field(default=1000, alias="TASK_IMPORT_MAX_ERRORS")
+    task_import_job_ttl: int = Field(default=86400, alias="TASK_IMPORT_JOB_TTL")
+    task_import_spool_path: str = Field(
+        default="data/imports", alias="TASK_IMPORT_SPOOL_PATH"
+    )
+    task_import_stale_after: int = Field(default=600, alias="TASK_IMPORT_STALE_AFTER")
+
+    # Idempotency keys
+    idempotency_ttl: int = Field(default=86400, alias="IDEMPOTENCY_TTL")
+    idempotency_lock_ttl: int = Field(default=60, alias="IDEMPOTENCY_LOCK_TTL")
+    idempotency_wait_seconds: float = Field(
+        default=10.0, alias="IDEMPOTENCY_WAIT_SECONDS"
+    )
+
     # Rate Limiting
     rate_limit_enabled: bool = Field(default=True, alias="RATE_LIMIT_ENABLED")
     rate_limit_requests: int = Field(default=100, alias="RATE_LIMIT_REQUESTS")
     rate_limit_window: int = Field(default=60, alias="RATE_LIMIT_WINDOW")
+    rate_limit_user_requests: Optional[int] = Field(
+        default=None, alias="RATE_LIMIT_USER_REQUESTS"
+    )
+    rate_limit_api_key_requests: Optional[int] = Field(
+        default=None, alias="RATE_LIMIT_API_KEY_REQUESTS"
+    )
+    rate_limit_route_limits: Union[Dict[str, int], str] = Field(
+        default={}, alias="RATE_LIMIT_ROUTE_LIMITS"
+    )
+    rate_limit_mode: str = Field(
+        default="redis", alias="RATE_LIMIT_MODE"
+    )  # redis, hybrid
+    rate_limit_lease_fraction: float = Field(
+        default=0.1, alias="RATE_LIMIT_LEASE_FRACTION"
+    )
+
+    # Admission control
+    admission_enabled: bool = Field(default=True, alias="ADMISSION_ENABLED")
+    admission_max_concurrency: int = Field(
+        default=30, alias="ADMISSION_MAX_CONCURRENCY"
+    )  # database pool_size + max_overflow
+    admission_lane_limits: Union[Dict[str, int], str] = Field(
+        default={"write": 20, "auth": 8, "export": 4, "stream": 200},
+        alias="ADMISSION_LANE_LIMITS",
+    )
+    admission_queue_deadline: float = Field(
+        default=1.0, alias="ADMISSION_QUEUE_DEADLINE"
+    )
+
+    @field_validator("rate_limit_route_limits", "admission_lane_limits", mode="before")
+    @classmethod
+    def parse_route_class_limits(
+        cls, v: Union[Dict[str, int], str]
+    ) -> Dict[str, int]:
+        """Parse route class limits from "class=limit,..." or a mapping."""
+        if isinstance(v, str):
+            limits = {}
+            for item in v.split(","):
+                if item.strip():
+                    route_class, _, limit = item.partition("=")
+                    limits[route_class.strip()] = int(limit)
+            return limits
+        return v if isinstance(v, dict) else {}
+
+    # Compression
+    compression_enabled: bool = Field(default=True, alias="COMPRESSION_ENABLED")
+    compression_minimum_size: int = Field(
+        default=1024, alias="COMPRESSION_MINIMUM_SIZE"
+    )
+    compression_max_request_size: int = Field(
+        default=10 * 1024 * 1024, alias="COMPRESSION_MAX_REQUEST_SIZE"
+    )
+
+    # In-process metrics at /health/metrics, which are unauthenticated
+    metrics_endpoint_enabled: bool = Field(
+        default=False, alias="METRICS_ENDPOINT_ENABLED"
+    )
 
     # Logging
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
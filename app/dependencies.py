@@ -5,27 +5,40 @@ from typing import AsyncGenerator
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.infrastructure.database.base import get_db
+from app.infrastructure.database.loaders import task_loader, user_loader
 from app.infrastructure.database.repositories.user_repository import UserRepository
 from app.infrastructure.database.repositories.task_repository import TaskRepository
 from app.application.services.auth_service import AuthService
 from app.application.services.user_service import UserService
 from app.application.services.task_service import TaskService
+from app.infrastructure.cache.idempotency_store import IdempotencyStore
+from app.infrastructure.cache.principal_cache import PrincipalCache, principal_cache
+from app.infrastructure.cache.task_count_cache import TaskCountCache
+from app.infrastructure.cache.task_import_store import TaskImportJobStore
+from app.infrastructure.cache.task_status_store import TaskStatusStore
+from app.infrastructure.events.task_events import (
+    TaskEventBroker,
+    TaskEventPublisher,
+    task_event_broker,
+)
 from app.infrastructure.security.password_handler import PasswordHandler
+from app.infrastructure.storage.result_store import ResultBlobStore, result_blob_store
 
 
 async def get_user_repository(
     session: AsyncSession = Depends(get_db),
 ) -> AsyncGenerator[UserRepository, None]:
     """Get user repository."""
-    yield UserRepository(session)
+    yield UserRepository(session, user_loader if settings.batch_load_enabled else None)
 
 
 async def get_task_repository(
     session: AsyncSession = Depends(get_db),
 ) -> AsyncGenerator[TaskRepository, None]:
     """Get task repository."""
-    yield TaskRepository(session)
+    yield TaskRepository(session, task_loader if settings.batch_load_enabled else None)
 
 
 def get_password_handler() -> PasswordHandler:
@@ -33,25 +46,81 @@ def get_password_handler() -> PasswordHandler:
     return PasswordHandler()
 
 
+def get_principal_cache() -> PrincipalCache:
+    """Get process-wide principal cache."""
+    return principal_cache
+
+
 def get_auth_service(
     user_repo: UserRepository = Depends(get_user_repository),
     password_handler: PasswordHandler = Depends(get_password_handler),
+    principal_cache: PrincipalCache = Depends(get_principal_cache),
 ) -> AuthService:
     """Get auth service."""
-    return AuthService(user_repo, password_handler)
+    return AuthService(user_repo, password_handler, principal_cache)
 
 
 def get_user_service(
     user_repo: UserRepository = Depends(get_user_repository),
+    principal_cache: PrincipalCache = Depends(get_principal_cache),
 ) -> UserService:
     """Get user service."""
-    return UserService(user_repo)
+    return UserService(user_repo, principal_cache)
+
+
+def get_task_count_cache() -> TaskCountCache:
+    """Get task count cache."""
+    return TaskCountCache()
+
+
+def get_task_status_store() -> TaskStatusStore:
+    """Get live task status store."""
+    return TaskStatusStore()
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    """Get idempotency key store."""
+    return IdempotencyStore()
+
+
+def get_task_import_store() -> TaskImportJobStore:
+    """Get task import job store."""
+    return TaskImportJobStore()
+
+
+def get_task_event_publisher() -> TaskEventPublisher:
+    """Get task event publisher."""
+    return TaskEventPublisher()
+
+
+def get_task_event_broker() -> TaskEventBroker:
+    """Get process-wide task event broker."""
+    return task_event_broker
+
+
+def get_result_blob_store() -> ResultBlobStore:
+    """Get process-wide result blob store."""
+    return result_blob_store
 
 
 def get_task_service(
     task_repo: TaskRepository = Depends(get_task_repository),
+    task_count_cache: TaskCountCache = Depends(get_task_count_cache),
+    task_event_publisher: TaskEventPublisher = Depends(get_task_event_publisher),
+    task_event_broker: TaskEventBroker = Depends(get_task_event_broker),
+    task_status_store: TaskStatusStore = Depends(get_task_status_store),
+    idempotency_store: IdempotencyStore = Depends(get_idempotency_store),
+    task_import_store: TaskImportJobStore = Depends(get_task_import_store),
 ) -> TaskService:
     """Get task service."""
-    return TaskService(task_repo)
+    return TaskService(
+        task_repo,
+        task_count_cache,
+        task_event_publisher,
+        task_event_broker,
+        task_status_store,
+        idempotency_store,
+        task_import_store,
+    )
 
 
@@ -21,6 +21,8 @@ class Task(BaseModel):
     user_id: UUID
     parameters: Dict[str, Any] = Field(default_factory=dict)
     result: Optional[Dict[str, Any]] = None
+    result_ref: Optional[str] = None
+    result_size: Optional[int] = None
     error_message: Optional[str] = None
     retry_count: int = 0
     max_retries: int = 3
@@ -55,6 +57,11 @@ class Task(BaseModel):
         self.completed_at = datetime.utcnow()
         self.updated_at = datetime.utcnow()
 
+    def cancel(self) -> None:
+        """Mark task as cancelled."""
+        self.status = TaskStatus.CANCELLED
+        self.updated_at = datetime.utcnow()
+
     def can_retry(self) -> bool:
         """Check if task can be retried."""
         return self.retry_count < self.max_retries and self.status == TaskStatus.FAILED
@@ -32,3 +32,21 @@ class User(BaseModel):
         return f"<User {self.email}>"
 
 
+class Principal(BaseModel):
+    """Authenticated user, as needed to authorize requests.
+
+    Carries no credentials, so it is safe to cache and share.
+    """
+
+    id: UUID
+    email: EmailStr
+    is_active: bool = True
+    is_superuser: bool = False
+    role: str = Field(default="user")
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        """Project an already validated user without re-validating."""
+        return cls.model_construct(
+            **{field: getattr(user, field) for field in cls.model_fields}
+        )
@@ -49,3 +49,43 @@ class InsufficientPermissionsError(DomainException):
     pass
 
 
+class TaskBatchTooLargeError(DomainException):
+    """Task batch exceeds the allowed size exception."""
+
+    pass
+
+
+class TaskResultNotAvailableError(DomainException):
+    """Task has no result exception."""
+
+    pass
+
+
+class InvalidCursorError(DomainException):
+    """Invalid pagination cursor exception."""
+
+    pass
+
+
+class InvalidFieldsError(DomainException):
+    """Invalid sparse fieldset exception."""
+
+    pass
+
+
+class IdempotencyKeyConflictError(DomainException):
+    """Idempotency key reused for a different request exception."""
+
+    pass
+
+
+class IdempotencyKeyInProgressError(DomainException):
+    """Request with the same idempotency key still in progress exception."""
+
+    pass
+
+
+class TaskImportJobNotFoundError(DomainException):
+    """Task import job not found exception."""
+
+    pass
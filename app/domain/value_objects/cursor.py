@@ -0,0 +1,37 @@
+"""Pagination cursor value objects."""
+
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.domain.exceptions.domain_exceptions import InvalidCursorError
+
+
+class TaskCursor(BaseModel):
+    """Keyset position in a task listing ordered by ``(created_at, id)`` descending."""
+
+    created_at: datetime
+    id: UUID
+
+    class Config:
+        """Pydantic config."""
+
+        frozen = True
+
+    def encode(self) -> str:
+        """Encode cursor as an opaque URL-safe token."""
+        raw = f"{self.created_at.isoformat()}|{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "TaskCursor":
+        """Decode cursor from a token produced by ``encode``."""
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            created_at, task_id = base64.urlsafe_b64decode(padded).decode().split("|")
+            return cls(created_at=datetime.fromisoformat(created_at), id=UUID(task_id))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise InvalidCursorError("Invalid pagination cursor") from e
@@ -13,6 +13,15 @@ class TaskStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# Statuses in which a task has finished running
+TERMINAL_TASK_STATUSES = frozenset(
+    {TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED}
+)
+
+# Statuses in which a task can still change
+ACTIVE_TASK_STATUSES = frozenset({TaskStatus.PENDING, TaskStatus.RUNNING})
+
+
 class TaskPriority(str, Enum):
     """Task priority enumeration."""
 
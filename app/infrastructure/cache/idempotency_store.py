@@ -0,0 +1,169 @@
+"""Idempotency key store."""
+
+import asyncio
+import hashlib
+import secrets
+from enum import Enum
+from typing import Any, Optional
+
+import structlog
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.domain.exceptions.domain_exceptions import (
+    IdempotencyKeyConflictError,
+    IdempotencyKeyInProgressError,
+)
+from app.infrastructure.cache.redis_client import RedisClient
+
+logger = structlog.get_logger()
+
+# Delete the record only while it is still the caller's in-flight claim.
+# KEYS[1] record key; ARGV[1] claim token.
+_RELEASE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current and cjson.decode(current)['token'] == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+_POLL_INITIAL_DELAY = 0.05
+_POLL_MAX_DELAY = 0.5
+
+
+class IdempotencyState(str, Enum):
+    """State of a request under an idempotency key."""
+
+    STARTED = "started"
+    COMPLETED = "completed"
+
+
+class IdempotencyRecord(BaseModel):
+    """What is stored under an idempotency key."""
+
+    state: IdempotencyState
+    fingerprint: str
+    token: Optional[str] = None
+    response: Optional[str] = None
+
+
+class IdempotencyStore:
+    """Responses of completed requests, keyed by client idempotency keys.
+
+    The first request under a key claims it with ``SET NX`` and stores its
+    response when done; duplicates arriving meanwhile poll until then and
+    replay that response. A claim expires after ``idempotency_lock_ttl``
+    seconds so a crashed request does not block its key for good. Without
+    Redis, requests go ahead unprotected.
+    """
+
+    def __init__(self) -> None:
+        """Initialize idempotency store."""
+        self._client: Optional[Any] = None
+        self._release_script: Optional[Any] = None
+
+    async def _get_client(self) -> Any:
+        """Get Redis cache client."""
+        if self._client is None:
+            self._client = await RedisClient.get_cache_client()
+        return self._client
+
+    @staticmethod
+    def _key(scope: str, idempotency_key: str) -> str:
+        """Build cache key for an idempotency key within a scope."""
+        digest = hashlib.sha256(idempotency_key.encode()).hexdigest()
+        return f"idempotency:{scope}:{digest}"
+
+    async def begin(
+        self, scope: str, idempotency_key: str, fingerprint: str
+    ) -> Optional[IdempotencyRecord]:
+        """Claim a key, or wait for the request holding it and return its record.
+
+        Returns a ``STARTED`` record when the caller now owns the key, a
+        ``COMPLETED`` record to replay, or None when Redis is unavailable.
+        Raises if the key was used for a different request or is still in
+        flight after ``idempotency_wait_seconds``.
+        """
+        key = self._key(scope, idempotency_key)
+        claim = IdempotencyRecord(
+            state=IdempotencyState.STARTED,
+            fingerprint=fingerprint,
+            token=secrets.token_hex(16),
+        )
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.idempotency_wait_seconds
+        delay = _POLL_INITIAL_DELAY
+
+        while True:
+            try:
+                client = await self._get_client()
+                if await client.set(
+                    key,
+                    claim.model_dump_json(),
+                    nx=True,
+                    ex=settings.idempotency_lock_ttl,
+                ):
+                    return claim
+                data = await client.get(key)
+            except RedisError as e:
+                logger.warning("idempotency_store_read_failed", error=str(e))
+                return None
+
+            if data is None:
+                # Released or expired since the SET; try to claim it again
+                continue
+
+            record = IdempotencyRecord.model_validate_json(data)
+            if record.fingerprint != fingerprint:
+                raise IdempotencyKeyConflictError(
+                    "Idempotency key was already used for a different request"
+                )
+            if record.state == IdempotencyState.COMPLETED:
+                return record
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise IdempotencyKeyInProgressError(
+                    "A request with this idempotency key is still in progress"
+                )
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, _POLL_MAX_DELAY)
+
+    async def complete(
+        self,
+        scope: str,
+        idempotency_key: str,
+        claim: IdempotencyRecord,
+        response: str,
+    ) -> None:
+        """Store the response of a claimed request for replays."""
+        record = IdempotencyRecord(
+            state=IdempotencyState.COMPLETED,
+            fingerprint=claim.fingerprint,
+            response=response,
+        )
+        try:
+            client = await self._get_client()
+            await client.set(
+                self._key(scope, idempotency_key),
+                record.model_dump_json(),
+                ex=settings.idempotency_ttl,
+            )
+        except RedisError as e:
+            logger.warning("idempotency_store_write_failed", error=str(e))
+
+    async def release(
+        self, scope: str, idempotency_key: str, claim: IdempotencyRecord
+    ) -> None:
+        """Give up a claim after a failed request so a retry can run."""
+        try:
+            client = await self._get_client()
+            if self._release_script is None:
+                self._release_script = client.register_script(_RELEASE_SCRIPT)
+            await self._release_script(
+                keys=[self._key(scope, idempotency_key)], args=[claim.token]
+            )
+        except RedisError as e:
+            logger.warning("idempotency_store_write_failed", error=str(e))
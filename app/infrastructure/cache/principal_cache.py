@@ -0,0 +1,167 @@
+"""Authenticated principal cache."""
+
+import time
+from typing import Any, Optional
+from uuid import UUID
+
+import structlog
+from pydantic import ValidationError
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.domain.entities.user import Principal
+from app.infrastructure.cache.local_cache import TTLCache
+from app.infrastructure.cache.redis_client import RedisClient
+
+logger = structlog.get_logger()
+
+# A missing generation is seeded from the clock in microseconds, so one that
+# expired never comes back with a value an in-flight reader still holds.
+_GET_GENERATION_SCRIPT = """
+local generation = redis.call('GET', KEYS[1])
+if not generation then
+    generation = ARGV[1]
+    redis.call('SET', KEYS[1], generation, 'EX', ARGV[2])
+end
+return generation
+"""
+
+# Cache a principal only if the user has not been invalidated since the
+# caller read the generation, i.e. since before it loaded the user.
+_SET_SCRIPT = """
+if redis.call('GET', KEYS[2]) ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+_INVALIDATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    redis.call('SET', KEYS[2], ARGV[1])
+end
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+redis.call('DEL', KEYS[1])
+return 1
+"""
+
+
+class PrincipalCache:
+    """Cache of authenticated principals, keyed by user ID.
+
+    Lookups go to an in-process TTL/LRU first and to Redis second. Only the
+    ``Principal`` projection is cached, never password hashes. Invalidation
+    clears the local entry and the shared Redis entry, so other processes
+    see a change once their local entry expires. This bounds how long a
+    stale ``is_active`` flag can be served to ``local_ttl`` seconds.
+
+    Each user also has a generation that invalidation bumps. Callers read it
+    before loading the user and pass it to ``set``, which drops the entry if
+    the user was invalidated meanwhile, so a slow reader cannot cache data
+    older than the invalidation.
+    """
+
+    def __init__(self, local_ttl: float, redis_ttl: int, max_size: int) -> None:
+        """Initialize principal cache."""
+        self.redis_ttl = redis_ttl
+        self._local: TTLCache[UUID, Principal] = TTLCache(
+            max_size=max_size, ttl=local_ttl
+        )
+        self._client: Optional[Any] = None
+        self._get_generation_script: Optional[Any] = None
+        self._set_script: Optional[Any] = None
+        self._invalidate_script: Optional[Any] = None
+
+    async def _get_client(self) -> Any:
+        """Get Redis cache client."""
+        if self._client is None:
+            self._client = await RedisClient.get_cache_client()
+        return self._client
+
+    @staticmethod
+    def _key(user_id: UUID) -> str:
+        """Build cache key for a user."""
+        return f"principal:{user_id}"
+
+    @staticmethod
+    def _generation_key(user_id: UUID) -> str:
+        """Build generation key for a user."""
+        return f"principal_generation:{user_id}"
+
+    async def get(self, user_id: UUID) -> Optional[Principal]:
+        """Get cached principal."""
+        principal = self._local.get(user_id)
+        if principal is not None:
+            return principal
+
+        try:
+            client = await self._get_client()
+            data = await client.get(self._key(user_id))
+        except RedisError as e:
+            logger.warning("principal_cache_read_failed", error=str(e))
+            return None
+        if data is None:
+            return None
+
+        try:
+            principal = Principal.model_validate_json(data)
+        except ValidationError:
+            return None
+        self._local.set(user_id, principal)
+        return principal
+
+    async def get_generation(self, user_id: UUID) -> Optional[int]:
+        """Get a user's generation, or None if Redis fails."""
+        try:
+            client = await self._get_client()
+            if self._get_generation_script is None:
+                self._get_generation_script = client.register_script(
+                    _GET_GENERATION_SCRIPT
+                )
+            generation = await self._get_generation_script(
+                keys=[self._generation_key(user_id)],
+                args=[time.time_ns() // 1000, self.redis_ttl],
+            )
+        except RedisError as e:
+            logger.warning("principal_cache_read_failed", error=str(e))
+            return None
+        return int(generation)
+
+    async def set(self, principal: Principal, generation: int) -> None:
+        """Cache a principal loaded after reading ``generation``."""
+        try:
+            client = await self._get_client()
+            if self._set_script is None:
+                self._set_script = client.register_script(_SET_SCRIPT)
+            stored = await self._set_script(
+                keys=[self._key(principal.id), self._generation_key(principal.id)],
+                args=[generation, principal.model_dump_json(), self.redis_ttl],
+            )
+        except RedisError as e:
+            logger.warning("principal_cache_write_failed", error=str(e))
+            return
+        if stored:
+            self._local.set(principal.id, principal)
+
+    async def invalidate(self, user_id: UUID) -> None:
+        """Drop cached principal and bump the user's generation."""
+        self._local.delete(user_id)
+        try:
+            client = await self._get_client()
+            if self._invalidate_script is None:
+                self._invalidate_script = client.register_script(_INVALIDATE_SCRIPT)
+            await self._invalidate_script(
+                keys=[self._key(user_id), self._generation_key(user_id)],
+                args=[time.time_ns() // 1000, self.redis_ttl],
+            )
+        except RedisError as e:
+            logger.warning("principal_cache_write_failed", error=str(e))
+
+
+# Process-wide cache shared by all requests
+principal_cache = PrincipalCache(
+    local_ttl=settings.principal_cache_local_ttl,
+    redis_ttl=settings.principal_cache_redis_ttl,
+    max_size=settings.principal_cache_max_size,
+)
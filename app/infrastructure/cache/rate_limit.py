@@ -0,0 +1,220 @@
+"""Redis-backed GCRA rate limiter."""
+
+import math
+import time
+from typing import Any, Optional
+
+import structlog
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from app.infrastructure.cache.local_cache import TTLCache
+from app.infrastructure.cache.redis_client import RedisClient
+
+logger = structlog.get_logger()
+
+# Generic cell rate algorithm: the key holds the theoretical arrival time
+# (TAT) in microseconds of Redis server time. A request of ``cost`` is
+# admitted when it would not push the TAT more than one window ahead; with
+# ``partial`` set, as much of ``cost`` as fits is granted instead.
+# Returns {granted, remaining, retry_after_us, reset_after_us}.
+_GCRA_SCRIPT = """
+redis.replicate_commands()
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2]) * 1000000
+local cost = tonumber(ARGV[3])
+local partial = ARGV[4] == '1'
+local interval = math.max(math.floor(period / limit), 1)
+
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000000 + tonumber(time[2])
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then
+    tat = now
+end
+
+local available = math.min(math.floor((now + period - tat) / interval), limit)
+local granted = cost
+if available < cost then
+    if not partial or available < 1 then
+        local needed = partial and 1 or cost
+        return {0, math.max(available, 0),
+                tat + interval * needed - period - now, tat - now}
+    end
+    granted = available
+end
+
+local new_tat = tat + interval * granted
+redis.call('SET', KEYS[1], string.format('%d', new_tat),
+           'PX', math.max(math.ceil((new_tat - now) / 1000), 1))
+return {granted, available - granted, 0, new_tat - now}
+"""
+
+
+class RateLimitResult(BaseModel):
+    """Outcome of a rate limit check."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float  # Seconds until the full quota is available again
+    retry_after: float  # Seconds until this request would be admitted
+    granted: int = 1  # Tokens granted; above 1 only for leases
+
+    @property
+    def reset_seconds(self) -> int:
+        """Reset time rounded up to whole seconds, for headers."""
+        return math.ceil(self.reset_after)
+
+    @property
+    def retry_after_seconds(self) -> int:
+        """Retry delay rounded up to whole seconds, for headers."""
+        return max(math.ceil(self.retry_after), 1)
+
+
+class RateLimiter:
+    """Atomic rate limiter deciding each request in one Redis round trip.
+
+    Each bucket allows ``limit`` requests per ``window`` seconds, refilling
+    continuously rather than resetting at fixed window boundaries.
+    """
+
+    def __init__(self, prefix: str = "rate_limit") -> None:
+        """Initialize rate limiter."""
+        self.prefix = prefix
+        self._client: Optional[Any] = None
+        self._script: Optional[Any] = None
+
+    async def _get_client(self) -> Any:
+        """Get Redis cache client."""
+        if self._client is None:
+            self._client = await RedisClient.get_cache_client()
+        return self._client
+
+    async def hit(
+        self,
+        key: str,
+        limit: int,
+        window: int,
+        cost: int = 1,
+        partial: bool = False,
+    ) -> Optional[RateLimitResult]:
+        """Consume ``cost`` from a bucket, or None if Redis is unavailable."""
+        try:
+            client = await self._get_client()
+            if self._script is None:
+                self._script = client.register_script(_GCRA_SCRIPT)
+            granted, remaining, retry_after, reset_after = await self._script(
+                keys=[f"{self.prefix}:{key}"],
+                args=[limit, window, cost, int(partial)],
+            )
+        except RedisError as e:
+            logger.warning("rate_limit_check_failed", error=str(e))
+            return None
+
+        return RateLimitResult(
+            allowed=int(granted) > 0,
+            limit=limit,
+            remaining=int(remaining),
+            reset_after=int(reset_after) / 1_000_000,
+            retry_after=int(retry_after) / 1_000_000,
+            granted=int(granted),
+        )
+
+
+class _Lease:
+    """Quota leased from a shared bucket into this process."""
+
+    __slots__ = ("tokens", "remaining", "reset_at", "retry_at")
+
+    def __init__(
+        self, tokens: int, remaining: int, reset_at: float, retry_at: float = 0.0
+    ) -> None:
+        """Initialize lease."""
+        self.tokens = tokens
+        self.remaining = remaining
+        self.reset_at = reset_at
+        self.retry_at = retry_at
+
+
+class HybridRateLimiter(RateLimiter):
+    """Rate limiter admitting most requests from locally leased quota.
+
+    Quota is leased from the shared GCRA bucket in blocks of
+    ``lease_fraction`` of the limit, so only one request per block pays a
+    Redis round trip. A lease lives only as long as the bucket takes to
+    refill it, which bounds how far global admissions can drift from the
+    limit to about one block per process. Rejections are also remembered
+    locally until their ``Retry-After`` elapses.
+    """
+
+    def __init__(
+        self,
+        lease_fraction: float = 0.1,
+        max_size: int = 10000,
+        prefix: str = "rate_limit",
+    ) -> None:
+        """Initialize hybrid rate limiter."""
+        super().__init__(prefix)
+        self.lease_fraction = lease_fraction
+        self._leases: TTLCache[str, _Lease] = TTLCache(max_size=max_size, ttl=math.inf)
+
+    async def hit(
+        self,
+        key: str,
+        limit: int,
+        window: int,
+        cost: int = 1,
+        partial: bool = False,
+    ) -> Optional[RateLimitResult]:
+        """Consume ``cost`` from local quota, leasing from Redis when needed."""
+        if cost != 1:
+            return await super().hit(key, limit, window, cost, partial)
+
+        now = time.monotonic()
+        lease = self._leases.get(key)
+        if lease is not None:
+            if lease.tokens > 0:
+                lease.tokens -= 1
+                return RateLimitResult(
+                    allowed=True,
+                    limit=limit,
+                    remaining=lease.remaining + lease.tokens,
+                    reset_after=max(lease.reset_at - now, 0),
+                    retry_after=0,
+                )
+            if lease.retry_at > now:
+                return RateLimitResult(
+                    allowed=False,
+                    limit=limit,
+                    remaining=0,
+                    reset_after=max(lease.reset_at - now, 0),
+                    retry_after=lease.retry_at - now,
+                )
+
+        block = max(int(limit * self.lease_fraction), 1)
+        result = await super().hit(key, limit, window, cost=block, partial=True)
+        if result is None:
+            return None
+
+        if not result.allowed:
+            self._leases.set(
+                key,
+                _Lease(0, 0, now + result.reset_after, now + result.retry_after),
+                ttl=result.retry_after,
+            )
+            return result
+
+        # Keep tokens a concurrent lease for the same key left behind
+        tokens = result.granted - 1
+        current = self._leases.get(key)
+        if current is not None:
+            tokens += current.tokens
+        self._leases.set(
+            key,
+            _Lease(tokens, result.remaining, now + result.reset_after),
+            ttl=result.granted * window / limit,
+        )
+        return result.model_copy(
+            update={"remaining": result.remaining + tokens, "granted": 1}
+        )
@@ -1,5 +1,7 @@
 """Redis client configuration."""
 
+import asyncio
+
 import redis.asyncio as aioredis
 from redis.asyncio import Redis
 
@@ -11,10 +13,12 @@ class RedisClient:
 
     _instance: Redis | None = None
     _cache_instance: Redis | None = None
+    _loop: asyncio.AbstractEventLoop | None = None
 
     @classmethod
     async def get_client(cls) -> Redis:
         """Get Redis client instance."""
+        cls._check_loop()
         if cls._instance is None:
             cls._instance = await aioredis.from_url(
                 settings.redis_url,
@@ -26,6 +30,7 @@ class RedisClient:
     @classmethod
     async def get_cache_client(cls) -> Redis:
         """Get Redis cache client instance."""
+        cls._check_loop()
         if cls._cache_instance is None:
             cls._cache_instance = await aioredis.from_url(
                 settings.redis_cache_url,
@@ -44,4 +49,15 @@ class RedisClient:
             await cls._cache_instance.close()
             cls._cache_instance = None
 
-
+    @classmethod
+    def _check_loop(cls) -> None:
+        """Drop clients that were created on another event loop.
+
+        Celery workers run every job in a fresh ``asyncio.run`` loop, and
+        redis connections cannot be reused once their loop is closed.
+        """
+        loop = asyncio.get_running_loop()
+        if cls._loop is not loop:
+            cls._instance = None
+            cls._cache_instance = None
+            cls._loop = loop
@@ -0,0 +1,178 @@
+"""Per-user task count cache."""
+
+import time
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+import structlog
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.domain.value_objects.task_status import TaskStatus
+from app.infrastructure.cache.redis_client import RedisClient
+
+logger = structlog.get_logger()
+
+# A missing list version is seeded from the clock in microseconds, so a
+# version that expired or was evicted never comes back with an old value.
+_GET_VERSION_SCRIPT = """
+local version = redis.call('GET', KEYS[1])
+if not version then
+    version = ARGV[1]
+    redis.call('SET', KEYS[1], version, 'EX', ARGV[2])
+end
+return version
+"""
+
+# Seed counts only if no adjust has run since the caller read the version
+# (the counts would miss it) and no other caller seeded them first.
+_SET_COUNTS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+if redis.call('GET', KEYS[2]) ~= ARGV[1] then
+    return 0
+end
+for i = 3, #ARGV, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+# Bump the list version, then apply deltas only to a seeded hash; a missing
+# hash is rebuilt from the database on the next read instead of starting
+# from a partial count.
+_ADJUST_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    redis.call('SET', KEYS[2], ARGV[1])
+end
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+for i = 3, #ARGV, 2 do
+    redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+return 1
+"""
+
+
+class TaskCountCache:
+    """Task counts per (user_id, status), maintained incrementally in Redis.
+
+    Alongside the counts, each user has a list version that every write to
+    their tasks bumps, so list responses can be validated without a query.
+    The cache is best-effort: Redis errors are logged and swallowed, reads
+    fall back to the database, and every hash expires after
+    ``task_count_cache_ttl`` seconds so any drift is bounded.
+    """
+
+    def __init__(self) -> None:
+        """Initialize task count cache."""
+        self._client: Optional[Any] = None
+        self._adjust_script: Optional[Any] = None
+        self._get_version_script: Optional[Any] = None
+        self._set_counts_script: Optional[Any] = None
+
+    async def _get_client(self) -> Any:
+        """Get Redis cache client."""
+        if self._client is None:
+            self._client = await RedisClient.get_cache_client()
+        return self._client
+
+    @staticmethod
+    def _key(user_id: UUID) -> str:
+        """Build cache key for a user."""
+        return f"task_counts:{user_id}"
+
+    @staticmethod
+    def _version_key(user_id: UUID) -> str:
+        """Build list version key for a user."""
+        return f"task_list_version:{user_id}"
+
+    @staticmethod
+    def _seed_version() -> int:
+        """Starting value for a list version that is not in Redis."""
+        return time.time_ns() // 1000
+
+    async def get_counts(self, user_id: UUID) -> Optional[Dict[TaskStatus, int]]:
+        """Get cached counts for a user, or None if they are not cached."""
+        try:
+            client = await self._get_client()
+            values = await client.hgetall(self._key(user_id))
+        except RedisError as e:
+            logger.warning("task_count_cache_read_failed", error=str(e))
+            return None
+
+        if not values:
+            return None
+        return {
+            status: max(int(values.get(status.value, 0)), 0) for status in TaskStatus
+        }
+
+    async def set_counts(
+        self, user_id: UUID, counts: Dict[TaskStatus, int], version: int
+    ) -> None:
+        """Seed cached counts for a user from an exact count.
+
+        ``version`` is the list version read before counting; the counts are
+        dropped if a write has bumped it since, as they may not include it.
+        """
+        args: list[Any] = [version, settings.task_count_cache_ttl]
+        for status in TaskStatus:
+            args.extend([status.value, counts.get(status, 0)])
+        try:
+            client = await self._get_client()
+            if self._set_counts_script is None:
+                self._set_counts_script = client.register_script(_SET_COUNTS_SCRIPT)
+            await self._set_counts_script(
+                keys=[self._key(user_id), self._version_key(user_id)], args=args
+            )
+        except RedisError as e:
+            logger.warning("task_count_cache_write_failed", error=str(e))
+
+    async def get_version(self, user_id: UUID) -> Optional[int]:
+        """Get the version of a user's task list, or None if Redis fails."""
+        try:
+            client = await self._get_client()
+            if self._get_version_script is None:
+                self._get_version_script = client.register_script(_GET_VERSION_SCRIPT)
+            version = await self._get_version_script(
+                keys=[self._version_key(user_id)],
+                args=[self._seed_version(), settings.task_count_cache_ttl],
+            )
+        except RedisError as e:
+            logger.warning("task_count_cache_read_failed", error=str(e))
+            return None
+        return int(version)
+
+    async def adjust(self, user_id: UUID, deltas: Dict[TaskStatus, int]) -> None:
+        """Bump a user's list version and apply count deltas if cached.
+
+        Called after every write to the user's tasks; ``deltas`` is empty
+        when the write did not move tasks between statuses.
+        """
+        args: list[Any] = [self._seed_version(), settings.task_count_cache_ttl]
+        for status, delta in deltas.items():
+            if delta:
+                args.extend([status.value, delta])
+
+        try:
+            client = await self._get_client()
+            if self._adjust_script is None:
+                self._adjust_script = client.register_script(_ADJUST_SCRIPT)
+            await self._adjust_script(
+                keys=[self._key(user_id), self._version_key(user_id)], args=args
+            )
+        except RedisError as e:
+            logger.warning("task_count_cache_write_failed", error=str(e))
+
+    async def invalidate(self, user_id: UUID) -> None:
+        """Drop cached counts for a user."""
+        try:
+            client = await self._get_client()
+            await client.delete(self._key(user_id))
+        except RedisError as e:
+            logger.warning("task_count_cache_write_failed", error=str(e))
@@ -0,0 +1,106 @@
+"""Task import job store."""
+
+from typing import Any, List, Optional
+from uuid import UUID
+
+import structlog
+from pydantic import ValidationError
+from redis.exceptions import RedisError
+
+from app.application.dto.task_dto import TaskImportJobDTO, TaskImportStatus
+from app.config import settings
+from app.infrastructure.cache.redis_client import RedisClient
+
+logger = structlog.get_logger()
+
+# Set of the IDs of jobs that have not finished yet
+_ACTIVE_KEY = "task_import:active"
+
+
+class TaskImportJobStore:
+    """Task import jobs, kept in Redis while they run and for a while after.
+
+    The import runner saves a job after every chunk, so polling clients see
+    its progress; a job expires ``task_import_job_ttl`` seconds after its
+    last save. Unfinished jobs are also tracked in a set, so that jobs
+    orphaned by a worker crash can be found.
+    """
+
+    def __init__(self) -> None:
+        """Initialize task import job store."""
+        self._client: Optional[Any] = None
+
+    async def _get_client(self) -> Any:
+        """Get Redis cache client."""
+        if self._client is None:
+            self._client = await RedisClient.get_cache_client()
+        return self._client
+
+    @staticmethod
+    def _key(job_id: UUID) -> str:
+        """Build cache key for a job."""
+        return f"task_import:{job_id}"
+
+    async def get(self, job_id: UUID) -> Optional[TaskImportJobDTO]:
+        """Get a job, or None if unknown, expired or unreadable."""
+        try:
+            client = await self._get_client()
+            data = await client.get(self._key(job_id))
+        except RedisError as e:
+            logger.warning("task_import_store_read_failed", error=str(e))
+            return None
+
+        if data is None:
+            return None
+        try:
+            return TaskImportJobDTO.model_validate_json(data)
+        except ValidationError:
+            return None
+
+    async def save(self, job: TaskImportJobDTO) -> None:
+        """Save a job."""
+        finished = job.status in (TaskImportStatus.COMPLETED, TaskImportStatus.FAILED)
+        try:
+            client = await self._get_client()
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.set(
+                    self._key(job.id),
+                    job.model_dump_json(),
+                    ex=settings.task_import_job_ttl,
+                )
+                if finished:
+                    pipe.srem(_ACTIVE_KEY, str(job.id))
+                else:
+                    pipe.sadd(_ACTIVE_KEY, str(job.id))
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning("task_import_store_write_failed", error=str(e))
+
+    async def list_active(self) -> List[TaskImportJobDTO]:
+        """List jobs that have not finished, forgetting expired ones."""
+        try:
+            client = await self._get_client()
+            job_ids = list(await client.smembers(_ACTIVE_KEY))
+            if not job_ids:
+                return []
+            values = await client.mget([self._key(job_id) for job_id in job_ids])
+            expired = [
+                job_id
+                for job_id, data in zip(job_ids, values, strict=True)
+                if data is None
+            ]
+            if expired:
+                await client.srem(_ACTIVE_KEY, *expired)
+        except RedisError as e:
+            logger.warning("task_import_store_read_failed", error=str(e))
+            return []
+
+        jobs = []
+        for data in values:
+            if data is None:
+                continue
+            try:
+                jobs.append(TaskImportJobDTO.model_validate_json(data))
+            except ValidationError:
+                continue
+        return jobs
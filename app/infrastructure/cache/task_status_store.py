@@ -0,0 +1,142 @@
+"""Live task status store."""
+
+from datetime import timezone
+from typing import Any, List, Optional, Sequence
+from uuid import UUID
+
+import structlog
+from pydantic import ValidationError
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.domain.entities.task import Task
+from app.domain.value_objects.task_status import TERMINAL_TASK_STATUSES
+from app.infrastructure.cache.redis_client import RedisClient
+
+logger = structlog.get_logger()
+
+# Write a task snapshot unless the stored one must win: a terminal status is
+# never replaced by a non-terminal one, and a newer snapshot is never
+# replaced by an older one. ARGV: status, updated_at (us), data, ttl,
+# followed by the terminal statuses.
+_SET_SCRIPT = """
+local current = redis.call('HMGET', KEYS[1], 'status', 'updated_at')
+if current[1] then
+    local terminal = {}
+    for i = 5, #ARGV do
+        terminal[ARGV[i]] = true
+    end
+    if terminal[current[1]] and not terminal[ARGV[1]] then
+        return 0
+    end
+    if tonumber(current[2]) > tonumber(ARGV[2]) then
+        return 0
+    end
+end
+redis.call('HSET', KEYS[1], 'status', ARGV[1], 'updated_at', ARGV[2], 'data', ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+
+_TERMINAL_STATUS_VALUES = [status.value for status in TERMINAL_TASK_STATUSES]
+
+
+class TaskStatusStore:
+    """Snapshots of recently written tasks, kept in a Redis hash per task.
+
+    Writers (task creation, cancellation, updates and the workers) write
+    through after Postgres commits; task reads try the store first and fall
+    back to Postgres on a miss. In-flight tasks live for
+    ``task_status_ttl`` seconds, finished ones for the shorter
+    ``task_status_terminal_ttl``, after which Postgres serves them again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize task status store."""
+        self._client: Optional[Any] = None
+        self._set_script: Optional[Any] = None
+
+    async def _get_client(self) -> Any:
+        """Get Redis cache client."""
+        if self._client is None:
+            self._client = await RedisClient.get_cache_client()
+        return self._client
+
+    @staticmethod
+    def _key(task_id: UUID) -> str:
+        """Build cache key for a task."""
+        return f"task_status:{task_id}"
+
+    @staticmethod
+    def _args(task: Task) -> List[Any]:
+        """Build script arguments for a task snapshot."""
+        updated_at = task.updated_at.replace(tzinfo=timezone.utc)
+        ttl = (
+            settings.task_status_terminal_ttl
+            if task.status in TERMINAL_TASK_STATUSES
+            else settings.task_status_ttl
+        )
+        return [
+            task.status.value,
+            int(updated_at.timestamp() * 1_000_000),
+            task.model_dump_json(),
+            ttl,
+            *_TERMINAL_STATUS_VALUES,
+        ]
+
+    async def get(self, task_id: UUID) -> Optional[Task]:
+        """Get a task snapshot, or None if it is not stored."""
+        try:
+            client = await self._get_client()
+            data = await client.hget(self._key(task_id), "data")
+        except RedisError as e:
+            logger.warning("task_status_store_read_failed", error=str(e))
+            return None
+
+        if not data:
+            return None
+        try:
+            return Task.model_validate_json(data)
+        except ValidationError:
+            return None
+
+    async def set(self, task: Task) -> None:
+        """Write a task snapshot, subject to the ordering rules."""
+        await self.set_many([task])
+
+    async def set_many(self, tasks: List[Task]) -> None:
+        """Write several task snapshots in one round trip."""
+        if not tasks:
+            return
+
+        try:
+            client = await self._get_client()
+            if self._set_script is None:
+                self._set_script = client.register_script(_SET_SCRIPT)
+            async with client.pipeline(transaction=False) as pipe:
+                for task in tasks:
+                    await self._set_script(
+                        keys=[self._key(task.id)], args=self._args(task), client=pipe
+                    )
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning("task_status_store_write_failed", error=str(e))
+
+    async def invalidate(self, task_id: UUID) -> None:
+        """Drop a task snapshot."""
+        try:
+            client = await self._get_client()
+            await client.delete(self._key(task_id))
+        except RedisError as e:
+            logger.warning("task_status_store_write_failed", error=str(e))
+
+    async def invalidate_many(self, task_ids: Sequence[UUID]) -> None:
+        """Drop several task snapshots in one round trip."""
+        if not task_ids:
+            return
+
+        try:
+            client = await self._get_client()
+            await client.delete(*(self._key(task_id) for task_id in task_ids))
+        except RedisError as e:
+            logger.warning("task_status_store_write_failed", error=str(e))
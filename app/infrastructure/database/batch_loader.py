@@ -0,0 +1,92 @@
+"""Request-coalescing batch loader."""
+
+import asyncio
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """Coalesces single-key lookups from concurrent coroutines into batches.
+
+    Keys requested within ``delay`` seconds of the first one are fetched
+    together with a single call to ``fetch``, which returns the values it
+    found by key; missing keys resolve to None. A key already queued or
+    being fetched is not requested again, so concurrent callers share one
+    result. A batch is sent early once it holds ``max_batch_size`` keys.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        delay: float = 0.001,
+        max_batch_size: int = 500,
+    ) -> None:
+        """Initialize batch loader."""
+        self.fetch = fetch
+        self.delay = delay
+        self.max_batch_size = max_batch_size
+        self._futures: Dict[K, asyncio.Future] = {}
+        self._batch: List[K] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._fetches: Set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        """Load the value for a key, or None if it does not exist."""
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            self._batch.append(key)
+            if len(self._batch) >= self.max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.delay, self._dispatch)
+
+        # One caller giving up must not cancel the lookup for the others
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        """Start fetching the pending batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._batch = self._batch, []
+        if batch:
+            fetch = asyncio.create_task(self._fetch_batch(batch))
+            self._fetches.add(fetch)
+            fetch.add_done_callback(self._fetches.discard)
+
+    async def _fetch_batch(self, keys: List[K]) -> None:
+        """Fetch a batch and resolve its callers."""
+        try:
+            values = await self.fetch(keys)
+        except asyncio.CancelledError:
+            for key in keys:
+                self._futures.pop(key).cancel()
+            raise
+        except Exception as e:
+            for key in keys:
+                future = self._futures.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+                    # Retrieved here so an abandoned lookup is not reported
+                    future.exception()
+            return
+
+        for key in keys:
+            future = self._futures.pop(key)
+            if not future.done():
+                future.set_result(values.get(key))
@@ -0,0 +1,40 @@
+"""Process-wide batch loaders for lookups by primary key."""
+
+from typing import Dict, List
+from uuid import UUID
+
+from app.config import settings
+from app.domain.entities.task import Task
+from app.domain.entities.user import User
+from app.infrastructure.database.base import AsyncSessionLocal
+from app.infrastructure.database.batch_loader import BatchLoader
+from app.infrastructure.database.repositories.task_repository import TaskRepository
+from app.infrastructure.database.repositories.user_repository import UserRepository
+
+
+async def _fetch_tasks(task_ids: List[UUID]) -> Dict[UUID, Task]:
+    """Fetch a batch of tasks on a session of its own."""
+    async with AsyncSessionLocal() as session:
+        tasks = await TaskRepository(session).get_many(task_ids)
+    return {task.id: task for task in tasks}
+
+
+async def _fetch_users(user_ids: List[UUID]) -> Dict[UUID, User]:
+    """Fetch a batch of users on a session of its own."""
+    async with AsyncSessionLocal() as session:
+        users = await UserRepository(session).get_many(user_ids)
+    return {user.id: user for user in users}
+
+
+# Shared by every request in the process, so lookups of the same rows from
+# concurrent requests become one query
+task_loader: BatchLoader[UUID, Task] = BatchLoader(
+    _fetch_tasks,
+    delay=settings.batch_load_delay,
+    max_batch_size=settings.batch_load_max_size,
+)
+user_loader: BatchLoader[UUID, User] = BatchLoader(
+    _fetch_users,
+    delay=settings.batch_load_delay,
+    max_batch_size=settings.batch_load_max_size,
+)
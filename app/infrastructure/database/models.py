@@ -4,12 +4,27 @@ from datetime import datetime
 from typing import Any, Dict
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Boolean, DateTime, Enum, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.infrastructure.database.base import Base
-from app.domain.value_objects.task_status import TaskStatus, TaskPriority, TaskType
+from app.domain.value_objects.task_status import (
+    ACTIVE_TASK_STATUSES,
+    TaskStatus,
+    TaskPriority,
+    TaskType,
+)
 
 
 class UserModel(Base):
@@ -56,11 +71,11 @@ class TaskModel(Base):
         default=TaskPriority.MEDIUM,
         nullable=False,
     )
-    user_id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True), nullable=False, index=True
-    )
+    user_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), nullable=False)
     parameters: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
     result: Mapped[Dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    result_ref: Mapped[str | None] = mapped_column(String(71), nullable=True)
+    result_size: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     retry_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     max_retries: Mapped[int] = mapped_column(Integer, default=3, nullable=False)
@@ -74,3 +89,25 @@ class TaskModel(Base):
     )
 
 
+# A user's task pages, newest first, and exports, read backwards
+Index(
+    "ix_tasks_user_created",
+    TaskModel.user_id,
+    TaskModel.created_at.desc(),
+    TaskModel.id.desc(),
+)
+# The same, filtered by status; also serves per-status counts
+Index(
+    "ix_tasks_user_status_created",
+    TaskModel.user_id,
+    TaskModel.status,
+    TaskModel.created_at.desc(),
+    TaskModel.id.desc(),
+)
+# A user's unfinished tasks, a small fraction of the table
+Index(
+    "ix_tasks_active_user",
+    TaskModel.user_id,
+    TaskModel.created_at,
+    postgresql_where=TaskModel.status.in_(sorted(ACTIVE_TASK_STATUSES)),
+)
@@ -1,56 +1,180 @@
 """Task repository implementation."""
 
-from typing import List, Optional
+import json
+from datetime import datetime
+from enum import Enum
+from typing import (
+    AbstractSet,
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from uuid import UUID
 
-from sqlalchemy import select, func
+import orjson
+from sqlalchemy import (
+    BindParameter,
+    ColumnElement,
+    Row,
+    Select,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.domain.entities.task import Task
-from app.domain.value_objects.task_status import TaskStatus
+from app.domain.value_objects.cursor import TaskCursor
+from app.domain.value_objects.task_status import (
+    ACTIVE_TASK_STATUSES,
+    TaskStatus,
+    TaskType,
+)
 from app.application.interfaces.task_repository import ITaskRepository
+from app.infrastructure.database.batch_loader import BatchLoader
 from app.infrastructure.database.models import TaskModel
 
 
+# Columns loaded even for sparse fieldsets: identity, ownership, cursor, ETag
+_ALWAYS_LOADED_COLUMNS = frozenset({"id", "user_id", "created_at", "updated_at"})
+
+
 class TaskRepository(ITaskRepository):
     """Task repository implementation."""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        loader: Optional[BatchLoader[UUID, Task]] = None,
+    ) -> None:
         """Initialize repository."""
         self.session = session
+        self.loader = loader
 
     async def create(self, task: Task) -> Task:
         """Create a new task."""
-        task_model = TaskModel(
-            id=task.id,
-            name=task.name,
-            description=task.description,
-            task_type=task.task_type,
-            status=task.status,
-            priority=task.priority,
-            user_id=task.user_id,
-            parameters=task.parameters,
-            result=task.result,
-            error_message=task.error_message,
-            retry_count=task.retry_count,
-            max_retries=task.max_retries,
-            started_at=task.started_at,
-            completed_at=task.completed_at,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-        )
+        task_model = TaskModel(**self._to_row(task))
         self.session.add(task_model)
         await self.session.commit()
         await self.session.refresh(task_model)
         return self._to_entity(task_model)
 
-    async def get_by_id(self, task_id: UUID) -> Optional[Task]:
-        """Get task by ID."""
-        result = await self.session.execute(
-            select(TaskModel).where(TaskModel.id == task_id)
+    async def create_many(self, tasks: List[Task]) -> List[Task]:
+        """Create several tasks in a single transaction.
+
+        Rows go through SQLAlchemy's bulk ``insert()`` path instead of flushing
+        one ORM object at a time. The ``RETURNING`` clause is what makes it use
+        "insertmanyvalues", sending multi-row ``INSERT ... VALUES`` statements
+        of up to 1000 rows each; without it asyncpg gets an executemany of
+        single-row inserts. Entities already carry every column value, so they
+        are returned as-is without a refresh round trip.
+        """
+        if not tasks:
+            return []
+
+        await self.session.execute(
+            insert(TaskModel).returning(TaskModel.id),
+            [self._to_row(task) for task in tasks],
+        )
+        await self.session.commit()
+        return tasks
+
+    async def copy_many(self, tasks: List[Task]) -> int:
+        """Load tasks with the PostgreSQL COPY protocol and return the count.
+
+        For large loads COPY avoids the per-statement parsing and parameter
+        limits of ``INSERT``. It goes through the raw asyncpg connection, so
+        values are encoded the way the column types expect: enums by name,
+        as SQLAlchemy stores them, and JSON as text.
+        """
+        if not tasks:
+            return 0
+
+        columns = [column.name for column in TaskModel.__table__.columns]
+        records = []
+        for task in tasks:
+            row = self._to_row(task)
+            for name, value in row.items():
+                if isinstance(value, Enum):
+                    row[name] = value.name
+                elif isinstance(value, dict):
+                    row[name] = orjson.dumps(value).decode()
+            records.append(tuple(row[name] for name in columns))
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if driver_connection is None:
+            raise RuntimeError("Database connection was invalidated")
+        await driver_connection.copy_records_to_table(
+            TaskModel.__tablename__, columns=columns, records=records
         )
+        await self.session.commit()
+        return len(records)
+
+    async def get_by_id(
+        self,
+        task_id: UUID,
+        fields: Optional[AbstractSet[str]] = None,
+        for_update: bool = False,
+    ) -> Optional[Task]:
+        """Get task by ID, loading only ``fields`` when given.
+
+        Whole-row lookups go through the batch loader when there is one; the
+        returned task is a copy, since the loader shares one result among
+        concurrent callers. The loader reads on its own session and may hand
+        out a result fetched before a write, so ``for_update`` bypasses it and
+        reads with ``SELECT ... FOR UPDATE`` in this session: the row stays
+        locked until ``update`` or ``delete`` commits.
+        """
+        if self.loader is not None and fields is None and not for_update:
+            task = await self.loader.load(task_id)
+            return task.model_copy(deep=True) if task else None
+
+        query = self._select(fields).where(TaskModel.id == task_id)
+        if for_update:
+            query = query.with_for_update()
+        result = await self.session.execute(query)
         task_model = result.scalar_one_or_none()
-        return self._to_entity(task_model) if task_model else None
+        return self._to_entity(task_model, fields) if task_model else None
+
+    async def get_many(
+        self,
+        task_ids: Sequence[UUID],
+        user_id: Optional[UUID] = None,
+        fields: Optional[AbstractSet[str]] = None,
+    ) -> List[Task]:
+        """Get the tasks among ``task_ids``, of one user if given, in one query.
+
+        The ids are bound as a single array parameter (``id = ANY(:ids)``)
+        rather than one parameter each, so the statement text is the same for
+        every batch size. Ids that do not exist or belong to another user are
+        simply absent from the result.
+        """
+        if not task_ids:
+            return []
+
+        ids = bindparam("ids", list(task_ids), type_=ARRAY(PGUUID(as_uuid=True)))
+        query = self._select(fields).where(TaskModel.id == any_(ids))
+        if user_id is not None:
+            query = query.where(TaskModel.user_id == user_id)
+        result = await self.session.execute(query)
+        task_models = result.scalars().all()
+        return [self._to_entity(task_model, fields) for task_model in task_models]
 
     async def get_by_user_id(
         self,
@@ -58,18 +182,68 @@ class TaskRepository(ITaskRepository):
         skip: int = 0,
         limit: int = 100,
         status: Optional[TaskStatus] = None,
+        cursor: Optional[TaskCursor] = None,
+        fields: Optional[AbstractSet[str]] = None,
     ) -> List[Task]:
-        """Get tasks by user ID with pagination."""
-        query = select(TaskModel).where(TaskModel.user_id == user_id)
+        """Get tasks by user ID with offset or keyset pagination.
+
+        When a cursor is given, rows are located with a ``(created_at, id)``
+        row comparison instead of an offset, so the cost of a page does not
+        grow with its depth. With ``fields``, the other columns are left out
+        of the ``SELECT``.
+        """
+        query = self._select(fields).where(TaskModel.user_id == user_id)
 
         if status:
             query = query.where(TaskModel.status == status)
 
-        query = query.order_by(TaskModel.created_at.desc()).offset(skip).limit(limit)
+        if cursor:
+            query = query.where(
+                tuple_(TaskModel.created_at, TaskModel.id)
+                < tuple_(
+                    literal(cursor.created_at, TaskModel.created_at.type),
+                    literal(cursor.id, TaskModel.id.type),
+                )
+            )
+
+        query = (
+            query.order_by(TaskModel.created_at.desc(), TaskModel.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
 
         result = await self.session.execute(query)
         task_models = result.scalars().all()
-        return [self._to_entity(task_model) for task_model in task_models]
+        return [self._to_entity(task_model, fields) for task_model in task_models]
+
+    async def stream_by_user_id(
+        self,
+        user_id: UUID,
+        status: Optional[TaskStatus] = None,
+        fields: Optional[AbstractSet[str]] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Task]:
+        """Stream all of a user's tasks, oldest first, in constant memory.
+
+        Rows come from a server-side cursor ``batch_size`` at a time
+        (``yield_per``) and are selected as plain columns rather than ORM
+        objects, so nothing accumulates in the session while the export runs.
+        """
+        columns = [
+            column
+            for column in TaskModel.__table__.columns
+            if fields is None or column.name in fields | _ALWAYS_LOADED_COLUMNS
+        ]
+        query = select(*columns).where(TaskModel.user_id == user_id)
+        if status:
+            query = query.where(TaskModel.status == status)
+        query = query.order_by(TaskModel.created_at, TaskModel.id).execution_options(
+            yield_per=batch_size
+        )
+
+        result = await self.session.stream(query)
+        async for row in result:
+            yield self._to_entity(row, fields)
 
     async def update(self, task: Task) -> Task:
         """Update task."""
@@ -87,6 +261,8 @@ class TaskRepository(ITaskRepository):
         task_model.priority = task.priority
         task_model.parameters = task.parameters
         task_model.result = task.result
+        task_model.result_ref = task.result_ref
+        task_model.result_size = task.result_size
         task_model.error_message = task.error_message
         task_model.retry_count = task.retry_count
         task_model.max_retries = task.max_retries
@@ -111,6 +287,81 @@ class TaskRepository(ITaskRepository):
         await self.session.commit()
         return True
 
+    async def cancel_many(
+        self,
+        user_id: UUID,
+        task_ids: Optional[Sequence[UUID]] = None,
+        status: Optional[TaskStatus] = None,
+        task_type: Optional[TaskType] = None,
+        created_before: Optional[datetime] = None,
+        limit: int = 1000,
+    ) -> List[Tuple[Task, TaskStatus]]:
+        """Cancel up to ``limit`` matching unfinished tasks in one statement.
+
+        Runs ``WITH batch AS (SELECT ... LIMIT ... FOR UPDATE) UPDATE tasks
+        ... FROM batch RETURNING``, which locks the batch so the previous
+        statuses returned alongside the cancelled tasks stay accurate, and
+        commits it on its own. Cancelled tasks no longer match, so callers
+        repeat until a batch comes back short.
+        """
+        batch = (
+            select(TaskModel.id, TaskModel.status)
+            .where(
+                *self._bulk_filter(
+                    user_id, task_ids, status, task_type, created_before
+                ),
+                self._is_active(),
+            )
+            .limit(limit)
+            .with_for_update()
+            .cte("batch")
+        )
+        result = await self.session.execute(
+            update(TaskModel)
+            .where(TaskModel.id == batch.c.id)
+            .values(status=TaskStatus.CANCELLED, updated_at=datetime.utcnow())
+            .returning(
+                *TaskModel.__table__.columns, batch.c.status.label("previous_status")
+            )
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        await self.session.commit()
+        return [(self._to_entity(row), row.previous_status) for row in rows]
+
+    async def delete_many(
+        self,
+        user_id: UUID,
+        task_ids: Optional[Sequence[UUID]] = None,
+        status: Optional[TaskStatus] = None,
+        task_type: Optional[TaskType] = None,
+        created_before: Optional[datetime] = None,
+        limit: int = 1000,
+    ) -> List[Tuple[UUID, TaskStatus]]:
+        """Delete up to ``limit`` matching tasks in one statement.
+
+        The batch is deleted with ``DELETE ... WHERE id IN (SELECT ... LIMIT
+        ... FOR UPDATE) RETURNING id, status`` and committed on its own;
+        callers repeat until a batch comes back short.
+        """
+        batch = (
+            select(TaskModel.id)
+            .where(
+                *self._bulk_filter(user_id, task_ids, status, task_type, created_before)
+            )
+            .limit(limit)
+            .with_for_update()
+        )
+        result = await self.session.execute(
+            delete(TaskModel)
+            .where(TaskModel.id.in_(batch))
+            .returning(TaskModel.id, TaskModel.status)
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        await self.session.commit()
+        return [(row.id, row.status) for row in rows]
+
     async def count_by_user_id(
         self, user_id: UUID, status: Optional[TaskStatus] = None
     ) -> int:
@@ -125,9 +376,139 @@ class TaskRepository(ITaskRepository):
         result = await self.session.execute(query)
         return result.scalar() or 0
 
-    def _to_entity(self, task_model: TaskModel) -> Task:
-        """Convert model to entity."""
-        return Task(
+    async def count_by_status(self, user_id: UUID) -> Dict[TaskStatus, int]:
+        """Count tasks by user ID, grouped by status."""
+        result = await self.session.execute(
+            select(TaskModel.status, func.count())
+            .where(TaskModel.user_id == user_id)
+            .group_by(TaskModel.status)
+        )
+        return dict(result.tuples().all())
+
+    async def estimate_count_by_user_id(
+        self, user_id: UUID, status: Optional[TaskStatus] = None
+    ) -> int:
+        """Estimate task count by user ID from the planner's row estimate."""
+        query = "EXPLAIN (FORMAT JSON) SELECT 1 FROM tasks WHERE user_id = :user_id"
+        params: Dict[str, Any] = {"user_id": user_id}
+        if status:
+            query += " AND status = :status"
+            params["status"] = status.name
+
+        result = await self.session.execute(text(query), params)
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def get_version(self, task_id: UUID) -> Optional[Tuple[UUID, datetime]]:
+        """Get a task's owner and last update time without loading the row."""
+        result = await self.session.execute(
+            select(TaskModel.user_id, TaskModel.updated_at).where(
+                TaskModel.id == task_id
+            )
+        )
+        row = result.one_or_none()
+        return (row.user_id, row.updated_at) if row else None
+
+    async def release_connection(self) -> None:
+        """Release the database connection held by the repository.
+
+        The session stays usable and checks out a new connection on its next
+        query, so long waits do not pin a pool slot.
+        """
+        await self.session.close()
+
+    def _to_row(self, task: Task) -> Dict[str, Any]:
+        """Convert entity to column values."""
+        return {
+            "id": task.id,
+            "name": task.name,
+            "description": task.description,
+            "task_type": task.task_type,
+            "status": task.status,
+            "priority": task.priority,
+            "user_id": task.user_id,
+            "parameters": task.parameters,
+            "result": task.result,
+            "result_ref": task.result_ref,
+            "result_size": task.result_size,
+            "error_message": task.error_message,
+            "retry_count": task.retry_count,
+            "max_retries": task.max_retries,
+            "started_at": task.started_at,
+            "completed_at": task.completed_at,
+            "created_at": task.created_at,
+            "updated_at": task.updated_at,
+        }
+
+    @staticmethod
+    def _is_active() -> ColumnElement[bool]:
+        """Match unfinished tasks in the terms of the partial index predicate.
+
+        The statuses are rendered inline rather than bound, so the planner
+        can prove the query implies ``ix_tasks_active_user``'s predicate
+        even when a prepared statement switches to a generic plan.
+        """
+        statuses: BindParameter[List[TaskStatus]] = bindparam(
+            "active_statuses",
+            sorted(ACTIVE_TASK_STATUSES),
+            expanding=True,
+            literal_execute=True,
+        )
+        return TaskModel.status.in_(statuses)
+
+    @staticmethod
+    def _bulk_filter(
+        user_id: UUID,
+        task_ids: Optional[Sequence[UUID]],
+        status: Optional[TaskStatus],
+        task_type: Optional[TaskType],
+        created_before: Optional[datetime],
+    ) -> List[ColumnElement[bool]]:
+        """Build the conditions selecting a user's tasks for a bulk operation."""
+        conditions = [TaskModel.user_id == user_id]
+        if task_ids is not None:
+            ids = bindparam("ids", list(task_ids), type_=ARRAY(PGUUID(as_uuid=True)))
+            conditions.append(TaskModel.id == any_(ids))
+        if status:
+            conditions.append(TaskModel.status == status)
+        if task_type:
+            conditions.append(TaskModel.task_type == task_type)
+        if created_before:
+            conditions.append(TaskModel.created_at < created_before)
+        return conditions
+
+    def _select(self, fields: Optional[AbstractSet[str]] = None) -> Select:
+        """Select tasks, deferring every column outside ``fields``."""
+        query = select(TaskModel)
+        if fields is not None:
+            columns = fields | _ALWAYS_LOADED_COLUMNS
+            query = query.options(
+                load_only(*(getattr(TaskModel, column) for column in columns))
+            )
+        return query
+
+    def _to_entity(
+        self,
+        task_model: Union[TaskModel, Row[Any]],
+        fields: Optional[AbstractSet[str]] = None,
+    ) -> Task:
+        """Convert model, or a row of its columns, to entity.
+
+        Rows are trusted, already typed by their columns, so the entity is
+        constructed without running validation. With ``fields``, deferred
+        columns are not touched and are set to None on the entity.
+        """
+        if fields is not None:
+            columns = fields | _ALWAYS_LOADED_COLUMNS
+            return Task.model_construct(
+                **{
+                    column: getattr(task_model, column) if column in columns else None
+                    for column in Task.model_fields
+                }
+            )
+        return Task.model_construct(
             id=task_model.id,
             name=task_model.name,
             description=task_model.description,
@@ -137,6 +518,8 @@ class TaskRepository(ITaskRepository):
             user_id=task_model.user_id,
             parameters=task_model.parameters,
             result=task_model.result,
+            result_ref=task_model.result_ref,
+            result_size=task_model.result_size,
             error_message=task_model.error_message,
             retry_count=task_model.retry_count,
             max_retries=task_model.max_retries,
@@ -1,22 +1,29 @@
 """User repository implementation."""
 
-from typing import Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.user import User
 from app.application.interfaces.user_repository import IUserRepository
+from app.infrastructure.database.batch_loader import BatchLoader
 from app.infrastructure.database.models import UserModel
 
 
 class UserRepository(IUserRepository):
     """User repository implementation."""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        loader: Optional[BatchLoader[UUID, User]] = None,
+    ) -> None:
         """Initialize repository."""
         self.session = session
+        self.loader = loader
 
     async def create(self, user: User) -> User:
         """Create a new user."""
@@ -37,14 +44,36 @@ class UserRepository(IUserRepository):
         await self.session.refresh(user_model)
         return self._to_entity(user_model)
 
-    async def get_by_id(self, user_id: UUID) -> Optional[User]:
-        """Get user by ID."""
-        result = await self.session.execute(
-            select(UserModel).where(UserModel.id == user_id)
-        )
+    async def get_by_id(
+        self, user_id: UUID, for_update: bool = False
+    ) -> Optional[User]:
+        """Get user by ID, through the batch loader when there is one.
+
+        ``for_update`` bypasses the loader, whose result may predate a write,
+        and locks the row in this session until ``update`` commits.
+        """
+        if self.loader is not None and not for_update:
+            user = await self.loader.load(user_id)
+            return user.model_copy(deep=True) if user else None
+
+        query = select(UserModel).where(UserModel.id == user_id)
+        if for_update:
+            query = query.with_for_update()
+        result = await self.session.execute(query)
         user_model = result.scalar_one_or_none()
         return self._to_entity(user_model) if user_model else None
 
+    async def get_many(self, user_ids: Sequence[UUID]) -> List[User]:
+        """Get the users among ``user_ids`` in one ``id = ANY(:ids)`` query."""
+        if not user_ids:
+            return []
+
+        ids = bindparam("ids", list(user_ids), type_=ARRAY(PGUUID(as_uuid=True)))
+        result = await self.session.execute(
+            select(UserModel).where(UserModel.id == any_(ids))
+        )
+        return [self._to_entity(user_model) for user_model in result.scalars()]
+
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
         result = await self.session.execute(
@@ -97,8 +126,8 @@ class UserRepository(IUserRepository):
         return True
 
     def _to_entity(self, user_model: UserModel) -> User:
-        """Convert model to entity."""
-        return User(
+        """Convert model to entity, skipping validation of trusted rows."""
+        return User.model_construct(
             id=user_model.id,
             email=user_model.email,
             username=user_model.username,
@@ -0,0 +1 @@
+"""Event infrastructure."""
@@ -0,0 +1,171 @@
+"""Task status events over Redis pub/sub."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Set,
+)
+from uuid import UUID
+
+import structlog
+from pydantic import ValidationError
+from redis.exceptions import RedisError
+
+from app.application.dto.task_dto import TaskEventDTO
+from app.config import settings
+from app.domain.entities.task import Task
+from app.infrastructure.cache.redis_client import RedisClient
+
+logger = structlog.get_logger()
+
+TASK_EVENTS_CHANNEL = "task_events"
+
+
+class TaskEventPublisher:
+    """Publishes task status transitions to Redis pub/sub.
+
+    Publishing is best-effort: events are a latency optimisation for
+    clients, while the database stays the source of truth.
+    """
+
+    def __init__(self) -> None:
+        """Initialize task event publisher."""
+        self._client: Optional[Any] = None
+
+    async def _get_client(self) -> Any:
+        """Get Redis client."""
+        if self._client is None:
+            self._client = await RedisClient.get_client()
+        return self._client
+
+    async def publish(self, task: Task) -> None:
+        """Publish the current status of a task."""
+        try:
+            client = await self._get_client()
+            await client.publish(TASK_EVENTS_CHANNEL, self._event_json(task))
+        except RedisError as e:
+            logger.warning("task_event_publish_failed", error=str(e))
+
+    async def publish_many(self, tasks: List[Task]) -> None:
+        """Publish the current status of several tasks in one round trip."""
+        if not tasks:
+            return
+
+        try:
+            client = await self._get_client()
+            async with client.pipeline(transaction=False) as pipe:
+                for task in tasks:
+                    pipe.publish(TASK_EVENTS_CHANNEL, self._event_json(task))
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning("task_event_publish_failed", error=str(e))
+
+    @staticmethod
+    def _event_json(task: Task) -> str:
+        """Serialize a task's status event."""
+        return TaskEventDTO(
+            task_id=task.id,
+            user_id=task.user_id,
+            status=task.status,
+            error_message=task.error_message,
+            started_at=task.started_at,
+            completed_at=task.completed_at,
+            updated_at=task.updated_at,
+        ).model_dump_json()
+
+
+class TaskEventBroker:
+    """Fans task events out from one Redis subscription to local subscribers.
+
+    Each API process holds a single subscription to ``TASK_EVENTS_CHANNEL``
+    and routes every event to the bounded queues of the local subscribers of
+    the event's user or task. A slow client loses its oldest events rather
+    than stalling the others.
+    """
+
+    def __init__(self, queue_size: int = 100) -> None:
+        """Initialize task event broker."""
+        self.queue_size = queue_size
+        self._subscribers: Dict[UUID, Set[asyncio.Queue]] = {}
+        self._task_watchers: Dict[UUID, Set[asyncio.Queue]] = {}
+        self._listener: Optional[asyncio.Task] = None
+
+    def subscribe(self, user_id: UUID) -> AsyncContextManager[asyncio.Queue]:
+        """Subscribe to a user's task events for the duration of the context."""
+        return self._register(self._subscribers, user_id)
+
+    def subscribe_task(self, task_id: UUID) -> AsyncContextManager[asyncio.Queue]:
+        """Subscribe to a single task's events for the duration of the context."""
+        return self._register(self._task_watchers, task_id)
+
+    @asynccontextmanager
+    async def _register(
+        self, registry: Dict[UUID, Set[asyncio.Queue]], key: UUID
+    ) -> AsyncIterator[asyncio.Queue]:
+        """Register a bounded queue under a key while the context is open."""
+        self._ensure_listening()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        registry.setdefault(key, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = registry.get(key)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del registry[key]
+
+    async def stop(self) -> None:
+        """Stop listening for events."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    def _ensure_listening(self) -> None:
+        """Start the Redis listener on first use."""
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        """Receive events from Redis, reconnecting on failure."""
+        while True:
+            try:
+                client = await RedisClient.get_client()
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(TASK_EVENTS_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._dispatch(message["data"])
+            except RedisError as e:
+                logger.warning("task_event_subscription_lost", error=str(e))
+                await asyncio.sleep(1)
+
+    def _dispatch(self, data: str) -> None:
+        """Route a raw event to the queues of its user and task."""
+        try:
+            event = TaskEventDTO.model_validate_json(data)
+        except ValidationError:
+            logger.warning("task_event_invalid", data=data)
+            return
+
+        for queue in (
+            *self._subscribers.get(event.user_id, ()),
+            *self._task_watchers.get(event.task_id, ()),
+        ):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+
+# Process-wide broker shared by all connected clients
+task_event_broker = TaskEventBroker(queue_size=settings.task_events_queue_size)
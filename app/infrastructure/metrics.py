@@ -0,0 +1,152 @@
+"""In-process metrics."""
+
+import bisect
+import threading
+from typing import Any, Dict, Sequence
+
+# Latency buckets in seconds, from sub-millisecond up to ten seconds
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Counter:
+    """Monotonically increasing counter."""
+
+    def __init__(self, description: str) -> None:
+        """Initialize counter."""
+        self.description = description
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        """Increment counter."""
+        with self._lock:
+            self._value += amount
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get current value."""
+        return {"type": "counter", "value": self._value}
+
+
+class Gauge:
+    """Value that can go up and down."""
+
+    def __init__(self, description: str) -> None:
+        """Initialize gauge."""
+        self.description = description
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        """Increment gauge."""
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        """Decrement gauge."""
+        self.inc(-amount)
+
+    def set(self, value: float) -> None:
+        """Set gauge."""
+        with self._lock:
+            self._value = value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get current value."""
+        return {"type": "gauge", "value": self._value}
+
+
+class Histogram:
+    """Distribution of observed values in cumulative buckets."""
+
+    def __init__(
+        self, description: str, buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+        """Initialize histogram."""
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record an observation."""
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._sum += value
+            self._count += 1
+            self._max = max(self._max, value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get count, sum, max and cumulative bucket counts."""
+        with self._lock:
+            cumulative = 0
+            buckets: Dict[str, int] = {}
+            bounds = (*map(str, self.buckets), "+Inf")
+            for bound, count in zip(bounds, self._counts, strict=True):
+                cumulative += count
+                buckets[bound] = cumulative
+            return {
+                "type": "histogram",
+                "count": self._count,
+                "sum": self._sum,
+                "max": self._max,
+                "buckets": buckets,
+            }
+
+
+class MetricsRegistry:
+    """Registry of named metrics for this process."""
+
+    def __init__(self) -> None:
+        """Initialize registry."""
+        self._metrics: Dict[str, Any] = {}
+
+    def counter(self, name: str, description: str) -> Counter:
+        """Get or create a counter."""
+        counter: Counter = self._metrics.setdefault(name, Counter(description))
+        return counter
+
+    def gauge(self, name: str, description: str) -> Gauge:
+        """Get or create a gauge."""
+        gauge: Gauge = self._metrics.setdefault(name, Gauge(description))
+        return gauge
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        histogram: Histogram = self._metrics.setdefault(
+            name, Histogram(description, buckets)
+        )
+        return histogram
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get the current value of every metric."""
+        return {
+            name: {"description": metric.description, **metric.snapshot()}
+            for name, metric in sorted(self._metrics.items())
+        }
+
+
+# Process-wide registry
+metrics = MetricsRegistry()
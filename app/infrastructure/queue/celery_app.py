@@ -13,6 +13,7 @@ celery_app = Celery(
         "app.workers.data_processor",
         "app.workers.api_integration",
         "app.workers.report_generator",
+        "app.workers.task_import",
     ],
 )
 
@@ -23,6 +24,8 @@ celery_app.conf.update(
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
+    # Task outcomes are recorded in Postgres; nothing reads the result backend
+    task_ignore_result=True,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
     worker_prefetch_multiplier=1,
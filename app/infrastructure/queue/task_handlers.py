@@ -3,11 +3,18 @@
 from typing import Any, Dict
 from uuid import UUID
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.domain.entities.task import Task
+from app.infrastructure.cache.task_count_cache import TaskCountCache
+from app.infrastructure.cache.task_status_store import TaskStatusStore
 from app.infrastructure.database.base import AsyncSessionLocal
 from app.infrastructure.database.repositories.task_repository import TaskRepository
-from app.domain.value_objects.task_status import TaskStatus
+from app.infrastructure.events.task_events import TaskEventPublisher
+from app.infrastructure.storage.result_store import result_blob_store
+from app.domain.value_objects.task_status import TERMINAL_TASK_STATUSES, TaskStatus
 
 
 async def update_task_status(
@@ -23,13 +30,46 @@ async def update_task_status(
         if not task:
             return
 
+        previous_status = task.status
+        # A finished or cancelled task never moves back to an active state
+        if (
+            previous_status in TERMINAL_TASK_STATUSES
+            and status not in TERMINAL_TASK_STATUSES
+        ):
+            return
+
         if status == TaskStatus.RUNNING:
             task.start()
         elif status == TaskStatus.COMPLETED:
             task.complete(result)
+            await offload_result(task)
         elif status == TaskStatus.FAILED:
             task.fail(error_message or "Task failed")
 
-        await task_repo.update(task)
+        task = await task_repo.update(task)
+
+    await TaskStatusStore().set(task)
+    if task.status == previous_status:
+        await TaskCountCache().adjust(task.user_id, {})
+        return
+    await TaskCountCache().adjust(task.user_id, {previous_status: -1, task.status: 1})
+    await TaskEventPublisher().publish(task)
+
+
+async def offload_result(task: Task) -> None:
+    """Move a result over the offload threshold into the result blob store.
+
+    The row then keeps only the blob reference and size, so the large
+    document is not read back by every query that loads the task.
+    """
+    if task.result is None:
+        return
+
+    payload = orjson.dumps(task.result)
+    if len(payload) <= settings.result_offload_threshold:
+        return
 
+    task.result_ref = await result_blob_store.put(payload)
+    task.result_size = len(payload)
+    task.result = None
 
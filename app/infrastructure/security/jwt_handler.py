@@ -1,11 +1,32 @@
 """JWT token handling."""
 
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
 from datetime import datetime, timedelta
+from typing import Any, Dict
 from uuid import UUID
 
 from jose import jwt
+from jose.exceptions import ExpiredSignatureError, JWTError
 
 from app.config import settings
+from app.infrastructure.cache.local_cache import TTLCache
+
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+# Verified claims keyed by token digest; entries never outlive the token
+_claims_cache: TTLCache[bytes, Dict[str, Any]] = TTLCache(
+    max_size=settings.jwt_claims_cache_size,
+    ttl=settings.jwt_refresh_token_expire_days * 24 * 60 * 60,
+)
 
 
 class JWTHandler:
@@ -14,40 +35,105 @@ class JWTHandler:
     @staticmethod
     def create_access_token(user_id: UUID, email: str) -> str:
         """Create access token."""
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.jwt_access_token_expire_minutes
-        )
-        payload = {
-            "sub": str(user_id),
-            "email": email,
-            "exp": expire,
-            "type": "access",
-        }
-        return jwt.encode(
-            payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
+        return JWTHandler._create_token(
+            user_id,
+            email,
+            timedelta(minutes=settings.jwt_access_token_expire_minutes),
+            "access",
         )
 
     @staticmethod
     def create_refresh_token(user_id: UUID, email: str) -> str:
         """Create refresh token."""
-        expire = datetime.utcnow() + timedelta(
-            days=settings.jwt_refresh_token_expire_days
+        return JWTHandler._create_token(
+            user_id,
+            email,
+            timedelta(days=settings.jwt_refresh_token_expire_days),
+            "refresh",
+        )
+
+    @staticmethod
+    def decode_token(token: str) -> dict:
+        """Decode JWT token.
+
+        Verified claims are cached by token digest until the token's ``exp``,
+        so a client reusing a bearer token is only verified once.
+        """
+        digest = hashlib.sha256(token.encode()).digest()
+        claims = _claims_cache.get(digest)
+        if claims is None:
+            claims = JWTHandler.verify_token(token)
+            exp = claims.get("exp")
+            if isinstance(exp, (int, float)):
+                _claims_cache.set(digest, claims, ttl=exp - time.time())
+        return dict(claims)
+
+    @staticmethod
+    def verify_token(token: str) -> dict:
+        """Verify JWT token and return its claims, bypassing the claims cache."""
+        if settings.jwt_backend == "hmac" and settings.jwt_algorithm in _HMAC_DIGESTS:
+            return _verify_hmac(token)
+        return jwt.decode(
+            token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
         )
+
+    @staticmethod
+    def _create_token(
+        user_id: UUID, email: str, expires_delta: timedelta, token_type: str
+    ) -> str:
+        """Create signed token."""
         payload = {
             "sub": str(user_id),
             "email": email,
-            "exp": expire,
-            "type": "refresh",
+            "exp": datetime.utcnow() + expires_delta,
+            "type": token_type,
         }
         return jwt.encode(
             payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
         )
 
-    @staticmethod
-    def decode_token(token: str) -> dict:
-        """Decode JWT token."""
-        return jwt.decode(
-            token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
-        )
+
+def _verify_hmac(token: str) -> dict:
+    """Verify an HMAC-signed JWT with the standard library.
+
+    Equivalent to ``jose.jwt.decode`` for the tokens this service issues
+    (HS* signature and ``exp`` claim), without its generic JWS machinery.
+    """
+    try:
+        header_segment, payload_segment, signature_segment = token.split(".")
+        header = json.loads(_b64decode(header_segment))
+        signature = _b64decode(signature_segment)
+    except (ValueError, binascii.Error) as e:
+        raise JWTError("Invalid token format") from e
+
+    if not isinstance(header, dict) or header.get("alg") != settings.jwt_algorithm:
+        raise JWTError("The specified alg value is not allowed")
+
+    expected = hmac.new(
+        settings.jwt_secret_key.encode(),
+        f"{header_segment}.{payload_segment}".encode(),
+        _HMAC_DIGESTS[settings.jwt_algorithm],
+    ).digest()
+    if not hmac.compare_digest(signature, expected):
+        raise JWTError("Signature verification failed.")
+
+    try:
+        claims = json.loads(_b64decode(payload_segment))
+    except (ValueError, binascii.Error) as e:
+        raise JWTError("Invalid payload string") from e
+    if not isinstance(claims, dict):
+        raise JWTError("Invalid payload string: must be a json object")
+
+    exp = claims.get("exp")
+    if exp is not None:
+        if not isinstance(exp, (int, float)):
+            raise JWTError("Expiration Time claim (exp) must be an integer.")
+        if exp <= time.time():
+            raise ExpiredSignatureError("Signature has expired.")
+
+    return claims
 
 
+def _b64decode(segment: str) -> bytes:
+    """Decode an unpadded base64url segment."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
@@ -1,8 +1,78 @@
 """Password handling utilities."""
 
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple, TypeVar
+
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.config import settings
+from app.infrastructure.metrics import metrics
+
+T = TypeVar("T")
+
+# Hashes made with any other cost factor are flagged for rehashing on login
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.password_bcrypt_rounds,
+    bcrypt__min_rounds=settings.password_bcrypt_rounds,
+    bcrypt__max_rounds=settings.password_bcrypt_rounds,
+)
+
+
+class PasswordHashingPool:
+    """Dedicated thread pool for password hashing.
+
+    bcrypt releases the GIL, so running it on a small dedicated pool keeps
+    the event loop free while capping hashing concurrency at
+    ``max_workers``. Excess work queues inside the pool, and the time it
+    spends waiting is recorded in ``password_hash_queue_seconds``.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        """Initialize hashing pool."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hash"
+        )
+        self._queue_time = metrics.histogram(
+            "password_hash_queue_seconds",
+            "Time password hashing jobs wait for a worker thread",
+        )
+        self._run_time = metrics.histogram(
+            "password_hash_seconds", "Time spent hashing or verifying passwords"
+        )
+        self._in_flight = metrics.gauge(
+            "password_hash_in_flight", "Password hashing jobs queued or running"
+        )
+
+    async def run(self, func: Callable[..., T], *args: str) -> T:
+        """Run a hashing function on the pool."""
+        submitted_at = time.perf_counter()
+
+        def timed() -> T:
+            started_at = time.perf_counter()
+            self._queue_time.observe(started_at - submitted_at)
+            try:
+                return func(*args)
+            finally:
+                self._run_time.observe(time.perf_counter() - started_at)
+
+        self._in_flight.inc()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, timed)
+        finally:
+            self._in_flight.dec()
+
+    def shutdown(self) -> None:
+        """Stop worker threads once queued jobs finish."""
+        self._executor.shutdown(wait=False)
+
+
+# Process-wide pool shared by all requests
+password_hashing_pool = PasswordHashingPool(max_workers=settings.password_hash_workers)
 
 
 class PasswordHandler:
@@ -18,4 +88,28 @@ class PasswordHandler:
         """Verify a password against a hash."""
         return pwd_context.verify(plain_password, hashed_password)
 
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        """Check if a hash was made with outdated settings."""
+        return pwd_context.needs_update(hashed_password)
 
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """Hash a password without blocking the event loop."""
+        return await password_hashing_pool.run(pwd_context.hash, password)
+
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """Verify a password without blocking the event loop."""
+        return await password_hashing_pool.run(
+            pwd_context.verify, plain_password, hashed_password
+        )
+
+    @staticmethod
+    async def verify_and_update_async(
+        plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Verify a password and return a new hash if the old one is outdated."""
+        return await password_hashing_pool.run(
+            pwd_context.verify_and_update, plain_password, hashed_password
+        )
@@ -0,0 +1,83 @@
+"""Content-addressed task result storage."""
+
+import asyncio
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import AsyncIterator
+
+import anyio
+
+from app.config import settings
+
+_REF_PATTERN = re.compile(r"^sha256:([0-9a-f]{64})$")
+
+
+class ResultBlobStore:
+    """Task results too large for the ``tasks`` table, stored by content hash.
+
+    Blobs live on a filesystem shared by the API and the workers under
+    ``<root>/<hash[:2]>/<hash[2:4]>/<hash>``, and are referenced from Postgres
+    as ``sha256:<hash>``. Identical results are stored once, and a blob is
+    never modified after it is written, so readers need no locking.
+    """
+
+    def __init__(self, root: str, chunk_size: int = 64 * 1024) -> None:
+        """Initialize result blob store."""
+        self.root = Path(root)
+        self.chunk_size = chunk_size
+
+    def _path(self, ref: str) -> Path:
+        """Map a reference to its file, rejecting malformed references."""
+        match = _REF_PATTERN.match(ref)
+        if not match:
+            raise ValueError(f"Invalid result reference: {ref}")
+        digest = match.group(1)
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def _write(self, data: bytes) -> str:
+        """Write a blob unless it already exists, and return its reference."""
+        ref = f"sha256:{hashlib.sha256(data).hexdigest()}"
+        path = self._path(ref)
+        if path.exists():
+            return ref
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write aside and rename so readers never see a partial blob
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return ref
+
+    async def put(self, data: bytes) -> str:
+        """Store a blob and return its reference."""
+        return await asyncio.to_thread(self._write, data)
+
+    async def exists(self, ref: str) -> bool:
+        """Check whether a blob is stored."""
+        return await asyncio.to_thread(self._path(ref).exists)
+
+    async def iter_range(self, ref: str, start: int, end: int) -> AsyncIterator[bytes]:
+        """Stream bytes ``start`` through ``end`` (inclusive) of a blob."""
+        remaining = end - start + 1
+        async with await anyio.open_file(self._path(ref), "rb") as f:
+            await f.seek(start)
+            while remaining > 0:
+                chunk = await f.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+
+# Process-wide result blob store
+result_blob_store = ResultBlobStore(settings.result_store_path)
@@ -5,12 +5,17 @@ import structlog
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
-from app.api.v1.routes import auth, tasks, users, health
+from app.api.v1.routes import auth, task_events, tasks, users, health
+from app.api.middleware.admission import AdmissionMiddleware
+from app.api.middleware.compression import CompressionMiddleware
 from app.api.middleware.rate_limiter import RateLimitMiddleware
 from app.api.middleware.logging_middleware import LoggingMiddleware
 from app.infrastructure.cache.redis_client import RedisClient
+from app.infrastructure.events.task_events import task_event_broker
+from app.infrastructure.security.password_handler import password_hashing_pool
 
 
 @asynccontextmanager
@@ -28,7 +33,9 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("application_shutdown")
+    await task_event_broker.stop()
     await RedisClient.close()
+    password_hashing_pool.shutdown()
 
 
 # Create FastAPI app
@@ -38,6 +45,7 @@ app = FastAPI(
     description="Production-grade distributed task processing and API platform",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -51,16 +59,40 @@ app.add_middleware(
 )
 
 # Custom middleware
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        max_request_size=settings.compression_max_request_size,
+    )
+# Inside logging, so shed requests are logged, and inside rate limiting, so
+# rejected clients never take a slot
+if settings.admission_enabled:
+    app.add_middleware(
+        AdmissionMiddleware,
+        max_concurrency=settings.admission_max_concurrency,
+        lane_limits=settings.admission_lane_limits,
+        queue_deadline=settings.admission_queue_deadline,
+        enabled=settings.admission_enabled,
+    )
 app.add_middleware(LoggingMiddleware)
 if settings.rate_limit_enabled:
     app.add_middleware(
         RateLimitMiddleware,
-        requests_per_minute=settings.rate_limit_requests,
+        requests=settings.rate_limit_requests,
+        window=settings.rate_limit_window,
+        user_requests=settings.rate_limit_user_requests,
+        api_key_requests=settings.rate_limit_api_key_requests,
+        route_limits=settings.rate_limit_route_limits,
+        mode=settings.rate_limit_mode,
+        lease_fraction=settings.rate_limit_lease_fraction,
         enabled=settings.rate_limit_enabled,
     )
 
 # Include routers
 app.include_router(auth.router, prefix="/api/v1")
+# Task event routes must precede /tasks/{task_id}
+app.include_router(task_events.router, prefix="/api/v1")
 app.include_router(tasks.router, prefix="/api/v1")
 app.include_router(users.router, prefix="/api/v1")
 app.include_router(health.router, prefix="/api/v1")
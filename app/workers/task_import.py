@@ -0,0 +1,54 @@
+"""Task import worker."""
+
+import asyncio
+from typing import Any
+from uuid import UUID
+
+import structlog
+from celery.signals import worker_ready
+
+from app.application.services.task_service import IMPORT_WORKER_TASK, TaskService
+from app.infrastructure.cache.task_count_cache import TaskCountCache
+from app.infrastructure.cache.task_import_store import TaskImportJobStore
+from app.infrastructure.database.base import AsyncSessionLocal
+from app.infrastructure.database.repositories.task_repository import TaskRepository
+from app.infrastructure.queue.celery_app import celery_app
+
+logger = structlog.get_logger()
+
+
+# Acknowledged only once done, so a job whose worker dies is redelivered
+# and resumes instead of being lost
+@celery_app.task(name=IMPORT_WORKER_TASK, acks_late=True, reject_on_worker_lost=True)
+def run_import(job_id: str) -> dict:
+    """Run a task import job."""
+    asyncio.run(_run_import(UUID(job_id)))
+    return {"status": "completed", "job_id": job_id}
+
+
+async def _run_import(job_id: UUID) -> None:
+    """Run an import job on its own session."""
+    async with AsyncSessionLocal() as session:
+        task_service = TaskService(
+            TaskRepository(session),
+            TaskCountCache(),
+            task_import_store=TaskImportJobStore(),
+        )
+        await task_service.run_import_job(job_id)
+
+
+@worker_ready.connect
+def fail_stale_imports(**kwargs: Any) -> None:
+    """Fail import jobs left running by a worker that died."""
+    failed = asyncio.run(_fail_stale_imports())
+    if failed:
+        logger.warning("task_imports_failed_stale", count=failed)
+
+
+async def _fail_stale_imports() -> int:
+    """Fail stale import jobs."""
+    async with AsyncSessionLocal() as session:
+        task_service = TaskService(
+            TaskRepository(session), task_import_store=TaskImportJobStore()
+        )
+        return await task_service.fail_stale_imports()
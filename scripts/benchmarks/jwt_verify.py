@@ -0,0 +1,42 @@
+"""Benchmark JWT verification backends.
+
+Usage:
+    python -m scripts.benchmarks.jwt_verify [iterations]
+"""
+
+import sys
+import timeit
+from uuid import uuid4
+
+from app.config import settings
+from app.infrastructure.security import jwt_handler
+from app.infrastructure.security.jwt_handler import JWTHandler
+
+
+def run_benchmark(iterations: int) -> None:
+    """Time token verification with each backend and with the claims cache."""
+    token = JWTHandler.create_access_token(uuid4(), "bench@example.com")
+
+    def verify_with(backend: str) -> float:
+        settings.jwt_backend = backend
+        return timeit.timeit(lambda: JWTHandler.verify_token(token), number=iterations)
+
+    def decode_cached() -> float:
+        jwt_handler._claims_cache.clear()
+        return timeit.timeit(lambda: JWTHandler.decode_token(token), number=iterations)
+
+    results = {
+        "jose": verify_with("jose"),
+        "hmac": verify_with("hmac"),
+        "hmac + claims cache": decode_cached(),
+    }
+
+    baseline = results["jose"]
+    print(f"{'backend':<22}{'us/op':>10}{'speedup':>10}")
+    for name, elapsed in results.items():
+        per_op = elapsed / iterations * 1_000_000
+        print(f"{name:<22}{per_op:>10.2f}{baseline / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,83 @@
+"""Benchmark unrelated endpoint latency during a login storm.
+
+Runs an in-process app where a burst of logins verifies bcrypt hashes
+either inline on the event loop or on the password hashing pool, while a
+probe keeps calling a cheap endpoint and records its latency.
+
+Usage:
+    python -m scripts.benchmarks.login_storm [concurrent_logins] [probes]
+"""
+
+import asyncio
+import statistics
+import sys
+
+from fastapi import FastAPI
+from httpx import AsyncClient
+from passlib.context import CryptContext
+
+from app.infrastructure.security.password_handler import PasswordHandler
+
+PASSWORD = "benchmark-password"
+PROBE_INTERVAL = 0.005
+PASSWORD_HASH = CryptContext(schemes=["bcrypt"], bcrypt__rounds=10).hash(PASSWORD)
+
+app = FastAPI()
+
+
+@app.post("/login/blocking")
+async def login_blocking() -> dict:
+    """Verify inline, as the auth service used to."""
+    return {"valid": PasswordHandler.verify_password(PASSWORD, PASSWORD_HASH)}
+
+
+@app.post("/login/pooled")
+async def login_pooled() -> dict:
+    """Verify on the password hashing pool."""
+    return {
+        "valid": await PasswordHandler.verify_password_async(PASSWORD, PASSWORD_HASH)
+    }
+
+
+@app.get("/ping")
+async def ping() -> dict:
+    """Unrelated cheap endpoint."""
+    return {}
+
+
+async def measure(client: AsyncClient, mode: str, logins: int, probes: int) -> list:
+    """Return probe latencies in milliseconds while a login storm runs.
+
+    Probes are scheduled at a fixed interval and timed from their scheduled
+    start, so time spent waiting for a blocked event loop is counted.
+    """
+    loop = asyncio.get_running_loop()
+    storm = asyncio.gather(*(client.post(f"/login/{mode}") for _ in range(logins)))
+    latencies = []
+    started_at = loop.time()
+    for probe in range(probes):
+        scheduled_at = started_at + probe * PROBE_INTERVAL
+        await asyncio.sleep(max(scheduled_at - loop.time(), 0))
+        await client.get("/ping")
+        latencies.append((loop.time() - scheduled_at) * 1000)
+    await storm
+    return latencies
+
+
+async def run_benchmark(logins: int, probes: int) -> None:
+    """Compare probe latency with blocking and pooled verification."""
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        print(f"{'mode':<10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+        for mode in ("blocking", "pooled"):
+            latencies = sorted(await measure(client, mode, logins, probes))
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            print(
+                f"{mode:<10}{statistics.median(latencies):>10.2f}"
+                f"{p99:>10.2f}{latencies[-1]:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    logins = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    probes = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    asyncio.run(run_benchmark(logins, probes))
@@ -0,0 +1,220 @@
+"""Benchmark middleware overhead: BaseHTTPMiddleware versus plain ASGI.
+
+Builds the health and task routers twice, once behind the previous
+``BaseHTTPMiddleware`` logging and rate-limit middleware and once behind
+the current ASGI implementations, and drives both in-process. Auth, the
+task repository and the rate-limit stores are replaced with
+in-memory fakes so only the middleware differs between the two apps.
+
+Usage:
+    python -m scripts.benchmarks.middleware [requests] [concurrency]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import structlog
+from fastapi import FastAPI, HTTPException, Request, status
+from httpx import AsyncClient
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.api.middleware import rate_limiter
+from app.api.middleware.logging_middleware import LoggingMiddleware
+from app.api.middleware.rate_limiter import RateLimitMiddleware
+from app.api.v1.routes import health, tasks
+from app.api.v1.routes.auth import get_current_user
+from app.application.services.task_service import TaskService
+from app.dependencies import get_task_service
+from app.domain.entities.task import Task
+from app.domain.entities.user import User
+from app.domain.value_objects.task_status import TaskType
+from app.infrastructure.cache.rate_limit import RateLimitResult
+
+logger = structlog.get_logger()
+
+USER = User(email="bench@example.com", username="bench", hashed_password="x")
+
+
+class InMemoryCache:
+    """Counter store standing in for the Redis cache service."""
+
+    def __init__(self) -> None:
+        """Initialize the store."""
+        self._values: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[int]:
+        """Get a counter."""
+        return self._values.get(key)
+
+    async def set(self, key: str, value: int, expire: Optional[int] = None) -> bool:
+        """Set a counter."""
+        self._values[key] = value
+        return True
+
+    async def increment(self, key: str, amount: int = 1) -> int:
+        """Increment a counter."""
+        self._values[key] = self._values.get(key, 0) + amount
+        return self._values[key]
+
+
+class UnlimitedRateLimiter:
+    """Rate limiter standing in for the Redis GCRA limiter."""
+
+    async def hit(self, key: str, limit: int, window: int) -> RateLimitResult:
+        """Admit every request."""
+        return RateLimitResult(
+            allowed=True,
+            limit=limit,
+            remaining=limit - 1,
+            reset_after=window / limit,
+            retry_after=0,
+        )
+
+
+class InMemoryTaskRepository:
+    """Task repository returning a fixed page of tasks."""
+
+    def __init__(self, count: int = 20) -> None:
+        """Create the fixed tasks."""
+        self.tasks = [
+            Task(
+                name=f"task-{i}",
+                task_type=TaskType.DATA_PROCESSING,
+                user_id=USER.id,
+                parameters={"index": i},
+            )
+            for i in range(count)
+        ]
+
+    async def get_by_user_id(self, user_id, skip=0, limit=100, **kwargs) -> List[Task]:
+        """Return the fixed tasks."""
+        return self.tasks[skip : skip + limit]
+
+    async def count_by_user_id(self, user_id, status=None) -> int:
+        """Return the fixed task count."""
+        return len(self.tasks)
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    """Logging middleware as it was before the ASGI rewrite."""
+
+    async def dispatch(self, request: Request, call_next):
+        """Log request and response."""
+        start_time = time.time()
+        logger.info(
+            "request_started",
+            method=request.method,
+            path=request.url.path,
+            client_ip=request.client.host if request.client else None,
+        )
+        response = await call_next(request)
+        duration = time.time() - start_time
+        logger.info(
+            "request_completed",
+            method=request.method,
+            path=request.url.path,
+            status_code=response.status_code,
+            duration_ms=round(duration * 1000, 2),
+        )
+        return response
+
+
+class LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+    """Rate limiting middleware as it was before the ASGI rewrite."""
+
+    def __init__(self, app, requests_per_minute: int = 100, enabled: bool = True):
+        """Initialize rate limiter."""
+        super().__init__(app)
+        self.requests_per_minute = requests_per_minute
+        self.enabled = enabled
+        self.cache_service = InMemoryCache()
+
+    async def dispatch(self, request: Request, call_next):
+        """Process request with rate limiting."""
+        if not self.enabled or request.url.path.startswith("/api/v1/health"):
+            return await call_next(request)
+        client_id = request.client.host if request.client else "unknown"
+        key = f"rate_limit:{client_id}"
+        current = await self.cache_service.get(key)
+        if current is None:
+            await self.cache_service.set(key, 1, expire=60)
+        elif int(current) >= self.requests_per_minute:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Rate limit exceeded. Please try again later.",
+            )
+        else:
+            await self.cache_service.increment(key)
+        return await call_next(request)
+
+
+def build_app(logging_cls: Any, rate_limit_cls: Any, **rate_limit: Any) -> FastAPI:
+    """Build an app with the routes under test and the given middleware."""
+    app = FastAPI()
+    app.add_middleware(logging_cls)
+    app.add_middleware(rate_limit_cls, enabled=True, **rate_limit)
+    app.include_router(health.router, prefix="/api/v1")
+    app.include_router(tasks.router, prefix="/api/v1")
+
+    task_service = TaskService(InMemoryTaskRepository())
+    app.dependency_overrides[get_current_user] = lambda: USER
+    app.dependency_overrides[get_task_service] = lambda: task_service
+    return app
+
+
+async def measure(app: FastAPI, path: str, requests: int, concurrency: int) -> tuple:
+    """Return (requests per second, latencies in ms) for one endpoint."""
+    latencies: List[float] = []
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                started_at = time.perf_counter()
+                response = await client.get(path)
+                latencies.append((time.perf_counter() - started_at) * 1000)
+                assert response.status_code == 200, response.text
+
+        # Warm up routing and dependency caches
+        await worker(50)
+        latencies.clear()
+
+        started_at = time.perf_counter()
+        await asyncio.gather(
+            *(worker(requests // concurrency) for _ in range(concurrency))
+        )
+        elapsed = time.perf_counter() - started_at
+    return len(latencies) / elapsed, sorted(latencies)
+
+
+async def run_benchmark(requests: int, concurrency: int) -> None:
+    """Compare both middleware stacks on the health and task list endpoints."""
+    # Keep the ASGI rate limiter off Redis as well
+    rate_limiter.RateLimiter = UnlimitedRateLimiter
+    structlog.configure(logger_factory=structlog.ReturnLoggerFactory())
+
+    apps = {
+        "base_http": build_app(
+            LegacyLoggingMiddleware,
+            LegacyRateLimitMiddleware,
+            requests_per_minute=10**9,
+        ),
+        "asgi": build_app(LoggingMiddleware, RateLimitMiddleware, requests=10**9),
+    }
+    print(f"{'stack':<12}{'endpoint':<18}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for path in ("/api/v1/health", "/api/v1/tasks"):
+        for name, app in apps.items():
+            throughput, latencies = await measure(app, path, requests, concurrency)
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            print(
+                f"{name:<12}{path:<18}{throughput:>10.0f}"
+                f"{statistics.median(latencies):>10.2f}{p99:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    asyncio.run(run_benchmark(requests, concurrency))
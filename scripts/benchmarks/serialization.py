@@ -0,0 +1,113 @@
+"""Benchmark CPU spent turning a page of task rows into a response body.
+
+Compares the previous path, which validates each row into a ``Task``,
+re-validates it into ``TaskResponseDTO`` and then lets FastAPI validate and
+encode the page against ``response_model``, with the current one, which
+constructs both models without validation and renders the page with orjson.
+
+Usage:
+    python -m scripts.benchmarks.serialization [page_size] [pages]
+"""
+
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.api.responses import model_response
+from app.application.dto.task_dto import TaskListResponseDTO, TaskResponseDTO
+from app.domain.entities.task import Task
+from app.domain.value_objects.task_status import TaskPriority, TaskStatus, TaskType
+from app.infrastructure.database.models import TaskModel
+from app.infrastructure.database.repositories.task_repository import TaskRepository
+
+RESPONSE_FIELD = create_response_field(name="response", type_=TaskListResponseDTO)
+
+
+def build_rows(page_size: int) -> List[TaskModel]:
+    """Build detached task rows like those a list query returns."""
+    user_id = uuid4()
+    now = datetime.utcnow()
+    return [
+        TaskModel(
+            id=uuid4(),
+            name=f"task-{i}",
+            description="Benchmark task",
+            task_type=TaskType.DATA_PROCESSING,
+            status=TaskStatus.COMPLETED,
+            priority=TaskPriority.MEDIUM,
+            user_id=user_id,
+            parameters={"index": i, "tags": ["a", "b"]},
+            result={"rows": i * 10, "ok": True},
+            error_message=None,
+            retry_count=0,
+            max_retries=3,
+            started_at=now,
+            completed_at=now + timedelta(seconds=1),
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(page_size)
+    ]
+
+
+def _list_dto(items: List[TaskResponseDTO]) -> TaskListResponseDTO:
+    """Wrap items in a list response."""
+    return TaskListResponseDTO(
+        items=items, total=len(items), page=1, page_size=len(items), total_pages=1
+    )
+
+
+async def render_before(rows: List[TaskModel]) -> bytes:
+    """Validate rows twice, then validate and encode via response_model."""
+    tasks = [
+        Task(**{column: getattr(row, column) for column in Task.model_fields})
+        for row in rows
+    ]
+    page = _list_dto([TaskResponseDTO.model_validate(task) for task in tasks])
+    content = await serialize_response(field=RESPONSE_FIELD, response_content=page)
+    return JSONResponse(content).body
+
+
+async def render_after(repository: TaskRepository, rows: List[TaskModel]) -> bytes:
+    """Construct models without validation and render with orjson."""
+    tasks = [repository._to_entity(row) for row in rows]
+    page = _list_dto([TaskResponseDTO.from_entity(task) for task in tasks])
+    return model_response(page).body
+
+
+async def run_benchmark(page_size: int, pages: int) -> None:
+    """Report CPU time per rendered page for both paths."""
+    rows = build_rows(page_size)
+    repository = TaskRepository(None)
+    before = await render_before(rows)
+    after = await render_after(repository, rows)
+    assert json.loads(before) == json.loads(after)
+
+    results = {}
+    for name, render in (
+        ("before", lambda: render_before(rows)),
+        ("after", lambda: render_after(repository, rows)),
+    ):
+        started_at = time.process_time()
+        for _ in range(pages):
+            await render()
+        results[name] = (time.process_time() - started_at) / pages * 1000
+
+    print(f"{'path':<10}{'CPU ms / page':>16}   ({page_size} tasks per page)")
+    for name, cpu_ms in results.items():
+        print(f"{name:<10}{cpu_ms:>16.3f}")
+    print(f"saved {results['before'] - results['after']:.3f} ms CPU per page")
+
+
+if __name__ == "__main__":
+    page_size = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    pages = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    asyncio.run(run_benchmark(page_size, pages))
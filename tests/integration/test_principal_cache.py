@@ -0,0 +1,41 @@
+"""Integration tests for the Redis principal cache."""
+
+from uuid import uuid4
+
+import pytest
+import redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.domain.entities.user import Principal
+from app.infrastructure.cache.principal_cache import PrincipalCache
+
+
+@pytest.fixture(scope="module")
+def redis_client() -> redis.Redis:
+    """Connect to the local Redis, skipping when it is not running."""
+    client = redis.Redis.from_url(settings.redis_cache_url, socket_connect_timeout=1)
+    try:
+        client.ping()
+    except RedisError:
+        pytest.skip("Redis is not available")
+    yield client
+    client.close()
+
+
+@pytest.mark.integration
+async def test_set_racing_an_invalidation_is_dropped(
+    redis_client: redis.Redis,
+) -> None:
+    """Test a principal loaded before an invalidation is not cached after it."""
+    cache = PrincipalCache(local_ttl=60, redis_ttl=60, max_size=10)
+    principal = Principal(id=uuid4(), email="user@example.com")
+    generation = await cache.get_generation(principal.id)
+
+    # The user is deactivated after the reader loaded it but before it caches
+    await cache.invalidate(principal.id)
+    await cache.set(principal, generation)
+    assert await cache.get(principal.id) is None
+
+    await cache.set(principal, await cache.get_generation(principal.id))
+    assert await cache.get(principal.id) == principal
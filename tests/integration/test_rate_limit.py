@@ -0,0 +1,70 @@
+"""Integration tests for the Redis rate limiters."""
+
+import asyncio
+import multiprocessing
+from uuid import uuid4
+
+import pytest
+import redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.infrastructure.cache.rate_limit import HybridRateLimiter, RateLimiter
+
+LIMIT = 200
+WINDOW = 60
+LEASE_FRACTION = 0.1
+PROCESSES = 4
+ATTEMPTS_PER_PROCESS = 150
+
+
+@pytest.fixture(scope="module")
+def redis_client() -> redis.Redis:
+    """Connect to the local Redis, skipping when it is not running."""
+    client = redis.Redis.from_url(settings.redis_cache_url, socket_connect_timeout=1)
+    try:
+        client.ping()
+    except RedisError:
+        pytest.skip("Redis is not available")
+    yield client
+    client.close()
+
+
+async def _admit(key: str, mode: str) -> int:
+    """Hit one bucket repeatedly and count admitted requests."""
+    limiter = (
+        HybridRateLimiter(lease_fraction=LEASE_FRACTION)
+        if mode == "hybrid"
+        else RateLimiter()
+    )
+    admitted = 0
+    for _ in range(ATTEMPTS_PER_PROCESS):
+        result = await limiter.hit(key, LIMIT, WINDOW)
+        assert result is not None
+        admitted += result.allowed
+    return admitted
+
+
+def _run_process(key: str, mode: str) -> int:
+    """Process entry point for one API worker."""
+    return asyncio.run(_admit(key, mode))
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("mode", ["redis", "hybrid"])
+def test_global_limit_holds_across_processes(
+    redis_client: redis.Redis, mode: str
+) -> None:
+    """Test processes sharing a bucket admit the limit within tolerance."""
+    key = f"test:{uuid4()}"
+    context = multiprocessing.get_context("spawn")
+    try:
+        with context.Pool(PROCESSES) as pool:
+            admitted = pool.starmap(_run_process, [(key, mode)] * PROCESSES)
+    finally:
+        redis_client.delete(f"rate_limit:{key}")
+
+    # Tokens refilled while the test runs are allowed for; in hybrid mode
+    # each process may also strand or overuse up to one leased block.
+    tolerance = 5 if mode == "redis" else PROCESSES * int(LIMIT * LEASE_FRACTION)
+    assert LIMIT - tolerance <= sum(admitted) <= LIMIT + tolerance
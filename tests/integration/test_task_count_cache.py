@@ -0,0 +1,54 @@
+"""Integration tests for the Redis task count cache."""
+
+from uuid import uuid4
+
+import pytest
+import redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.domain.value_objects.task_status import TaskStatus
+from app.infrastructure.cache.task_count_cache import TaskCountCache
+
+
+@pytest.fixture(scope="module")
+def redis_client() -> redis.Redis:
+    """Connect to the local Redis, skipping when it is not running."""
+    client = redis.Redis.from_url(settings.redis_cache_url, socket_connect_timeout=1)
+    try:
+        client.ping()
+    except RedisError:
+        pytest.skip("Redis is not available")
+    yield client
+    client.close()
+
+
+@pytest.mark.integration
+async def test_seed_then_adjust(redis_client: redis.Redis) -> None:
+    """Test seeded counts take later deltas and are not overwritten."""
+    cache = TaskCountCache()
+    user_id = uuid4()
+    version = await cache.get_version(user_id)
+
+    await cache.set_counts(user_id, {TaskStatus.PENDING: 2}, version)
+    await cache.adjust(user_id, {TaskStatus.PENDING: -1, TaskStatus.RUNNING: 1})
+    await cache.set_counts(user_id, {TaskStatus.PENDING: 2}, version)
+    counts = await cache.get_counts(user_id)
+
+    assert counts[TaskStatus.PENDING] == 1
+    assert counts[TaskStatus.RUNNING] == 1
+    assert await cache.get_version(user_id) == version + 1
+
+
+@pytest.mark.integration
+async def test_seed_racing_a_write_is_dropped(redis_client: redis.Redis) -> None:
+    """Test counts read before a concurrent write are not cached."""
+    cache = TaskCountCache()
+    user_id = uuid4()
+    version = await cache.get_version(user_id)
+
+    # A task is created after the seeding reader counted but before it seeds
+    await cache.adjust(user_id, {TaskStatus.PENDING: 1})
+    await cache.set_counts(user_id, {TaskStatus.PENDING: 0}, version)
+
+    assert await cache.get_counts(user_id) is None
@@ -0,0 +1,73 @@
+"""Integration tests for bulk task creation against PostgreSQL."""
+
+from typing import AsyncIterator, List, Tuple
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, func, select, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from app.config import settings
+from app.domain.entities.task import Task
+from app.domain.value_objects.task_status import TaskType
+from app.infrastructure.database.base import Base
+from app.infrastructure.database.models import TaskModel
+from app.infrastructure.database.repositories.task_repository import TaskRepository
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    """Create the tables in a scratch schema, skipping without Postgres."""
+    schema = f"create_test_{uuid4().hex[:12]}"
+    engine = create_async_engine(
+        settings.database_url,
+        connect_args={"timeout": 2, "server_settings": {"search_path": schema}},
+    )
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"CREATE SCHEMA {schema}"))
+            await conn.run_sync(Base.metadata.create_all)
+    except (OSError, SQLAlchemyError):
+        await engine.dispose()
+        pytest.skip("PostgreSQL is not available")
+
+    try:
+        yield engine
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        await engine.dispose()
+
+
+@pytest.mark.integration
+async def test_create_many_sends_multi_row_inserts(engine: AsyncEngine) -> None:
+    """Test a batch is sent as one multi-row INSERT, not an executemany."""
+    user_id = uuid4()
+    tasks = [
+        Task(name=f"task-{i}", task_type=TaskType.EMAIL, user_id=user_id)
+        for i in range(50)
+    ]
+    captured: List[Tuple[str, bool]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.startswith("INSERT INTO tasks"):
+            captured.append((statement, executemany))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        async with AsyncSession(engine) as session:
+            created = await TaskRepository(session).create_many(tasks)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+    async with AsyncSession(engine) as session:
+        stored = await session.scalar(
+            select(func.count()).where(TaskModel.user_id == user_id)
+        )
+
+    assert created == tasks
+    assert stored == len(tasks)
+    ((statement, executemany),) = captured
+    assert not executemany
+    assert statement.count("), (") == len(tasks) - 1
@@ -0,0 +1,200 @@
+"""Query plan regression tests for the tasks table."""
+
+import json
+import re
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Tuple
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, select, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+
+from app.config import settings
+from app.domain.value_objects.cursor import TaskCursor
+from app.domain.value_objects.task_status import TaskStatus
+from app.infrastructure.database.base import Base
+from app.infrastructure.database.models import TaskModel
+from app.infrastructure.database.repositories.task_repository import TaskRepository
+
+USERS = 200
+TASKS_PER_USER = 500
+
+# Mostly finished tasks, with a few percent still pending or running
+_GENERATE_TASKS = """
+INSERT INTO tasks (
+    id, name, task_type, status, priority, user_id, parameters,
+    retry_count, max_retries, created_at, updated_at
+)
+SELECT
+    gen_random_uuid(),
+    'task-' || n,
+    'EMAIL',
+    (CASE
+        WHEN n % 50 = 0 THEN 'PENDING'
+        WHEN n % 50 = 1 THEN 'RUNNING'
+        WHEN n % 10 = 2 THEN 'FAILED'
+        ELSE 'COMPLETED'
+    END)::task_status,
+    'MEDIUM',
+    md5(u::text)::uuid,
+    '{}',
+    0,
+    3,
+    now() - n * interval '1 minute',
+    now() - n * interval '1 minute'
+FROM generate_series(1, :users) AS u, generate_series(1, :tasks) AS n
+"""
+
+
+@pytest.fixture
+async def connection() -> AsyncIterator[AsyncConnection]:
+    """Load generated tasks into a scratch schema, skipping without Postgres.
+
+    The connection is left in a transaction that is rolled back afterwards,
+    so the repository's writes do not change the data between queries.
+    """
+    schema = f"plan_test_{uuid4().hex[:12]}"
+    engine = create_async_engine(
+        settings.database_url,
+        connect_args={"timeout": 2, "server_settings": {"search_path": schema}},
+    )
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text(f"CREATE SCHEMA {schema}"))
+            await conn.commit()
+    except (OSError, SQLAlchemyError):
+        await engine.dispose()
+        pytest.skip("PostgreSQL is not available")
+
+    try:
+        async with engine.connect() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(
+                text(_GENERATE_TASKS), {"users": USERS, "tasks": TASKS_PER_USER}
+            )
+            await conn.commit()
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text("VACUUM ANALYZE tasks"))
+
+        async with engine.connect() as conn:
+            await conn.begin()
+            yield conn
+            await conn.rollback()
+    finally:
+        async with engine.connect() as conn:
+            await conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+            await conn.commit()
+        await engine.dispose()
+
+
+async def _consume(tasks: AsyncIterator[Any]) -> None:
+    """Read an async iterator to the end."""
+    async for _ in tasks:
+        pass
+
+
+def _repository_calls(
+    repository: TaskRepository, user_id: Any, task_id: Any, cursor: TaskCursor
+) -> Dict[str, Callable[[], Awaitable[Any]]]:
+    """Hot repository calls, by name, with one user's data as arguments."""
+    return {
+        "get_by_id": lambda: repository.get_by_id(task_id),
+        "get_many": lambda: repository.get_many([task_id], user_id=user_id),
+        "get_version": lambda: repository.get_version(task_id),
+        "list_first_page": lambda: repository.get_by_user_id(user_id, limit=20),
+        "list_by_offset": lambda: repository.get_by_user_id(
+            user_id, skip=TASKS_PER_USER // 2, limit=20
+        ),
+        "list_by_status": lambda: repository.get_by_user_id(
+            user_id, status=TaskStatus.FAILED, limit=20
+        ),
+        "list_after_cursor": lambda: repository.get_by_user_id(
+            user_id, cursor=cursor, limit=20
+        ),
+        "count": lambda: repository.count_by_user_id(user_id),
+        "count_one_status": lambda: repository.count_by_user_id(
+            user_id, status=TaskStatus.RUNNING
+        ),
+        "count_by_status": lambda: repository.count_by_status(user_id),
+        "estimate_count": lambda: repository.estimate_count_by_user_id(
+            user_id, status=TaskStatus.PENDING
+        ),
+        "export": lambda: _consume(repository.stream_by_user_id(user_id)),
+        "cancel_batch": lambda: repository.cancel_many(user_id, limit=100),
+        "delete_batch": lambda: repository.delete_many(
+            user_id, status=TaskStatus.FAILED, limit=100
+        ),
+    }
+
+
+async def _capture_statements(
+    connection: AsyncConnection,
+) -> Dict[str, List[Tuple[str, Any]]]:
+    """Run the repository calls and record the SQL each sends to the driver."""
+    user_id, task_id, created_at = (
+        await connection.execute(
+            select(TaskModel.user_id, TaskModel.id, TaskModel.created_at)
+            .order_by(TaskModel.user_id, TaskModel.created_at.desc())
+            .offset(TASKS_PER_USER // 2)
+            .limit(1)
+        )
+    ).one()
+    captured: List[Tuple[str, Any]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        if " tasks" in statement:
+            captured.append((statement, parameters))
+
+    session = AsyncSession(bind=connection, join_transaction_mode="create_savepoint")
+    repository = TaskRepository(session)
+    cursor = TaskCursor(created_at=created_at, id=task_id)
+    statements = {}
+    event.listen(connection.sync_engine, "before_cursor_execute", record)
+    try:
+        for name, call in _repository_calls(
+            repository, user_id, task_id, cursor
+        ).items():
+            captured.clear()
+            await call()
+            statements[name] = list(captured)
+    finally:
+        event.remove(connection.sync_engine, "before_cursor_execute", record)
+        await session.close()
+    return statements
+
+
+def _node_types(plan: Dict[str, Any]) -> List[str]:
+    """List the node types of a plan tree."""
+    types = [plan["Node Type"]]
+    for child in plan.get("Plans", []):
+        types.extend(_node_types(child))
+    return types
+
+
+@pytest.mark.integration
+async def test_hot_queries_use_indexes(connection: AsyncConnection) -> None:
+    """Test no statement the repository issues scans the tasks table.
+
+    The statements are captured as ``TaskRepository`` sends them, then
+    explained with the parameters they were sent with. The repository's
+    own ``EXPLAIN`` for count estimates is explained as its inner query.
+    """
+    statements = await _capture_statements(connection)
+
+    failures = {}
+    for name, captured in statements.items():
+        assert captured, f"{name} issued no statements on tasks"
+        for statement, parameters in captured:
+            statement = re.sub(r"^EXPLAIN \([^)]*\)\s*", "", statement)
+            result = await connection.exec_driver_sql(
+                f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters
+            )
+            plan = result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            plan = plan[0]["Plan"]
+            if "Seq Scan" in _node_types(plan):
+                failures[f"{name}: {statement}"] = plan
+
+    assert not failures, f"Sequential scans in: {failures}"
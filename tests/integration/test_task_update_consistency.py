@@ -0,0 +1,93 @@
+"""Integration tests for read-modify-write updates next to the batch loader."""
+
+import asyncio
+from typing import AsyncIterator, Dict, List
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.application.dto.task_dto import TaskUpdateDTO
+from app.application.services.task_service import TaskService
+from app.config import settings
+from app.domain.entities.task import Task
+from app.domain.value_objects.task_status import TaskStatus, TaskType
+from app.infrastructure.database.base import Base
+from app.infrastructure.database.batch_loader import BatchLoader
+from app.infrastructure.database.repositories.task_repository import TaskRepository
+
+
+@pytest.fixture
+async def sessions() -> AsyncIterator[async_sessionmaker]:
+    """Create the tables in a scratch schema, skipping without Postgres."""
+    schema = f"update_test_{uuid4().hex[:12]}"
+    engine = create_async_engine(
+        settings.database_url,
+        connect_args={"timeout": 2, "server_settings": {"search_path": schema}},
+    )
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"CREATE SCHEMA {schema}"))
+            await conn.run_sync(Base.metadata.create_all)
+    except (OSError, SQLAlchemyError):
+        await engine.dispose()
+        pytest.skip("PostgreSQL is not available")
+
+    try:
+        yield async_sessionmaker(engine, expire_on_commit=False)
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        await engine.dispose()
+
+
+@pytest.mark.integration
+async def test_update_does_not_write_back_a_shared_stale_read(
+    sessions: async_sessionmaker,
+) -> None:
+    """Test a write landing during a shared fetch survives a later update."""
+    fetched = asyncio.Event()
+    release = asyncio.Event()
+
+    async def fetch(task_ids: List[UUID]) -> Dict[UUID, Task]:
+        async with sessions() as session:
+            tasks = await TaskRepository(session).get_many(task_ids)
+        fetched.set()
+        await release.wait()
+        return {task.id: task for task in tasks}
+
+    loader: BatchLoader[UUID, Task] = BatchLoader(fetch)
+    user_id = uuid4()
+    async with sessions() as session:
+        task = await TaskRepository(session).create(
+            Task(name="report", task_type=TaskType.REPORT_GENERATION, user_id=user_id)
+        )
+
+    async with sessions() as reader, sessions() as writer, sessions() as updater:
+        # A plain read starts a shared fetch, which snapshots the pending task
+        read = asyncio.create_task(TaskRepository(reader, loader).get_by_id(task.id))
+        await fetched.wait()
+
+        # A worker starts the task before the fetch resolves
+        worker_repository = TaskRepository(writer)
+        running = await worker_repository.get_by_id(task.id)
+        running.start()
+        await worker_repository.update(running)
+
+        service = TaskService(TaskRepository(updater, loader))
+        update = asyncio.create_task(
+            service.update_task(task.id, TaskUpdateDTO(name="renamed"), user_id)
+        )
+        await asyncio.sleep(0.1)
+        release.set()
+        stale, updated = await asyncio.gather(read, update)
+
+    async with sessions() as session:
+        stored = await TaskRepository(session).get_by_id(task.id)
+
+    assert stale.status == TaskStatus.PENDING
+    assert updated.status == TaskStatus.RUNNING
+    assert stored.status == TaskStatus.RUNNING
+    assert stored.name == "renamed"
@@ -0,0 +1,132 @@
+"""Tests for admission control."""
+
+import asyncio
+from typing import List
+
+import pytest
+from httpx import AsyncClient
+from starlette.responses import PlainTextResponse
+from starlette.types import Receive, Scope, Send
+
+from app.api.middleware.admission import (
+    AdmissionController,
+    AdmissionMiddleware,
+    Overloaded,
+)
+
+
+@pytest.mark.unit
+async def test_freed_slots_go_to_reads_before_writes() -> None:
+    """Test the shared limit serves the read lane first when a slot frees."""
+    controller = AdmissionController(max_concurrency=1, queue_deadline=5.0)
+    read, write = controller.lanes["read"], controller.lanes["write"]
+    await controller.acquire(write)
+    order: List[str] = []
+
+    async def run(lane_name: str) -> None:
+        await controller.acquire(controller.lanes[lane_name])
+        order.append(lane_name)
+
+    waiters = [asyncio.create_task(run(name)) for name in ("write", "read")]
+    await asyncio.sleep(0)
+    assert len(write.waiters) == 1 and len(read.waiters) == 1
+
+    controller.release(write)
+    await asyncio.sleep(0)
+    controller.release(read)
+    await asyncio.gather(*waiters)
+
+    assert order == ["read", "write"]
+    assert controller.in_flight == 1
+
+
+@pytest.mark.unit
+async def test_sheds_when_expected_wait_exceeds_deadline() -> None:
+    """Test requests are rejected up front once the queue is too long."""
+    controller = AdmissionController(max_concurrency=1, queue_deadline=0.5)
+    lane = controller.lanes["write"]
+    lane.service_time = 0.3
+    await controller.acquire(lane)
+    queued = asyncio.create_task(controller.acquire(lane))
+    await asyncio.sleep(0)
+
+    with pytest.raises(Overloaded) as exc_info:
+        await controller.acquire(lane)
+
+    assert exc_info.value.retry_after == pytest.approx(0.6)
+    controller.release(lane)
+    assert await queued >= 0
+    assert list(lane.waiters) == []
+
+
+@pytest.mark.unit
+async def test_middleware_returns_503_and_lets_health_checks_through() -> None:
+    """Test queued requests past the deadline get a fast 503 with Retry-After."""
+    release = asyncio.Event()
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["path"] == "/slow":
+            await release.wait()
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    middleware = AdmissionMiddleware(app, max_concurrency=1, queue_deadline=0.05)
+    async with AsyncClient(app=middleware, base_url="http://test") as client:
+        slow = asyncio.create_task(client.get("/slow"))
+        await asyncio.sleep(0.01)
+        shed = await client.get("/api/v1/tasks")
+        health = await client.get("/api/v1/health")
+        release.set()
+        assert (await slow).status_code == 200
+
+    assert shed.status_code == 503
+    assert shed.headers["Retry-After"] == "1"
+    assert health.status_code == 200
+    assert middleware.controller.in_flight == 0
+
+
+@pytest.mark.unit
+def test_long_polls_and_uploads_use_the_stream_lane() -> None:
+    """Test requests that hold a slot for long are kept out of shared lanes."""
+    lane = AdmissionMiddleware._lane
+
+    assert lane("GET", "/api/v1/tasks/1", b"wait=30") == "stream"
+    assert lane("GET", "/api/v1/tasks/1", b"fields=id&wait=0") == "read"
+    assert lane("GET", "/api/v1/tasks/1", b"wait=bad") == "read"
+    assert lane("POST", "/api/v1/tasks/imports", b"") == "stream"
+    assert lane("GET", "/api/v1/tasks/imports/1", b"") == "read"
+    assert lane("POST", "/api/v1/tasks", b"") == "write"
+
+
+@pytest.mark.unit
+async def test_exports_count_against_the_shared_limit() -> None:
+    """Test exports, which hold a connection, are capped within the pool."""
+    controller = AdmissionController(
+        max_concurrency=2, lane_limits={"export": 1}, queue_deadline=0.01
+    )
+    export, read = controller.lanes["export"], controller.lanes["read"]
+
+    assert AdmissionMiddleware._lane("GET", "/api/v1/tasks/export") == "export"
+    await controller.acquire(export)
+    with pytest.raises(Overloaded):
+        await controller.acquire(export)
+    await controller.acquire(read)
+    with pytest.raises(Overloaded):
+        await controller.acquire(read)
+    assert controller.in_flight == 2
+
+
+@pytest.mark.unit
+async def test_stream_lane_does_not_learn_service_time() -> None:
+    """Test long-lived requests do not inflate the expected wait."""
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await asyncio.sleep(0.05)
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    middleware = AdmissionMiddleware(app, max_concurrency=1)
+    async with AsyncClient(app=middleware, base_url="http://test") as client:
+        await client.get("/api/v1/tasks/1?wait=5")
+        await client.get("/api/v1/tasks/1")
+
+    assert middleware.controller.lanes["stream"].service_time == 0.0
+    assert middleware.controller.lanes["read"].service_time > 0.0
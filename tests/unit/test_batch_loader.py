@@ -0,0 +1,134 @@
+"""Tests for the request-coalescing batch loader."""
+
+import asyncio
+from typing import Any, Dict, List
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.domain.entities.task import Task
+from app.domain.value_objects.task_status import TaskStatus, TaskType
+from app.infrastructure.database.batch_loader import BatchLoader
+from app.infrastructure.database.models import TaskModel
+from app.infrastructure.database.repositories.task_repository import TaskRepository
+
+
+class RowSession:
+    """Session returning one current row and recording the statements run."""
+
+    def __init__(self, row: TaskModel) -> None:
+        """Initialize fake session."""
+        self.row = row
+        self.statements: List[Any] = []
+
+    async def execute(self, statement: Any) -> "RowSession":
+        """Record a statement and return this session as its result."""
+        self.statements.append(statement)
+        return self
+
+    def scalar_one_or_none(self) -> TaskModel:
+        """Return the current row."""
+        return self.row
+
+
+class RecordingFetch:
+    """Batch fetch returning squares of known keys."""
+
+    def __init__(self, fail: bool = False) -> None:
+        """Initialize fake fetch."""
+        self.fail = fail
+        self.batches: List[List[int]] = []
+
+    async def __call__(self, keys: List[int]) -> Dict[int, int]:
+        """Fetch a batch."""
+        self.batches.append(keys)
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        return {key: key * key for key in keys if key >= 0}
+
+
+@pytest.mark.unit
+async def test_concurrent_loads_share_one_query() -> None:
+    """Test lookups in one tick are batched, deduplicated and fanned out."""
+    fetch = RecordingFetch()
+    loader = BatchLoader(fetch)
+    keys = [i % 10 for i in range(100)] + [-1]
+
+    values = await asyncio.gather(*(loader.load(key) for key in keys))
+
+    assert fetch.batches == [list(range(10)) + [-1]]
+    assert values == [key * key for key in keys[:-1]] + [None]
+
+
+@pytest.mark.unit
+async def test_in_flight_key_is_not_fetched_again() -> None:
+    """Test a key requested while its batch is being fetched joins that batch."""
+    fetch = RecordingFetch()
+    loader = BatchLoader(fetch, max_batch_size=2)
+
+    first = asyncio.gather(loader.load(1), loader.load(2))
+    await asyncio.sleep(0)
+    values = await asyncio.gather(first, loader.load(2), loader.load(3))
+
+    assert fetch.batches == [[1, 2], [3]]
+    assert values == [[1, 4], 4, 9]
+
+
+@pytest.mark.unit
+async def test_fetch_errors_reach_every_caller() -> None:
+    """Test a failed batch fails each lookup and is not cached."""
+    fetch = RecordingFetch(fail=True)
+    loader = BatchLoader(fetch)
+
+    results = await asyncio.gather(
+        loader.load(1), loader.load(1), return_exceptions=True
+    )
+    fetch.fail = False
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert await loader.load(1) == 1
+    assert len(fetch.batches) == 2
+
+
+@pytest.mark.unit
+async def test_repository_returns_a_copy_per_caller() -> None:
+    """Test callers sharing a loaded task cannot see each other's changes."""
+    task = Task(name="report", task_type=TaskType.REPORT_GENERATION, user_id=uuid4())
+
+    async def fetch(task_ids: List[UUID]) -> Dict[UUID, Task]:
+        return {task.id: task}
+
+    repository = TaskRepository(session=None, loader=BatchLoader(fetch))
+    first, second = await asyncio.gather(
+        repository.get_by_id(task.id), repository.get_by_id(task.id)
+    )
+    first.cancel()
+
+    assert first.id == second.id == task.id
+    assert second.status == task.status
+
+
+@pytest.mark.unit
+async def test_read_for_update_bypasses_the_loader() -> None:
+    """Test a read-modify-write sees the row as written, not a shared fetch."""
+    task = Task(name="report", task_type=TaskType.REPORT_GENERATION, user_id=uuid4())
+    stale = task.model_copy()
+    task.start()
+    fetched: List[List[UUID]] = []
+
+    async def fetch(task_ids: List[UUID]) -> Dict[UUID, Task]:
+        fetched.append(task_ids)
+        return {stale.id: stale}
+
+    session = RowSession(TaskModel(**TaskRepository(session=None)._to_row(task)))
+    repository = TaskRepository(session=session, loader=BatchLoader(fetch))
+    shared, locked = await asyncio.gather(
+        repository.get_by_id(task.id), repository.get_by_id(task.id, for_update=True)
+    )
+
+    assert shared.status == TaskStatus.PENDING
+    assert locked.status == TaskStatus.RUNNING
+    assert fetched == [[task.id]]
+    assert len(session.statements) == 1
+    assert "FOR UPDATE" in str(session.statements[0])
@@ -0,0 +1,100 @@
+"""Tests for compression middleware."""
+
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from httpx import AsyncClient
+
+from app.api.middleware.compression import CompressionMiddleware, select_encoding
+
+PAYLOAD = {"result": {"rows": [{"index": i, "ok": True} for i in range(500)]}}
+
+
+def _app() -> FastAPI:
+    """Build an app with compressed routes."""
+    app = FastAPI(default_response_class=ORJSONResponse)
+
+    @app.get("/large")
+    async def large():
+        return ORJSONResponse(PAYLOAD, headers={"ETag": '"v1"'})
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        lines = (json.dumps({"index": i}) + "\n" for i in range(500))
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+
+    @app.get("/events")
+    async def events():
+        return StreamingResponse(
+            iter(["data: x\n\n"] * 200), media_type="text/event-stream"
+        )
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        return {"size": len(await request.body()), "data": await request.json()}
+
+    app.add_middleware(CompressionMiddleware, minimum_size=500, max_request_size=4096)
+    return app
+
+
+@pytest.fixture
+async def client() -> AsyncClient:
+    """Create a client accepting gzip only."""
+    async with AsyncClient(
+        app=_app(), base_url="http://test", headers={"Accept-Encoding": "gzip"}
+    ) as ac:
+        yield ac
+
+
+@pytest.mark.unit
+async def test_large_and_streamed_responses_are_compressed(client: AsyncClient) -> None:
+    """Test compression applies above the threshold and to streams, not SSE."""
+    large = await client.get("/large")
+    assert large.headers["Content-Encoding"] == "gzip"
+    assert large.headers["Vary"] == "Accept-Encoding"
+    assert large.headers["ETag"] == 'W/"v1"'
+    assert int(large.headers["Content-Length"]) < len(json.dumps(PAYLOAD)) / 5
+    assert large.json() == PAYLOAD
+
+    stream = await client.get("/stream")
+    assert stream.headers["Content-Encoding"] == "gzip"
+    assert stream.text.splitlines()[-1] == '{"index": 499}'
+
+    assert "Content-Encoding" not in (await client.get("/small")).headers
+    assert "Content-Encoding" not in (await client.get("/events")).headers
+
+
+@pytest.mark.unit
+async def test_compressed_request_bodies_are_decoded_with_a_limit(
+    client: AsyncClient,
+) -> None:
+    """Test gzip request bodies reach the app decoded and bounded."""
+    body = json.dumps({"parameters": {"data": "x" * 2000}}).encode()
+    headers = {"Content-Encoding": "gzip", "Content-Type": "application/json"}
+
+    decoded = await client.post("/echo", content=gzip.compress(body), headers=headers)
+    assert decoded.json()["size"] == len(body)
+
+    too_large = gzip.compress(b" " * 5000)
+    assert (
+        await client.post("/echo", content=too_large, headers=headers)
+    ).status_code == 413
+    assert (
+        await client.post("/echo", content=b"not gzip", headers=headers)
+    ).status_code == 400
+
+
+@pytest.mark.unit
+def test_select_encoding_honours_q_values() -> None:
+    """Test Accept-Encoding negotiation."""
+    assert select_encoding("gzip") == "gzip"
+    assert select_encoding("identity") is None
+    assert select_encoding("gzip;q=0, deflate") is None
+    assert select_encoding("gzip;q=1, *;q=0.5") == "gzip"
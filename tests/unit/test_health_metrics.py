@@ -0,0 +1,31 @@
+"""Tests for the in-process metrics endpoint."""
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.api.v1.routes import health
+from app.config import settings
+
+
+@pytest.fixture
+async def client() -> AsyncClient:
+    """Create a client for the health routes."""
+    app = FastAPI()
+    app.include_router(health.router, prefix="/api/v1")
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.mark.unit
+async def test_metrics_are_hidden_unless_enabled(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the unauthenticated metrics endpoint is off by default."""
+    response = await client.get("/api/v1/health/metrics")
+    assert response.status_code == 404
+
+    monkeypatch.setattr(settings, "metrics_endpoint_enabled", True)
+    response = await client.get("/api/v1/health/metrics")
+    assert response.status_code == 200
+    assert isinstance(response.json(), dict)
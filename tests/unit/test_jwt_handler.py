@@ -0,0 +1,78 @@
+"""Tests for JWT handler."""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from jose import jwt
+from jose.exceptions import ExpiredSignatureError, JWTError
+
+from app.config import settings
+from app.infrastructure.security.jwt_handler import JWTHandler
+
+
+def _encode(payload: dict, key: str = settings.jwt_secret_key) -> str:
+    """Encode a token with the reference implementation."""
+    return jwt.encode(payload, key, algorithm=settings.jwt_algorithm)
+
+
+@pytest.fixture(params=["hmac", "jose"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test against each verification backend."""
+    monkeypatch.setattr(settings, "jwt_backend", request.param)
+    return request.param
+
+
+@pytest.mark.unit
+def test_access_token_round_trip(backend: str) -> None:
+    """Test an issued access token verifies to its claims."""
+    user_id = uuid4()
+    token = JWTHandler.create_access_token(user_id, "user@example.com")
+
+    claims = JWTHandler.verify_token(token)
+
+    assert claims["sub"] == str(user_id)
+    assert claims["email"] == "user@example.com"
+    assert claims["type"] == "access"
+    assert JWTHandler.decode_token(token) == claims
+
+
+@pytest.mark.unit
+def test_tampered_token_is_rejected(backend: str) -> None:
+    """Test tokens signed with another key are rejected."""
+    token = _encode(
+        {"sub": str(uuid4()), "exp": datetime.utcnow() + timedelta(minutes=5)},
+        key="another-secret-key-of-sufficient-length",
+    )
+
+    with pytest.raises(JWTError):
+        JWTHandler.verify_token(token)
+
+
+@pytest.mark.unit
+def test_expired_token_is_rejected(backend: str) -> None:
+    """Test expired tokens are rejected."""
+    token = _encode(
+        {"sub": str(uuid4()), "exp": datetime.utcnow() - timedelta(seconds=1)}
+    )
+
+    with pytest.raises(ExpiredSignatureError):
+        JWTHandler.decode_token(token)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("token", ["", "a.b", "a.b.c", "not a token"])
+def test_malformed_token_is_rejected(backend: str, token: str) -> None:
+    """Test malformed tokens are rejected."""
+    with pytest.raises(JWTError):
+        JWTHandler.verify_token(token)
+
+
+@pytest.mark.unit
+def test_unsigned_token_is_rejected(backend: str) -> None:
+    """Test tokens declaring another algorithm are rejected."""
+    _, payload, _ = _encode({"sub": str(uuid4())}).split(".")
+    unsigned_header = "eyJhbGciOiJub25lIiwidHlwIjoiSldUIn0"  # {"alg":"none",...}
+
+    with pytest.raises(JWTError):
+        JWTHandler.verify_token(f"{unsigned_header}.{payload}.")
@@ -0,0 +1,44 @@
+"""Tests for in-process TTL cache."""
+
+import pytest
+
+from app.infrastructure.cache import local_cache
+from app.infrastructure.cache.local_cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Control the cache's monotonic clock."""
+    now = [1000.0]
+    monkeypatch.setattr(local_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.unit
+def test_entries_expire(clock: list[float]) -> None:
+    """Test entries expire after their TTL."""
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl=5)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=1)
+
+    clock[0] += 2
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+    clock[0] += 4
+    assert cache.get("a") is None
+
+
+@pytest.mark.unit
+def test_least_recently_used_entry_is_evicted(clock: list[float]) -> None:
+    """Test the cache stays within its size bound."""
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
@@ -0,0 +1,112 @@
+"""Tests for request logging middleware."""
+
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from httpx import AsyncClient
+from structlog.testing import capture_logs
+
+from app.api.middleware.logging_middleware import LoggingMiddleware
+from app.api.middleware.rate_limiter import RateLimitMiddleware
+from app.infrastructure.cache.rate_limit import RateLimitResult
+
+inner_app = FastAPI()
+
+
+@inner_app.get("/api/v1/tasks")
+async def list_tasks(response: Response) -> dict:
+    """Read endpoint setting a request ID of its own."""
+    response.headers["X-Request-ID"] = "req-1"
+    return {}
+
+
+@inner_app.get("/api/v1/tasks/export")
+async def export_tasks() -> StreamingResponse:
+    """Streaming endpoint."""
+
+    async def lines():
+        for i in range(3):
+            yield f"{i}\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@inner_app.get("/api/v1/tasks/broken")
+async def broken() -> dict:
+    """Endpoint failing before it responds."""
+    raise RuntimeError("boom")
+
+
+class RejectingRateLimiter:
+    """Limiter refusing every request."""
+
+    async def hit(self, key: str, limit: int, window: int) -> Optional[RateLimitResult]:
+        """Refuse a hit."""
+        return RateLimitResult(
+            allowed=False, limit=limit, remaining=0, reset_after=10.0, retry_after=3.0
+        )
+
+
+@pytest.mark.unit
+async def test_completed_request_is_logged_with_status_and_duration() -> None:
+    """Test the completion log line and that response headers pass through."""
+    async with AsyncClient(
+        app=LoggingMiddleware(inner_app), base_url="http://test"
+    ) as client:
+        with capture_logs() as logs:
+            response = await client.get("/api/v1/tasks")
+
+    assert response.status_code == 200
+    assert response.headers["X-Request-ID"] == "req-1"
+    started, completed = logs
+    assert started["event"] == "request_started"
+    assert started["method"] == "GET" and started["path"] == "/api/v1/tasks"
+    assert completed["event"] == "request_completed"
+    assert completed["status_code"] == 200
+    assert completed["duration_ms"] >= 0
+
+
+@pytest.mark.unit
+async def test_streaming_response_passes_through_unchanged() -> None:
+    """Test a streamed body reaches the client whole and is logged once."""
+    async with AsyncClient(
+        app=LoggingMiddleware(inner_app), base_url="http://test"
+    ) as client:
+        with capture_logs() as logs:
+            response = await client.get("/api/v1/tasks/export")
+
+    assert response.text == "0\n1\n2\n"
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [log["event"] for log in logs] == ["request_started", "request_completed"]
+
+
+@pytest.mark.unit
+async def test_failed_request_is_logged_as_500() -> None:
+    """Test an exception before the response starts is logged as a 500."""
+    async with AsyncClient(
+        app=LoggingMiddleware(inner_app), base_url="http://test"
+    ) as client:
+        with capture_logs() as logs, pytest.raises(RuntimeError):
+            await client.get("/api/v1/tasks/broken")
+
+    assert logs[-1]["event"] == "request_completed"
+    assert logs[-1]["status_code"] == 500
+
+
+@pytest.mark.unit
+async def test_rate_limited_response_is_logged_with_its_headers() -> None:
+    """Test a 429 from an inner middleware keeps its headers and is logged."""
+    limiter = RateLimitMiddleware(inner_app, requests=1, window=60)
+    limiter.limiter = RejectingRateLimiter()
+    async with AsyncClient(
+        app=LoggingMiddleware(limiter), base_url="http://test"
+    ) as client:
+        with capture_logs() as logs:
+            response = await client.get("/api/v1/tasks")
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "3"
+    assert response.headers["RateLimit-Remaining"] == "0"
+    assert logs[-1]["status_code"] == 429
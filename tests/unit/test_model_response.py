@@ -0,0 +1,94 @@
+"""Tests for rendering response DTOs without re-validation."""
+
+import json
+from datetime import datetime, timedelta
+from typing import Any, Type
+from uuid import uuid4
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import BaseModel
+
+from app.api.responses import model_response
+from app.application.dto.task_dto import TaskResponseDTO
+from app.application.dto.user_dto import UserResponseDTO
+from app.domain.entities.task import Task
+from app.domain.entities.user import User
+from app.domain.value_objects.task_status import TaskPriority, TaskStatus, TaskType
+from app.infrastructure.database.models import TaskModel, UserModel
+from app.infrastructure.database.repositories.task_repository import TaskRepository
+from app.infrastructure.database.repositories.user_repository import UserRepository
+
+NOW = datetime.utcnow()
+
+
+async def _render_validated(dto_class: Type[BaseModel], entity: Any) -> Any:
+    """Render an entity the way ``response_model`` did before."""
+    field = create_response_field(name="response", type_=dto_class)
+    content = await serialize_response(
+        field=field, response_content=dto_class.model_validate(entity)
+    )
+    return json.loads(JSONResponse(content).body)
+
+
+@pytest.mark.unit
+async def test_task_renders_like_the_validated_path() -> None:
+    """Test a task read from a row renders the same JSON as before."""
+    row = TaskModel(
+        id=uuid4(),
+        name="report",
+        description=None,
+        task_type=TaskType.REPORT_GENERATION,
+        status=TaskStatus.COMPLETED,
+        priority=TaskPriority.HIGH,
+        user_id=uuid4(),
+        parameters={"tags": ["a", "b"], "limit": 10},
+        result={"rows": 3, "ok": True, "ratio": 0.5},
+        result_ref=None,
+        result_size=None,
+        error_message=None,
+        retry_count=1,
+        max_retries=3,
+        started_at=NOW,
+        completed_at=NOW + timedelta(seconds=1),
+        created_at=NOW,
+        updated_at=NOW + timedelta(microseconds=1),
+    )
+    task = TaskRepository(session=None)._to_entity(row)
+    expected = await _render_validated(
+        TaskResponseDTO,
+        Task(**{column: getattr(row, column) for column in Task.model_fields}),
+    )
+
+    response = model_response(TaskResponseDTO.from_entity(task))
+
+    assert json.loads(response.body) == expected
+
+
+@pytest.mark.unit
+async def test_user_renders_like_the_validated_path() -> None:
+    """Test a user read from a row renders the same JSON as before."""
+    row = UserModel(
+        id=uuid4(),
+        email="user@example.com",
+        username="user",
+        hashed_password="x",
+        full_name=None,
+        is_active=True,
+        is_superuser=False,
+        role="user",
+        created_at=NOW,
+        updated_at=NOW,
+    )
+    user = UserRepository(session=None)._to_entity(row)
+    expected = await _render_validated(
+        UserResponseDTO,
+        User(**{column: getattr(row, column) for column in User.model_fields}),
+    )
+
+    response = model_response(UserResponseDTO.from_entity(user))
+
+    assert json.loads(response.body) == expected
+    assert "hashed_password" not in expected
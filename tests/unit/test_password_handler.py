@@ -1,6 +1,7 @@
 """Tests for password handler."""
 
 import pytest
+from passlib.context import CryptContext
 
 from app.infrastructure.security.password_handler import PasswordHandler
 
@@ -11,7 +12,7 @@ def test_hash_password() -> None:
     handler = PasswordHandler()
     password = "test_password_123"
     hashed = handler.hash_password(password)
-    
+
     assert hashed != password
     assert len(hashed) > 0
 
@@ -22,8 +23,35 @@ def test_verify_password() -> None:
     handler = PasswordHandler()
     password = "test_password_123"
     hashed = handler.hash_password(password)
-    
+
     assert handler.verify_password(password, hashed) is True
     assert handler.verify_password("wrong_password", hashed) is False
 
 
+
+
+@pytest.mark.unit
+async def test_async_hash_and_verify() -> None:
+    """Test hashing and verification on the hashing pool."""
+    handler = PasswordHandler()
+    password = "test_password_123"
+    hashed = await handler.hash_password_async(password)
+
+    assert await handler.verify_password_async(password, hashed) is True
+    assert await handler.verify_password_async("wrong_password", hashed) is False
+    assert handler.needs_rehash(hashed) is False
+
+
+@pytest.mark.unit
+async def test_verify_and_update_rehashes_outdated_hash() -> None:
+    """Test hashes with another cost factor are upgraded on verification."""
+    handler = PasswordHandler()
+    password = "test_password_123"
+    outdated = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash(password)
+
+    is_valid, new_hash = await handler.verify_and_update_async(password, outdated)
+
+    assert is_valid is True
+    assert new_hash is not None
+    assert handler.needs_rehash(new_hash) is False
+    assert handler.verify_password(password, new_hash) is True
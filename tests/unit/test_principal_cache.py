@@ -0,0 +1,55 @@
+"""Tests for principal caching in the auth service."""
+
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+import pytest
+
+from app.application.services.auth_service import AuthService
+from app.domain.entities.user import Principal, User
+from app.infrastructure.security.jwt_handler import JWTHandler
+
+USER = User(email="user@example.com", username="user", hashed_password="secret-hash")
+
+
+class InMemoryUserRepository:
+    """User repository holding one user."""
+
+    async def get_by_id(self, user_id: UUID) -> Optional[User]:
+        """Get user by ID."""
+        return USER if user_id == USER.id else None
+
+
+class RecordingPrincipalCache:
+    """Principal cache that misses and records what it is asked to store."""
+
+    def __init__(self) -> None:
+        """Initialize fake cache."""
+        self.stored: List[Tuple[Principal, int]] = []
+
+    async def get(self, user_id: UUID) -> Optional[Principal]:
+        """Miss."""
+        return None
+
+    async def get_generation(self, user_id: UUID) -> Optional[int]:
+        """Get a fixed generation."""
+        return 7
+
+    async def set(self, principal: Principal, generation: int) -> None:
+        """Record a cached principal."""
+        self.stored.append((principal, generation))
+
+
+@pytest.mark.unit
+async def test_only_the_principal_projection_is_cached() -> None:
+    """Test password hashes never reach the cache, and sets carry the generation."""
+    cache = RecordingPrincipalCache()
+    service = AuthService(InMemoryUserRepository(), None, cache)
+
+    principal = await service.get_current_user(
+        JWTHandler.create_access_token(USER.id, USER.email)
+    )
+
+    assert principal == Principal.from_user(USER)
+    assert cache.stored == [(principal, 7)]
+    assert "secret-hash" not in principal.model_dump_json()
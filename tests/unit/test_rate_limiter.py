@@ -0,0 +1,174 @@
+"""Tests for rate limiting middleware."""
+
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import AsyncClient
+
+from app.api.middleware.rate_limiter import RateLimitMiddleware
+from app.infrastructure.cache.rate_limit import (
+    HybridRateLimiter,
+    RateLimiter,
+    RateLimitResult,
+)
+from app.infrastructure.security.jwt_handler import JWTHandler
+
+inner_app = FastAPI()
+
+
+@inner_app.get("/api/v1/tasks")
+async def list_tasks() -> dict:
+    """Cheap read endpoint."""
+    return {}
+
+
+@inner_app.get("/api/v1/tasks/export")
+async def export_tasks() -> StreamingResponse:
+    """Streaming read endpoint."""
+
+    async def lines():
+        for i in range(3):
+            yield f"{i}\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@inner_app.post("/api/v1/auth/login")
+async def login() -> dict:
+    """Cheap auth endpoint."""
+    return {}
+
+
+class FakeRateLimiter:
+    """Fixed-count limiter recording the buckets it is asked about."""
+
+    def __init__(self, available: bool = True) -> None:
+        """Initialize fake limiter."""
+        self.available = available
+        self.hits: Dict[str, int] = {}
+        self.calls: List[Tuple[str, int, int]] = []
+
+    async def hit(self, key: str, limit: int, window: int) -> Optional[RateLimitResult]:
+        """Count a hit against a bucket."""
+        self.calls.append((key, limit, window))
+        if not self.available:
+            return None
+        self.hits[key] = self.hits.get(key, 0) + 1
+        allowed = self.hits[key] <= limit
+        return RateLimitResult(
+            allowed=allowed,
+            limit=limit,
+            remaining=max(limit - self.hits[key], 0),
+            reset_after=30.5,
+            retry_after=0 if allowed else 1.2,
+        )
+
+
+def _client(limiter: FakeRateLimiter, **options) -> AsyncClient:
+    """Build a client for the test app behind the rate limiter."""
+    middleware = RateLimitMiddleware(inner_app, window=60, **options)
+    middleware.limiter = limiter
+    return AsyncClient(app=middleware, base_url="http://test")
+
+
+@pytest.mark.unit
+async def test_requests_over_limit_are_rejected_with_headers() -> None:
+    """Test allowed and rejected responses carry rate limit headers."""
+    limiter = FakeRateLimiter()
+    async with _client(limiter, requests=2) as client:
+        responses = [await client.get("/api/v1/tasks") for _ in range(3)]
+
+    assert [r.status_code for r in responses] == [200, 200, 429]
+    assert responses[0].headers["RateLimit-Limit"] == "2"
+    assert responses[0].headers["RateLimit-Remaining"] == "1"
+    assert responses[0].headers["RateLimit-Reset"] == "31"
+    assert responses[0].headers["RateLimit-Policy"] == "2;w=60"
+    assert "Retry-After" not in responses[0].headers
+    assert responses[2].headers["Retry-After"] == "2"
+    assert responses[2].json()["detail"].startswith("Rate limit exceeded")
+
+
+@pytest.mark.unit
+async def test_headers_are_added_to_streaming_responses() -> None:
+    """Test the send wrapper adds headers without touching a streamed body."""
+    async with _client(FakeRateLimiter(), requests=2) as client:
+        response = await client.get("/api/v1/tasks/export")
+
+    assert response.status_code == 200
+    assert response.text == "0\n1\n2\n"
+    assert response.headers["RateLimit-Remaining"] == "1"
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+
+@pytest.mark.unit
+async def test_buckets_are_keyed_by_identity_and_route_class() -> None:
+    """Test users, API keys and route classes get their own limits."""
+    limiter = FakeRateLimiter()
+    user_id = uuid4()
+    token = JWTHandler.create_access_token(user_id, "user@example.com")
+    async with _client(
+        limiter,
+        requests=10,
+        user_requests=50,
+        api_key_requests=30,
+        route_limits={"auth": 5},
+    ) as client:
+        await client.get("/api/v1/tasks", headers={"Authorization": f"Bearer {token}"})
+        await client.get("/api/v1/tasks", headers={"X-API-Key": "secret"})
+        await client.get("/api/v1/tasks", headers={"Authorization": "Bearer junk"})
+        await client.post("/api/v1/auth/login")
+
+    keys = [key for key, _, _ in limiter.calls]
+    limits = [limit for _, limit, _ in limiter.calls]
+    assert keys[0] == f"read:user:{user_id}"
+    assert keys[1].startswith("read:api_key:") and "secret" not in keys[1]
+    assert keys[2].startswith("read:ip:")
+    assert keys[3].startswith("auth:ip:")
+    assert limits == [50, 30, 10, 5]
+
+
+@pytest.mark.unit
+async def test_limiter_outage_fails_open() -> None:
+    """Test requests pass without headers when the limiter is unavailable."""
+    async with _client(FakeRateLimiter(available=False), requests=1) as client:
+        responses = [await client.get("/api/v1/tasks") for _ in range(3)]
+
+    assert [r.status_code for r in responses] == [200, 200, 200]
+    assert "RateLimit-Limit" not in responses[0].headers
+
+
+@pytest.mark.unit
+async def test_hybrid_limiter_serves_requests_from_leased_blocks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the hybrid limiter leases blocks and decides locally in between."""
+    leases: List[Tuple[int, bool]] = []
+    available = [25]
+
+    async def lease(self, key, limit, window, cost=1, partial=False):
+        leases.append((cost, partial))
+        granted = min(cost, available[0])
+        available[0] -= granted
+        return RateLimitResult(
+            allowed=granted > 0,
+            limit=limit,
+            remaining=available[0],
+            reset_after=1.0,
+            retry_after=0 if granted else 5.0,
+            granted=granted,
+        )
+
+    monkeypatch.setattr(RateLimiter, "hit", lease)
+    limiter = HybridRateLimiter(lease_fraction=0.1)
+
+    results = [await limiter.hit("read:ip:1", 100, 60) for _ in range(30)]
+
+    assert [r.allowed for r in results] == [True] * 25 + [False] * 5
+    # Three leases grant 25 tokens; the refused fourth is remembered locally
+    assert leases == [(10, True), (10, True), (10, True), (10, True)]
+    # 15 left in the shared bucket plus 9 still leased to this process
+    assert results[0].remaining == 24
+    assert results[-1].retry_after > 4
@@ -0,0 +1,142 @@
+"""Tests for batch task creation."""
+
+from typing import Any, List
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from app.api.v1.routes import tasks
+from app.api.v1.routes.auth import get_current_user
+from app.application.services.task_service import TaskService
+from app.dependencies import get_task_service
+from app.domain.entities.task import Task
+from app.domain.entities.user import User
+from app.domain.value_objects.task_status import TaskType
+from app.infrastructure.database.repositories.task_repository import TaskRepository
+
+USER = User(email="user@example.com", username="user", hashed_password="x")
+
+
+class BatchTaskRepository:
+    """Task repository recording bulk creates."""
+
+    def __init__(self) -> None:
+        """Initialize fake repository."""
+        self.batches: List[List[Task]] = []
+
+    async def create_many(self, tasks: List[Task]) -> List[Task]:
+        """Record a bulk create."""
+        self.batches.append(tasks)
+        return tasks
+
+
+class RecordingSession:
+    """Session recording the statements it executes and its commits."""
+
+    def __init__(self) -> None:
+        """Initialize fake session."""
+        self.executed: List[Any] = []
+        self.commits = 0
+
+    async def execute(self, statement: Any, params: Any = None) -> None:
+        """Record a statement and its parameters."""
+        self.executed.append((statement, params))
+
+    async def commit(self) -> None:
+        """Count a commit."""
+        self.commits += 1
+
+
+@pytest.fixture
+def repository() -> BatchTaskRepository:
+    """Create the fake repository."""
+    return BatchTaskRepository()
+
+
+@pytest.fixture
+def service(repository: BatchTaskRepository) -> TaskService:
+    """Create a task service recording queued tasks instead of sending them."""
+    service = TaskService(repository)
+    service.queued = []
+    service._queue_tasks = service.queued.append
+    return service
+
+
+@pytest.fixture
+async def client(service: TaskService) -> AsyncClient:
+    """Create a client for the task routes."""
+    app = FastAPI()
+    app.include_router(tasks.router, prefix="/api/v1")
+    app.dependency_overrides[get_current_user] = lambda: USER
+    app.dependency_overrides[get_task_service] = lambda: service
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.mark.unit
+async def test_batch_reports_each_item_and_creates_valid_ones_together(
+    client: AsyncClient, service: TaskService, repository: BatchTaskRepository
+) -> None:
+    """Test one bulk create and one enqueue cover every valid item."""
+    response = await client.post(
+        "/api/v1/tasks/batch",
+        json={
+            "tasks": [
+                {"name": "a", "task_type": "email"},
+                {"name": "b", "task_type": "unknown"},
+                {"name": "c", "task_type": "report_generation"},
+            ]
+        },
+    )
+
+    body = response.json()
+    assert response.status_code == 200
+    assert (body["created"], body["failed"]) == (2, 1)
+    assert [item["task"]["name"] for item in body["items"] if item["task"]] == [
+        "a",
+        "c",
+    ]
+    assert "task_type" in body["items"][1]["error"]
+    assert [[task.name for task in batch] for batch in repository.batches] == [
+        ["a", "c"]
+    ]
+    assert service.queued == repository.batches
+
+
+@pytest.mark.unit
+async def test_batch_over_the_limit_is_rejected(
+    client: AsyncClient, repository: BatchTaskRepository, monkeypatch
+) -> None:
+    """Test batches over the size limit get 413 without touching the database."""
+    monkeypatch.setattr(tasks.settings, "task_batch_max_size", 1)
+
+    response = await client.post(
+        "/api/v1/tasks/batch",
+        json={"tasks": [{"name": name, "task_type": "email"} for name in "ab"]},
+    )
+
+    assert response.status_code == 413
+    assert repository.batches == []
+
+
+@pytest.mark.unit
+async def test_create_many_inserts_all_rows_in_one_statement() -> None:
+    """Test the repository sends one bulk insert and commits once."""
+    session = RecordingSession()
+    batch = [
+        Task(name=name, task_type=TaskType.EMAIL, user_id=USER.id) for name in "abc"
+    ]
+
+    created = await TaskRepository(session).create_many(batch)
+
+    assert created == batch
+    assert session.commits == 1
+    ((statement, rows),) = session.executed
+    assert statement.table.name == "tasks"
+    # RETURNING is what makes asyncpg batch rows into multi-row VALUES
+    assert "RETURNING tasks.id" in str(statement.compile(dialect=asyncpg.dialect()))
+    assert [row["id"] for row in rows] == [task.id for task in batch]
+    assert await TaskRepository(session).create_many([]) == []
+    assert session.commits == 1
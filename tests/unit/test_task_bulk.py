@@ -0,0 +1,96 @@
+"""Tests for bulk task operations."""
+
+from typing import Dict, List, Tuple
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from app.application.dto.task_dto import TaskBulkSelectionDTO
+from app.application.services import task_service
+from app.application.services.task_service import TaskService
+from app.domain.entities.task import Task
+from app.domain.value_objects.task_status import (
+    TERMINAL_TASK_STATUSES,
+    TaskStatus,
+    TaskType,
+)
+
+
+class InMemoryTaskRepository:
+    """Task repository over a list, cancelling in batches."""
+
+    def __init__(self, tasks: List[Task]) -> None:
+        """Initialize fake repository."""
+        self.tasks = tasks
+        self.batches = 0
+
+    async def cancel_many(
+        self, user_id: UUID, status=None, limit: int = 1000, **filters
+    ) -> List[Tuple[Task, TaskStatus]]:
+        """Cancel up to ``limit`` matching unfinished tasks."""
+        self.batches += 1
+        batch = [
+            task
+            for task in self.tasks
+            if task.user_id == user_id
+            and task.status not in TERMINAL_TASK_STATUSES
+            and (status is None or task.status == status)
+        ][:limit]
+        previous = [task.status for task in batch]
+        for task in batch:
+            task.cancel()
+        return list(zip(batch, previous, strict=True))
+
+
+class FakeTaskCountCache:
+    """Count cache recording the applied deltas."""
+
+    def __init__(self) -> None:
+        """Initialize fake cache."""
+        self.deltas: List[Dict[TaskStatus, int]] = []
+
+    async def adjust(self, user_id: UUID, deltas: Dict[TaskStatus, int]) -> None:
+        """Record count deltas."""
+        self.deltas.append(deltas)
+
+
+@pytest.mark.unit
+async def test_bulk_cancel_runs_in_bounded_batches(monkeypatch) -> None:
+    """Test bulk cancel loops over batches, revoking and counting each."""
+    user_id = uuid4()
+    tasks = [
+        Task(name="task", task_type=TaskType.EMAIL, user_id=user_id) for _ in range(5)
+    ]
+    tasks[0].start()
+    tasks[1].complete()
+    revoked: List[List[str]] = []
+    monkeypatch.setattr(task_service.settings, "task_bulk_batch_size", 2)
+    monkeypatch.setattr(
+        task_service.celery_app.control, "revoke", lambda ids: revoked.append(ids)
+    )
+    repository = InMemoryTaskRepository(tasks)
+    count_cache = FakeTaskCountCache()
+    service = TaskService(repository, task_count_cache=count_cache)
+
+    result = await service.cancel_tasks(
+        user_id, TaskBulkSelectionDTO(created_before="2999-01-01T00:00:00Z")
+    )
+
+    assert result.affected == 4
+    assert result.by_status == {TaskStatus.RUNNING: 1, TaskStatus.PENDING: 3}
+    assert repository.batches == 3
+    assert [len(ids) for ids in revoked] == [2, 2]
+    assert count_cache.deltas[0] == {
+        TaskStatus.RUNNING: -1,
+        TaskStatus.PENDING: -1,
+        TaskStatus.CANCELLED: 2,
+    }
+    assert tasks[1].status == TaskStatus.COMPLETED
+
+
+@pytest.mark.unit
+def test_bulk_selection_requires_ids_or_a_filter() -> None:
+    """Test an empty selection is rejected instead of selecting every task."""
+    with pytest.raises(ValidationError):
+        TaskBulkSelectionDTO()
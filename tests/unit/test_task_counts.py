@@ -0,0 +1,156 @@
+"""Tests for cached task counts and list totals."""
+
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.application.dto.task_dto import TaskCreateDTO, TotalMode
+from app.application.services.task_service import TaskService
+from app.domain.entities.task import Task
+from app.domain.value_objects.task_status import TaskStatus, TaskType
+
+USER_ID = uuid4()
+
+
+class CountingTaskRepository:
+    """Task repository over a list, counting the count queries it serves."""
+
+    def __init__(self, statuses: List[TaskStatus]) -> None:
+        """Create one task per status."""
+        self.tasks = []
+        for status in statuses:
+            task = Task(name="task", task_type=TaskType.EMAIL, user_id=USER_ID)
+            task.status = status
+            self.tasks.append(task)
+        self.count_queries = 0
+
+    async def create(self, task: Task) -> Task:
+        """Create a task."""
+        self.tasks.append(task)
+        return task
+
+    async def get_by_user_id(self, user_id: UUID, **kwargs) -> List[Task]:
+        """Get a page of the user's tasks."""
+        return self.tasks[: kwargs["limit"]]
+
+    async def count_by_status(self, user_id: UUID) -> Dict[TaskStatus, int]:
+        """Count the user's tasks by status."""
+        self.count_queries += 1
+        counts: Dict[TaskStatus, int] = {}
+        for task in self.tasks:
+            counts[task.status] = counts.get(task.status, 0) + 1
+        return counts
+
+    async def estimate_count_by_user_id(
+        self, user_id: UUID, status: Optional[TaskStatus] = None
+    ) -> int:
+        """Return a round planner estimate."""
+        return 1000
+
+
+class InMemoryTaskCountCache:
+    """Count cache with the Redis cache's seed and adjust semantics."""
+
+    def __init__(self) -> None:
+        """Initialize fake cache."""
+        self.counts: Dict[UUID, Dict[TaskStatus, int]] = {}
+        self.versions: Dict[UUID, int] = {}
+        self.seeds: List[Tuple[UUID, int]] = []
+
+    async def get_counts(self, user_id: UUID) -> Optional[Dict[TaskStatus, int]]:
+        """Get cached counts."""
+        counts = self.counts.get(user_id)
+        return dict(counts) if counts is not None else None
+
+    async def get_version(self, user_id: UUID) -> Optional[int]:
+        """Get the list version."""
+        return self.versions.setdefault(user_id, 1)
+
+    async def set_counts(
+        self, user_id: UUID, counts: Dict[TaskStatus, int], version: int
+    ) -> None:
+        """Seed counts unless already seeded or a write came in between."""
+        self.seeds.append((user_id, version))
+        if user_id not in self.counts and self.versions.get(user_id) == version:
+            self.counts[user_id] = dict(counts)
+
+    async def adjust(self, user_id: UUID, deltas: Dict[TaskStatus, int]) -> None:
+        """Bump the version and apply deltas to seeded counts."""
+        self.versions[user_id] = self.versions.get(user_id, 1) + 1
+        counts = self.counts.get(user_id)
+        if counts is not None:
+            for status, delta in deltas.items():
+                counts[status] = counts.get(status, 0) + delta
+
+
+def _service(
+    repository: CountingTaskRepository, cache: InMemoryTaskCountCache
+) -> TaskService:
+    """Build a service that does not queue tasks."""
+    service = TaskService(repository, cache)
+    service._queue_task = lambda task_id, task_type: None
+    return service
+
+
+@pytest.mark.unit
+async def test_exact_total_is_seeded_once_then_adjusted() -> None:
+    """Test the first total seeds the cache and writes keep it current."""
+    repository = CountingTaskRepository([TaskStatus.PENDING, TaskStatus.COMPLETED])
+    cache = InMemoryTaskCountCache()
+    service = _service(repository, cache)
+
+    first = await service.get_user_tasks(USER_ID, page_size=1)
+    await service.create_task(
+        USER_ID, TaskCreateDTO(name="new", task_type=TaskType.EMAIL)
+    )
+    second = await service.get_user_tasks(USER_ID, page_size=1)
+    pending = await service.get_user_tasks(USER_ID, status=TaskStatus.PENDING)
+
+    assert (first.total, first.total_pages, first.total_is_estimate) == (2, 2, False)
+    assert first.next_cursor is not None
+    assert second.total == 3
+    assert pending.total == 2
+    assert repository.count_queries == 1
+
+
+@pytest.mark.unit
+async def test_seed_is_skipped_after_a_racing_write() -> None:
+    """Test counts taken before a concurrent write are not cached."""
+    repository = CountingTaskRepository([TaskStatus.PENDING])
+    cache = InMemoryTaskCountCache()
+    service = _service(repository, cache)
+    count_by_status = repository.count_by_status
+
+    async def count_then_write(user_id: UUID) -> Dict[TaskStatus, int]:
+        counts = await count_by_status(user_id)
+        await cache.adjust(user_id, {TaskStatus.PENDING: 1})
+        return counts
+
+    repository.count_by_status = count_then_write
+    await service.get_user_tasks(USER_ID)
+    repository.count_by_status = count_by_status
+    result = await service.get_user_tasks(USER_ID)
+
+    assert cache.seeds[0] == (USER_ID, 1)
+    assert result.total == 1
+    assert repository.count_queries == 2
+
+
+@pytest.mark.unit
+async def test_total_modes() -> None:
+    """Test estimated totals are flagged and no total skips counting."""
+    repository = CountingTaskRepository([TaskStatus.PENDING])
+    service = _service(repository, InMemoryTaskCountCache())
+
+    estimate = await service.get_user_tasks(USER_ID, total_mode=TotalMode.ESTIMATE)
+    none = await service.get_user_tasks(USER_ID, total_mode=TotalMode.NONE)
+
+    assert (estimate.total, estimate.total_pages) == (1000, 50)
+    assert estimate.total_is_estimate
+    assert (none.total, none.total_pages, none.total_is_estimate) == (
+        None,
+        None,
+        False,
+    )
+    assert repository.count_queries == 0
@@ -0,0 +1,27 @@
+"""Tests for task pagination cursor."""
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.domain.exceptions.domain_exceptions import InvalidCursorError
+from app.domain.value_objects.cursor import TaskCursor
+
+
+@pytest.mark.unit
+def test_cursor_round_trip() -> None:
+    """Test cursor encoding and decoding."""
+    cursor = TaskCursor(created_at=datetime(2024, 1, 1, 12, 30, 5, 123456), id=uuid4())
+    token = cursor.encode()
+
+    assert "=" not in token
+    assert TaskCursor.decode(token) == cursor
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "bm90fGF8Y3Vyc29y"])
+def test_decode_invalid_cursor(token: str) -> None:
+    """Test decoding malformed cursors."""
+    with pytest.raises(InvalidCursorError):
+        TaskCursor.decode(token)
@@ -0,0 +1,179 @@
+"""Tests for conditional task reads."""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.api.responses import etag_matches
+from app.api.v1.routes import tasks
+from app.api.v1.routes.auth import get_current_user
+from app.application.dto.task_dto import TaskUpdateDTO
+from app.application.services.task_service import TaskService
+from app.dependencies import get_task_service
+from app.domain.entities.task import Task
+from app.domain.entities.user import User
+from app.domain.value_objects.task_status import TaskStatus, TaskType
+
+USER = User(email="user@example.com", username="user", hashed_password="x")
+
+
+class InMemoryTaskRepository:
+    """Task repository over a list, counting full reads."""
+
+    def __init__(self) -> None:
+        """Create a couple of tasks."""
+        self.tasks = [
+            Task(name=f"task-{i}", task_type=TaskType.DATA_PROCESSING, user_id=USER.id)
+            for i in range(2)
+        ]
+        self.full_reads = 0
+
+    async def get_by_id(
+        self, task_id: UUID, fields=None, for_update: bool = False
+    ) -> Optional[Task]:
+        """Get task by ID."""
+        self.full_reads += 1
+        return next((task for task in self.tasks if task.id == task_id), None)
+
+    async def get_by_user_id(self, user_id: UUID, **kwargs) -> List[Task]:
+        """Get the user's tasks."""
+        self.full_reads += 1
+        return list(self.tasks)
+
+    async def count_by_user_id(self, user_id: UUID, status=None) -> int:
+        """Count the user's tasks."""
+        return len(self.tasks)
+
+    async def count_by_status(self, user_id: UUID) -> Dict[TaskStatus, int]:
+        """Count the user's tasks by status."""
+        return {TaskStatus.PENDING: len(self.tasks)}
+
+    async def get_version(self, task_id: UUID) -> Optional[Tuple[UUID, datetime]]:
+        """Get a task's owner and last update time."""
+        task = next((task for task in self.tasks if task.id == task_id), None)
+        return (task.user_id, task.updated_at) if task else None
+
+    async def update(self, task: Task) -> Task:
+        """Update a task in place."""
+        return task
+
+
+class FakeTaskCountCache:
+    """Count cache keeping list versions in memory."""
+
+    def __init__(self) -> None:
+        """Initialize fake cache."""
+        self.versions: Dict[UUID, int] = {}
+
+    async def get_counts(self, user_id: UUID) -> Optional[Dict[TaskStatus, int]]:
+        """Report counts as not cached."""
+        return None
+
+    async def set_counts(
+        self, user_id: UUID, counts: Dict[TaskStatus, int], version: int
+    ) -> None:
+        """Ignore seeded counts."""
+
+    async def get_version(self, user_id: UUID) -> Optional[int]:
+        """Get a user's list version."""
+        return self.versions.setdefault(user_id, 1)
+
+    async def adjust(self, user_id: UUID, deltas: Dict[TaskStatus, int]) -> None:
+        """Bump a user's list version."""
+        self.versions[user_id] = self.versions.get(user_id, 1) + 1
+
+
+@pytest.fixture
+def repository() -> InMemoryTaskRepository:
+    """Create the in-memory repository."""
+    return InMemoryTaskRepository()
+
+
+@pytest.fixture
+def service(repository: InMemoryTaskRepository) -> TaskService:
+    """Create a task service without a count cache."""
+    return TaskService(repository)
+
+
+@pytest.fixture
+async def client(service: TaskService) -> AsyncClient:
+    """Create a client for the task routes."""
+    app = FastAPI()
+    app.include_router(tasks.router, prefix="/api/v1")
+    app.dependency_overrides[get_current_user] = lambda: USER
+    app.dependency_overrides[get_task_service] = lambda: service
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.mark.unit
+async def test_task_detail_is_not_modified_until_updated(
+    client: AsyncClient, repository: InMemoryTaskRepository
+) -> None:
+    """Test a matching ETag skips the full read until the task changes."""
+    url = f"/api/v1/tasks/{repository.tasks[0].id}"
+    response = await client.get(url)
+    etag = response.headers["ETag"]
+
+    cached = await client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert repository.full_reads == 1
+
+    repository.tasks[0].updated_at = datetime.utcnow()
+    changed = await client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+@pytest.mark.unit
+async def test_task_list_etag_covers_filters(
+    client: AsyncClient, service: TaskService, repository: InMemoryTaskRepository
+) -> None:
+    """Test list ETags come from the list version and skip the page read."""
+    service.task_count_cache = FakeTaskCountCache()
+    etag = (await client.get("/api/v1/tasks")).headers["ETag"]
+
+    cached = await client.get("/api/v1/tasks", headers={"If-None-Match": etag})
+    other_page = await client.get(
+        "/api/v1/tasks?page_size=5", headers={"If-None-Match": etag}
+    )
+    assert repository.full_reads == 2
+    await service.update_task(
+        repository.tasks[0].id, TaskUpdateDTO(name="renamed"), USER.id
+    )
+    changed = await client.get("/api/v1/tasks", headers={"If-None-Match": etag})
+
+    assert cached.status_code == 304
+    assert other_page.status_code == 200
+    assert changed.status_code == 200
+
+
+@pytest.mark.unit
+async def test_task_list_etag_hashes_the_page_without_a_cache(
+    client: AsyncClient, repository: InMemoryTaskRepository
+) -> None:
+    """Test list ETags fall back to the page content without a count cache."""
+    etag = (await client.get("/api/v1/tasks")).headers["ETag"]
+
+    cached = await client.get("/api/v1/tasks", headers={"If-None-Match": etag})
+    repository.tasks[0].name = "renamed"
+    changed = await client.get("/api/v1/tasks", headers={"If-None-Match": etag})
+
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+@pytest.mark.unit
+def test_etag_matching_handles_lists_and_weak_tags() -> None:
+    """Test If-None-Match parsing."""
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"c"')
+    assert not etag_matches('"a"', '"c"')
+    assert not etag_matches(None, '"c"')
@@ -0,0 +1,55 @@
+"""Tests for task event fan-out."""
+
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.application.dto.task_dto import TaskEventDTO
+from app.domain.value_objects.task_status import TaskStatus
+from app.infrastructure.events.task_events import TaskEventBroker
+
+
+def _event(user_id: UUID, status: TaskStatus = TaskStatus.RUNNING) -> str:
+    """Build a raw event payload."""
+    return TaskEventDTO(
+        task_id=uuid4(), user_id=user_id, status=status, updated_at=datetime.utcnow()
+    ).model_dump_json()
+
+
+@pytest.fixture
+def broker(monkeypatch: pytest.MonkeyPatch) -> TaskEventBroker:
+    """Create a broker that does not connect to Redis."""
+    broker = TaskEventBroker(queue_size=2)
+    monkeypatch.setattr(broker, "_ensure_listening", lambda: None)
+    return broker
+
+
+@pytest.mark.unit
+async def test_dispatch_routes_events_by_user(broker: TaskEventBroker) -> None:
+    """Test events only reach subscribers of the same user."""
+    user_id, other_user_id = uuid4(), uuid4()
+    async with broker.subscribe(user_id) as first, broker.subscribe(
+        user_id
+    ) as second, broker.subscribe(other_user_id) as other:
+        broker._dispatch(_event(user_id))
+
+        assert first.qsize() == 1
+        assert second.qsize() == 1
+        assert other.empty()
+
+    assert broker._subscribers == {}
+
+
+@pytest.mark.unit
+async def test_dispatch_drops_oldest_event_when_full(broker: TaskEventBroker) -> None:
+    """Test a slow subscriber keeps the most recent events."""
+    user_id = uuid4()
+    async with broker.subscribe(user_id) as queue:
+        for status in (TaskStatus.RUNNING, TaskStatus.COMPLETED, TaskStatus.FAILED):
+            broker._dispatch(_event(user_id, status))
+
+        assert [queue.get_nowait().status for _ in range(2)] == [
+            TaskStatus.COMPLETED,
+            TaskStatus.FAILED,
+        ]
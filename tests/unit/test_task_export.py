@@ -0,0 +1,82 @@
+"""Tests for task history export."""
+
+import csv
+import io
+import json
+from typing import AsyncIterator, List
+from uuid import UUID
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.api.v1.routes import tasks
+from app.api.v1.routes.auth import get_current_user
+from app.application.services.task_service import TaskService
+from app.dependencies import get_task_service
+from app.domain.entities.task import Task
+from app.domain.entities.user import User
+from app.domain.value_objects.task_status import TaskType
+
+USER = User(email="user@example.com", username="user", hashed_password="x")
+
+
+class StreamingTaskRepository:
+    """Task repository streaming generated tasks."""
+
+    def __init__(self, count: int) -> None:
+        """Initialize fake repository."""
+        self.count = count
+        self.batch_sizes: List[int] = []
+
+    async def stream_by_user_id(
+        self, user_id: UUID, status=None, fields=None, batch_size: int = 1000
+    ) -> AsyncIterator[Task]:
+        """Yield the user's tasks one by one."""
+        self.batch_sizes.append(batch_size)
+        for i in range(self.count):
+            yield Task(
+                name=f"task-{i}",
+                task_type=TaskType.EMAIL,
+                user_id=user_id,
+                parameters={"index": i},
+            )
+
+
+@pytest.fixture
+async def client() -> AsyncClient:
+    """Create a client for the task routes."""
+    app = FastAPI()
+    app.include_router(tasks.router, prefix="/api/v1")
+    app.dependency_overrides[get_current_user] = lambda: USER
+    app.dependency_overrides[get_task_service] = lambda: TaskService(
+        StreamingTaskRepository(3000)
+    )
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.mark.unit
+async def test_export_streams_ndjson(client: AsyncClient) -> None:
+    """Test NDJSON exports hold one task per line."""
+    response = await client.get("/api/v1/tasks/export?fields=name,parameters")
+
+    lines = response.text.splitlines()
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    assert len(lines) == 3000
+    assert set(json.loads(lines[-1])) == {"id", "name", "parameters"}
+    assert json.loads(lines[-1])["parameters"] == {"index": 2999}
+
+
+@pytest.mark.unit
+async def test_export_streams_csv(client: AsyncClient) -> None:
+    """Test CSV exports start with a header and render enums and JSON."""
+    response = await client.get("/api/v1/tasks/export?format=csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert response.headers["Content-Type"].startswith("text/csv")
+    assert "tasks.csv" in response.headers["Content-Disposition"]
+    assert len(rows) == 3000
+    assert rows[0]["status"] == "pending"
+    assert rows[0]["result"] == ""
+    assert json.loads(rows[7]["parameters"]) == {"index": 7}
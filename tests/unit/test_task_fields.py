@@ -0,0 +1,46 @@
+"""Tests for sparse task fieldsets."""
+
+from uuid import uuid4
+
+import pytest
+
+from app.application.dto.task_dto import TaskResponseDTO
+from app.domain.entities.task import Task
+from app.domain.exceptions.domain_exceptions import InvalidFieldsError
+from app.domain.value_objects.task_status import TaskType
+from app.infrastructure.database.repositories.task_repository import TaskRepository
+
+
+@pytest.mark.unit
+def test_parse_fields_validates_and_adds_id() -> None:
+    """Test fieldsets are parsed, validated and always carry the id."""
+    assert TaskResponseDTO.parse_fields(None) is None
+    assert TaskResponseDTO.parse_fields(" name, status ,") == {"id", "name", "status"}
+    with pytest.raises(InvalidFieldsError, match="hashed_password"):
+        TaskResponseDTO.parse_fields("name,hashed_password")
+
+
+@pytest.mark.unit
+def test_project_emits_only_requested_keys() -> None:
+    """Test projections keep schema order and drop other fields."""
+    task = Task(
+        name="task",
+        task_type=TaskType.DATA_PROCESSING,
+        user_id=uuid4(),
+        result={"rows": list(range(1000))},
+    )
+
+    projected = TaskResponseDTO.project(task, frozenset({"status", "id", "name"}))
+
+    assert list(projected) == ["id", "name", "status"]
+
+
+@pytest.mark.unit
+def test_select_leaves_deferred_columns_out_of_sql() -> None:
+    """Test the projection is pushed into the SELECT list."""
+    sql = str(TaskRepository(None)._select(frozenset({"id", "name", "status"})))
+    columns = sql.split("FROM")[0]
+
+    assert "tasks.name" in columns and "tasks.status" in columns
+    assert "tasks.parameters" not in columns
+    assert "tasks.result" not in columns
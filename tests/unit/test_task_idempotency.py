@@ -0,0 +1,114 @@
+"""Tests for idempotent task creation."""
+
+import asyncio
+import json
+from typing import Dict, List, Optional
+from uuid import uuid4
+
+import pytest
+
+from app.application.dto.task_dto import TaskCreateDTO
+from app.application.services.task_service import TaskService
+from app.domain.entities.task import Task
+from app.domain.exceptions.domain_exceptions import IdempotencyKeyConflictError
+from app.domain.value_objects.task_status import TaskType
+from app.infrastructure.cache.idempotency_store import IdempotencyStore
+
+
+class FakeRedis:
+    """The subset of the Redis client the idempotency store uses."""
+
+    def __init__(self) -> None:
+        """Initialize fake client."""
+        self.data: Dict[str, str] = {}
+
+    async def set(self, key: str, value: str, nx: bool = False, ex=None) -> bool:
+        """Set a key, only if absent with ``nx``."""
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a key."""
+        return self.data.get(key)
+
+    def register_script(self, script: str):
+        """Register the release script."""
+
+        async def release(keys: List[str], args: List[str]) -> int:
+            current = self.data.get(keys[0])
+            if current and json.loads(current)["token"] == args[0]:
+                del self.data[keys[0]]
+                return 1
+            return 0
+
+        return release
+
+
+class SlowTaskRepository:
+    """Task repository whose inserts take a while."""
+
+    def __init__(self, fail: bool = False) -> None:
+        """Initialize fake repository."""
+        self.fail = fail
+        self.created: List[Task] = []
+
+    async def create(self, task: Task) -> Task:
+        """Create a task."""
+        await asyncio.sleep(0.1)
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.created.append(task)
+        return task
+
+
+def _service(repository: SlowTaskRepository, redis: FakeRedis) -> TaskService:
+    """Build a service with an idempotency store on the fake client."""
+    store = IdempotencyStore()
+    store._client = redis
+    service = TaskService(repository, idempotency_store=store)
+    service._queue_task = lambda task_id, task_type: None
+    return service
+
+
+@pytest.mark.unit
+async def test_concurrent_duplicates_wait_and_replay() -> None:
+    """Test duplicates of an in-flight request replay its response."""
+    user_id = uuid4()
+    repository = SlowTaskRepository()
+    service = _service(repository, FakeRedis())
+    task_data = TaskCreateDTO(name="report", task_type=TaskType.REPORT_GENERATION)
+
+    results = await asyncio.gather(
+        *(service.create_task_idempotent(user_id, task_data, "key-1") for _ in range(3))
+    )
+
+    assert len(repository.created) == 1
+    assert {task.id for task, _ in results} == {repository.created[0].id}
+    assert sorted(replayed for _, replayed in results) == [False, True, True]
+
+    with pytest.raises(IdempotencyKeyConflictError):
+        await service.create_task_idempotent(
+            user_id, task_data.model_copy(update={"name": "other"}), "key-1"
+        )
+
+
+@pytest.mark.unit
+async def test_failed_request_releases_its_key() -> None:
+    """Test a retry after a failure runs instead of waiting or replaying."""
+    redis = FakeRedis()
+    task_data = TaskCreateDTO(name="report", task_type=TaskType.REPORT_GENERATION)
+    user_id = uuid4()
+
+    with pytest.raises(RuntimeError):
+        await _service(SlowTaskRepository(fail=True), redis).create_task_idempotent(
+            user_id, task_data, "key-2"
+        )
+    assert redis.data == {}
+
+    repository = SlowTaskRepository()
+    _, replayed = await _service(repository, redis).create_task_idempotent(
+        user_id, task_data, "key-2"
+    )
+    assert not replayed and len(repository.created) == 1
@@ -0,0 +1,212 @@
+"""Tests for bulk task import."""
+
+import json
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.api.v1.routes import tasks
+from app.api.v1.routes.auth import get_current_user
+from app.application.dto.task_dto import (
+    TaskFileFormat,
+    TaskImportJobDTO,
+    TaskImportStatus,
+)
+from app.application.services.task_service import TaskService
+from app.dependencies import get_task_service
+from app.domain.entities.task import Task
+from app.domain.entities.user import User
+from app.domain.value_objects.task_status import TaskPriority, TaskType
+
+USER = User(email="user@example.com", username="user", hashed_password="x")
+
+
+class CopyTaskRepository:
+    """Task repository recording COPY loads."""
+
+    def __init__(self) -> None:
+        """Initialize fake repository."""
+        self.loads: List[List[Task]] = []
+
+    async def copy_many(self, tasks: List[Task]) -> int:
+        """Record a bulk load."""
+        self.loads.append(tasks)
+        return len(tasks)
+
+    async def get_many(
+        self, task_ids: Sequence[UUID], user_id: Optional[UUID] = None
+    ) -> List[Task]:
+        """Get loaded tasks by ID."""
+        loaded = {task.id: task for load in self.loads for task in load}
+        return [loaded[task_id] for task_id in task_ids if task_id in loaded]
+
+
+class InMemoryJobStore:
+    """Task import job store keeping jobs in a dict."""
+
+    def __init__(self) -> None:
+        """Initialize fake store."""
+        self.jobs: Dict[UUID, TaskImportJobDTO] = {}
+
+    async def get(self, job_id: UUID) -> Optional[TaskImportJobDTO]:
+        """Get a job."""
+        job = self.jobs.get(job_id)
+        return job.model_copy(deep=True) if job else None
+
+    async def save(self, job: TaskImportJobDTO) -> None:
+        """Save a job."""
+        self.jobs[job.id] = job.model_copy(deep=True)
+
+    async def list_active(self) -> List[TaskImportJobDTO]:
+        """List unfinished jobs."""
+        return [
+            job.model_copy(deep=True)
+            for job in self.jobs.values()
+            if job.status in (TaskImportStatus.PENDING, TaskImportStatus.RUNNING)
+        ]
+
+
+def _service(repository: CopyTaskRepository, store: InMemoryJobStore) -> TaskService:
+    """Build a service recording queued tasks instead of sending them."""
+    service = TaskService(repository, task_import_store=store)
+    service.queued = []
+    service._queue_tasks = service.queued.extend
+    return service
+
+
+@pytest.mark.unit
+async def test_import_ndjson_in_chunks(tmp_path, monkeypatch) -> None:
+    """Test valid NDJSON rows are copied and queued chunk by chunk."""
+    monkeypatch.setattr(tasks.settings, "task_import_chunk_size", 2)
+    path = tmp_path / "tasks.ndjson"
+    lines = [
+        json.dumps({"name": "a", "task_type": "email"}),
+        json.dumps({"name": "b", "task_type": "unknown"}),
+        "",
+        "not json",
+        json.dumps({"name": "c", "task_type": "email", "parameters": {"x": 1}}),
+        json.dumps({"name": "d", "task_type": "report_generation"}),
+    ]
+    path.write_text("\n".join(lines) + "\n")
+    repository, store = CopyTaskRepository(), InMemoryJobStore()
+    service = _service(repository, store)
+    job = TaskImportJobDTO(user_id=USER.id, format=TaskFileFormat.NDJSON)
+
+    await service.run_import(job, str(path))
+
+    saved = await service.get_import_job(job.id, USER.id)
+    assert saved.status == TaskImportStatus.COMPLETED
+    assert (saved.processed, saved.imported, saved.failed) == (5, 3, 2)
+    assert [error.line for error in saved.errors] == [2, 4]
+    assert "task_type" in saved.errors[0].error
+    assert [len(load) for load in repository.loads] == [1, 1, 1]
+    assert [task.name for task in service.queued] == ["a", "c", "d"]
+    assert service.queued[1].parameters == {"x": 1}
+
+
+@pytest.mark.unit
+async def test_import_csv_uses_defaults_for_empty_cells(tmp_path) -> None:
+    """Test CSV cells are parsed like exports, with empty cells left out."""
+    path = tmp_path / "tasks.csv"
+    path.write_text(
+        "name,task_type,priority,parameters,max_retries\n"
+        'a,email,,"{""to"": ""x@example.com""}",\n'
+        "b,email,high,,5\n"
+        "c,email,,{broken,\n"
+    )
+    repository = CopyTaskRepository()
+    service = _service(repository, InMemoryJobStore())
+    job = TaskImportJobDTO(user_id=USER.id, format=TaskFileFormat.CSV)
+
+    job = await service.run_import(job, str(path))
+
+    first, second = repository.loads[0]
+    assert first.priority == TaskPriority.MEDIUM
+    assert first.parameters == {"to": "x@example.com"}
+    assert (second.priority, second.max_retries) == (TaskPriority.HIGH, 5)
+    assert job.imported == 2 and job.errors[0].line == 4
+
+
+@pytest.mark.unit
+async def test_resumed_import_skips_rows_already_copied(tmp_path, monkeypatch) -> None:
+    """Test a redelivered job neither repeats saved chunks nor copies twice."""
+    monkeypatch.setattr(tasks.settings, "task_import_chunk_size", 2)
+    path = tmp_path / "tasks.ndjson"
+    path.write_text(
+        "\n".join(json.dumps({"name": name, "task_type": "email"}) for name in "abcd")
+    )
+    repository, store = CopyTaskRepository(), InMemoryJobStore()
+    job = TaskImportJobDTO(user_id=USER.id, format=TaskFileFormat.NDJSON)
+    await _service(repository, store).run_import(job, str(path))
+    repository.loads[1][0].start()
+    # The worker died after copying the second chunk but before saving the job
+    job.status, job.processed, job.imported = TaskImportStatus.RUNNING, 2, 2
+    service = _service(repository, store)
+
+    job = await service.run_import(job, str(path))
+
+    assert len(repository.loads) == 2
+    assert (job.processed, job.imported) == (4, 4)
+    assert [task.name for task in service.queued] == ["d"]
+
+
+@pytest.mark.unit
+async def test_worker_start_fails_stale_running_jobs(tmp_path, monkeypatch) -> None:
+    """Test jobs left running by a dead worker are failed and cleaned up."""
+    monkeypatch.setattr(tasks.settings, "task_import_spool_path", str(tmp_path))
+    store = InMemoryJobStore()
+    service = _service(CopyTaskRepository(), store)
+    stale, live = (
+        TaskImportJobDTO(
+            user_id=USER.id,
+            format=TaskFileFormat.NDJSON,
+            status=TaskImportStatus.RUNNING,
+            updated_at=datetime.utcnow() - timedelta(seconds=age),
+        )
+        for age in (3600, 1)
+    )
+    for job in (stale, live):
+        await store.save(job)
+        (tmp_path / str(job.id)).write_text("")
+
+    assert await service.fail_stale_imports() == 1
+    await service.run_import_job(stale.id)
+
+    assert store.jobs[stale.id].status == TaskImportStatus.FAILED
+    assert store.jobs[live.id].status == TaskImportStatus.RUNNING
+    assert sorted(path.name for path in tmp_path.iterdir()) == [str(live.id)]
+
+
+@pytest.mark.unit
+async def test_import_route_spools_upload_and_queues_job(tmp_path, monkeypatch) -> None:
+    """Test uploads are spooled for a worker and only their owner sees the job."""
+    monkeypatch.setattr(tasks.settings, "task_import_spool_path", str(tmp_path))
+    queued: List[UUID] = []
+    store = InMemoryJobStore()
+    repository = CopyTaskRepository()
+    service = _service(repository, store)
+    service._queue_import = queued.append
+    app = FastAPI()
+    app.include_router(tasks.router, prefix="/api/v1")
+    app.dependency_overrides[get_current_user] = lambda: USER
+    app.dependency_overrides[get_task_service] = lambda: service
+    body = json.dumps({"name": "a", "task_type": TaskType.EMAIL.value})
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/tasks/imports", files={"file": ("tasks.ndjson", body)}
+        )
+        job_id = UUID(response.json()["id"])
+        store.jobs[job_id].user_id = uuid4()
+        hidden = await client.get(f"/api/v1/tasks/imports/{job_id}")
+
+    assert response.status_code == 202
+    assert response.json()["format"] == "ndjson"
+    assert queued == [job_id]
+    assert (tmp_path / str(job_id)).read_text() == body
+    assert store.jobs[job_id].status == TaskImportStatus.PENDING
+    assert hidden.status_code == 404
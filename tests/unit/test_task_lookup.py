@@ -0,0 +1,72 @@
+"""Tests for task lookup by ID."""
+
+from typing import List, Sequence
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.api.v1.routes import tasks
+from app.api.v1.routes.auth import get_current_user
+from app.application.services.task_service import TaskService
+from app.dependencies import get_task_service
+from app.domain.entities.task import Task
+from app.domain.entities.user import User
+from app.domain.value_objects.task_status import TaskType
+
+USER = User(email="user@example.com", username="user", hashed_password="x")
+
+
+class InMemoryTaskRepository:
+    """Task repository over a list, recording lookups."""
+
+    def __init__(self, tasks: List[Task]) -> None:
+        """Initialize fake repository."""
+        self.tasks = tasks
+        self.lookups: List[List[UUID]] = []
+
+    async def get_many(
+        self, task_ids: Sequence[UUID], user_id: UUID, fields=None
+    ) -> List[Task]:
+        """Get the user's tasks among the IDs."""
+        self.lookups.append(list(task_ids))
+        return [
+            task
+            for task in self.tasks
+            if task.id in task_ids and task.user_id == user_id
+        ]
+
+
+@pytest.mark.unit
+async def test_lookup_reports_each_id_from_one_query() -> None:
+    """Test found, foreign, missing and malformed IDs in one lookup."""
+    own, foreign = (
+        Task(name="task", task_type=TaskType.DATA_PROCESSING, user_id=user_id)
+        for user_id in (USER.id, uuid4())
+    )
+    repository = InMemoryTaskRepository([own, foreign])
+    app = FastAPI()
+    app.include_router(tasks.router, prefix="/api/v1")
+    app.dependency_overrides[get_current_user] = lambda: USER
+    app.dependency_overrides[get_task_service] = lambda: TaskService(repository)
+    ids = [str(own.id), str(foreign.id), str(uuid4()), "nope", str(own.id)]
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/tasks/lookup?fields=status", json={"ids": ids}
+        )
+
+    body = response.json()
+    assert response.status_code == 200
+    assert [item["id"] for item in body["items"]] == ids
+    assert [item["error"] for item in body["items"]] == [
+        None,
+        "not_found",
+        "not_found",
+        "invalid_id",
+        None,
+    ]
+    assert body["items"][0]["task"] == {"id": str(own.id), "status": "pending"}
+    assert (body["found"], body["missing"]) == (2, 3)
+    assert len(repository.lookups) == 1 and len(repository.lookups[0]) == 3
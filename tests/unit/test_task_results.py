@@ -0,0 +1,75 @@
+"""Tests for offloaded task results."""
+
+from typing import Optional
+from uuid import UUID
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.api.v1.routes import tasks
+from app.api.v1.routes.auth import get_current_user
+from app.application.services.task_service import TaskService
+from app.dependencies import get_result_blob_store, get_task_service
+from app.domain.entities.task import Task
+from app.domain.entities.user import User
+from app.domain.value_objects.task_status import TaskType
+from app.infrastructure.queue import task_handlers
+from app.infrastructure.storage.result_store import ResultBlobStore
+
+USER = User(email="user@example.com", username="user", hashed_password="x")
+RESULT = {"rows": [{"index": i, "value": "x" * 10} for i in range(200)]}
+
+
+class InMemoryTaskRepository:
+    """Task repository holding one task."""
+
+    def __init__(self, task: Task) -> None:
+        """Initialize fake repository."""
+        self.task = task
+
+    async def get_by_id(self, task_id: UUID, fields=None) -> Optional[Task]:
+        """Get task by ID."""
+        return self.task if task_id == self.task.id else None
+
+
+@pytest.mark.unit
+async def test_large_result_is_offloaded_and_served_by_range(
+    tmp_path, monkeypatch
+) -> None:
+    """Test results over the threshold move to the blob store and stream back."""
+    store = ResultBlobStore(str(tmp_path), chunk_size=100)
+    monkeypatch.setattr(task_handlers, "result_blob_store", store)
+    monkeypatch.setattr(task_handlers.settings, "result_offload_threshold", 1024)
+    task = Task(name="report", task_type=TaskType.REPORT_GENERATION, user_id=USER.id)
+    task.complete(RESULT)
+
+    await task_handlers.offload_result(task)
+
+    payload = orjson.dumps(RESULT)
+    assert task.result is None
+    assert task.result_size == len(payload)
+    assert task.result_ref.startswith("sha256:")
+
+    app = FastAPI()
+    app.include_router(tasks.router, prefix="/api/v1")
+    app.dependency_overrides[get_current_user] = lambda: USER
+    app.dependency_overrides[get_task_service] = lambda: TaskService(
+        InMemoryTaskRepository(task)
+    )
+    app.dependency_overrides[get_result_blob_store] = lambda: store
+    url = f"/api/v1/tasks/{task.id}/result"
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        full = await client.get(url)
+        part = await client.get(url, headers={"Range": "bytes=150-349"})
+        suffix = await client.get(url, headers={"Range": "bytes=-10"})
+        beyond = await client.get(url, headers={"Range": f"bytes={len(payload)}-"})
+
+    assert full.status_code == 200 and full.content == payload
+    assert full.headers["ETag"] == f'"{task.result_ref}"'
+    assert part.status_code == 206 and part.content == payload[150:350]
+    assert part.headers["Content-Range"] == f"bytes 150-349/{len(payload)}"
+    assert suffix.content == payload[-10:]
+    assert beyond.status_code == 416
@@ -0,0 +1,88 @@
+"""Tests for task reads through the live status store."""
+
+from typing import Dict, List, Optional
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.application.services.task_service import TaskService
+from app.domain.entities.task import Task
+from app.domain.value_objects.task_status import TaskStatus, TaskType
+
+
+class FakeTaskStatusStore:
+    """In-memory stand-in for the Redis status store."""
+
+    def __init__(self) -> None:
+        """Initialize fake store."""
+        self.tasks: Dict[UUID, Task] = {}
+
+    async def get(self, task_id: UUID) -> Optional[Task]:
+        """Get a task snapshot."""
+        return self.tasks.get(task_id)
+
+    async def set_many(self, tasks: List[Task]) -> None:
+        """Write task snapshots."""
+        self.tasks.update({task.id: task for task in tasks})
+
+    async def invalidate(self, task_id: UUID) -> None:
+        """Drop a task snapshot."""
+        self.tasks.pop(task_id, None)
+
+
+class FakeTaskRepository:
+    """Task repository over a dict, counting reads."""
+
+    def __init__(self, tasks: List[Task]) -> None:
+        """Initialize fake repository."""
+        self.tasks = {task.id: task for task in tasks}
+        self.reads = 0
+
+    async def get_by_id(
+        self, task_id: UUID, fields=None, for_update: bool = False
+    ) -> Optional[Task]:
+        """Get task by ID."""
+        self.reads += 1
+        return self.tasks.get(task_id)
+
+    async def delete(self, task_id: UUID) -> bool:
+        """Delete task."""
+        return self.tasks.pop(task_id, None) is not None
+
+
+def _task(user_id: UUID) -> Task:
+    """Build a task."""
+    return Task(name="task", task_type=TaskType.DATA_PROCESSING, user_id=user_id)
+
+
+@pytest.mark.unit
+async def test_detail_prefers_live_status_and_falls_back_to_postgres() -> None:
+    """Test stored snapshots are served without touching the repository."""
+    user_id = uuid4()
+    stored, unstored = _task(user_id), _task(user_id)
+    repository = FakeTaskRepository([stored, unstored])
+    store = FakeTaskStatusStore()
+    live = stored.model_copy(update={"status": TaskStatus.RUNNING})
+    await store.set_many([live])
+    service = TaskService(repository, task_status_store=store)
+
+    assert (await service.get_task_by_id(stored.id, user_id)).status == (
+        TaskStatus.RUNNING
+    )
+    assert repository.reads == 0
+
+    assert (await service.get_task_by_id(unstored.id, user_id)).id == unstored.id
+    assert repository.reads == 1
+
+
+@pytest.mark.unit
+async def test_delete_drops_live_status() -> None:
+    """Test deleted tasks are not served from the store afterwards."""
+    user_id = uuid4()
+    task = _task(user_id)
+    store = FakeTaskStatusStore()
+    await store.set_many([task])
+    service = TaskService(FakeTaskRepository([task]), task_status_store=store)
+
+    assert await service.delete_task(task.id, user_id)
+    assert await store.get(task.id) is None
@@ -0,0 +1,161 @@
+"""Tests for long-polling a task until it finishes."""
+
+import asyncio
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.api.v1.routes import tasks
+from app.api.v1.routes.auth import get_current_user
+from app.application.dto.task_dto import TaskEventDTO
+from app.application.services.task_service import TaskService
+from app.dependencies import get_task_service
+from app.domain.entities.task import Task
+from app.domain.entities.user import User
+from app.domain.value_objects.task_status import TaskStatus, TaskType
+from app.infrastructure.events.task_events import TaskEventBroker
+
+USER = User(email="user@example.com", username="user", hashed_password="x")
+
+
+class SingleTaskRepository:
+    """Task repository holding one task, counting reads."""
+
+    def __init__(self) -> None:
+        """Create a pending task."""
+        self.task = Task(name="report", task_type=TaskType.EMAIL, user_id=USER.id)
+        self.reads = 0
+        self.released = False
+
+    async def get_by_id(self, task_id: UUID, fields=None) -> Optional[Task]:
+        """Get the task."""
+        self.reads += 1
+        return self.task.model_copy() if task_id == self.task.id else None
+
+    async def get_version(self, task_id: UUID):
+        """Get the task's owner and last update time."""
+        return self.task.user_id, self.task.updated_at
+
+    async def release_connection(self) -> None:
+        """Record that the connection was released."""
+        self.released = True
+
+
+@pytest.fixture
+def repository() -> SingleTaskRepository:
+    """Create the repository."""
+    return SingleTaskRepository()
+
+
+@pytest.fixture
+def broker(monkeypatch: pytest.MonkeyPatch) -> TaskEventBroker:
+    """Create a broker that does not connect to Redis."""
+    broker = TaskEventBroker()
+    monkeypatch.setattr(broker, "_ensure_listening", lambda: None)
+    return broker
+
+
+@pytest.fixture
+def service(repository: SingleTaskRepository, broker: TaskEventBroker) -> TaskService:
+    """Create a task service listening to the broker."""
+    return TaskService(repository, task_event_broker=broker)
+
+
+def _publish(broker: TaskEventBroker, task: Task) -> None:
+    """Deliver a task's status event as the listener would."""
+    broker._dispatch(
+        TaskEventDTO(
+            task_id=task.id,
+            user_id=task.user_id,
+            status=task.status,
+            started_at=task.started_at,
+            completed_at=task.completed_at,
+            updated_at=task.updated_at,
+        ).model_dump_json()
+    )
+
+
+@pytest.mark.unit
+async def test_terminal_event_wakes_the_waiter(
+    service: TaskService, repository: SingleTaskRepository, broker: TaskEventBroker
+) -> None:
+    """Test a finished task is returned as soon as its event arrives."""
+    task = repository.task
+    waiter = asyncio.create_task(service.wait_for_task(task.id, USER.id, timeout=5))
+    await asyncio.sleep(0)
+
+    task.start()
+    _publish(broker, task)
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    task.complete({"pages": 3})
+    _publish(broker, task)
+    result = await asyncio.wait_for(waiter, timeout=1)
+
+    assert result.status == TaskStatus.COMPLETED
+    assert result.result == {"pages": 3}
+    assert repository.reads == 2
+    assert repository.released
+    assert broker._task_watchers == {}
+
+
+@pytest.mark.unit
+async def test_wait_times_out_with_the_latest_known_state(
+    service: TaskService, repository: SingleTaskRepository, broker: TaskEventBroker
+) -> None:
+    """Test a timeout returns the task as last seen, without another read."""
+    task = repository.task
+    waiter = asyncio.create_task(service.wait_for_task(task.id, USER.id, timeout=0.05))
+    await asyncio.sleep(0)
+    task.start()
+    _publish(broker, task)
+
+    result = await waiter
+
+    assert result.status == TaskStatus.RUNNING
+    assert result.updated_at == task.updated_at
+    assert repository.reads == 1
+
+
+@pytest.mark.unit
+async def test_finished_task_returns_without_waiting(
+    service: TaskService, repository: SingleTaskRepository
+) -> None:
+    """Test an already terminal task is returned at once."""
+    repository.task.fail("boom")
+
+    result = await asyncio.wait_for(
+        service.wait_for_task(repository.task.id, USER.id, timeout=5), timeout=1
+    )
+
+    assert result.status == TaskStatus.FAILED
+    assert repository.reads == 1
+
+
+@pytest.mark.unit
+async def test_unchanged_task_after_wait_is_not_modified(
+    service: TaskService, repository: SingleTaskRepository
+) -> None:
+    """Test a long-poll with a matching ETag gets 304 if nothing changed."""
+    app = FastAPI()
+    app.include_router(tasks.router, prefix="/api/v1")
+    app.dependency_overrides[get_current_user] = lambda: USER
+    app.dependency_overrides[get_task_service] = lambda: service
+    url = f"/api/v1/tasks/{repository.task.id}"
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        etag = (await client.get(url)).headers["ETag"]
+        unchanged = await client.get(
+            f"{url}?wait=0.05", headers={"If-None-Match": etag}
+        )
+        repository.task.updated_at = datetime.utcnow()
+        changed = await client.get(f"{url}?wait=0.05", headers={"If-None-Match": etag})
+
+    assert unchanged.status_code == 304
+    assert unchanged.headers["ETag"] == etag
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag